@@ -0,0 +1,47 @@
+"""
+AuditLog.verify_log_integrity cost: full re-hash vs. checkpointed tail.
+
+Usage:
+    python benchmarks/bench_audit_verify.py [--entries 200000] [--interval 1000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from coc_framework.core.audit_log import AuditLog
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    assert fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--interval", type=int, default=1000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = AuditLog(tmp, checkpoint_interval=args.interval)
+        for i in range(args.entries):
+            log.log_event("CONTENT_FORWARDED", f"peer-{i % 50}", f"node-{i}", "forwarded")
+
+        print(f"{args.entries:,} entries, {len(log.get_checkpoints()):,} checkpoints")
+        print(f"{'full, inline':<22} {_timed(lambda: log.verify_log_integrity(full=True, max_workers=1)):8.3f} s")
+        print(f"{'full, process pool':<22} {_timed(lambda: log.verify_log_integrity(full=True)):8.3f} s")
+        for _ in range(args.interval // 2):
+            log.log_event("CONTENT_ACCESSED", "peer-0", "node-0")
+        print(f"{'incremental (tail)':<22} {_timed(log.verify_log_integrity):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
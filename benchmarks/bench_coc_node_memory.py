@@ -0,0 +1,61 @@
+"""
+Resident size of CoCNode graphs held in InMemoryStorage.
+
+Nodes are rebuilt from their JSON form (as storage backends do on load), so
+signing cost is paid once and only the in-memory representation is measured.
+
+Usage:
+    python benchmarks/bench_coc_node_memory.py [--nodes 200000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_sqlite_storage import build_forward_chain
+from coc_framework.core.coc_node import CoCNode
+from coc_framework.interfaces.storage_backend import InMemoryStorage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"Building {args.nodes:,} signed forward nodes...")
+    rows = [json.dumps(node.to_dict()) for node, _ in build_forward_chain(args.nodes)]
+    gc.collect()
+
+    start = time.perf_counter()
+    storage = InMemoryStorage()
+    for row in rows:
+        storage.add_node(CoCNode.from_dict(json.loads(row)))
+    load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for node in storage.get_all_nodes():
+        node.to_dict()
+    dump = time.perf_counter() - start
+
+    del storage
+    gc.collect()
+    tracemalloc.start()
+    storage = InMemoryStorage()
+    for row in rows:
+        storage.add_node(CoCNode.from_dict(json.loads(row)))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{'resident':<12} {current / 2**20:10.1f} MB  ({current / args.nodes:,.0f} B/node)")
+    print(f"{'load':<12} {load / args.nodes * 1e6:10.2f} us/node")
+    print(f"{'to_dict':<12} {dump / args.nodes * 1e6:10.2f} us/node")
+
+
+if __name__ == "__main__":
+    main()
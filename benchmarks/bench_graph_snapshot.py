@@ -0,0 +1,79 @@
+"""
+Columnar graph snapshot: export size/time and cold-start trace latency.
+
+Compares reloading the graph from a JSON dump (as analysts do via /api/nodes)
+with opening a memory-mapped snapshot and running a trace from the root.
+
+Usage:
+    python benchmarks/bench_graph_snapshot.py [--nodes 100000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_sqlite_storage import build_forward_chain
+from coc_framework.core.coc_node import CoCNode
+from coc_framework.interfaces.graph_snapshot import GraphSnapshot, write_snapshot
+from coc_framework.interfaces.storage_backend import GraphStorage
+
+
+def _dir_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"Building {args.nodes:,} signed forward nodes...")
+    nodes = [node for node, _ in build_forward_chain(args.nodes)]
+    root_hash = nodes[0].node_hash
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "nodes.json")
+        snap_path = os.path.join(tmp, "graph.snap")
+
+        start = time.perf_counter()
+        with open(json_path, "w") as f:
+            json.dump([node.to_dict() for node in nodes], f)
+        json_export = time.perf_counter() - start
+
+        start = time.perf_counter()
+        write_snapshot(nodes, snap_path)
+        snap_export = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(json_path) as f:
+            storage = GraphStorage()
+            for data in json.load(f):
+                storage.add_node(CoCNode.from_dict(data))
+        json_open = time.perf_counter() - start
+        start = time.perf_counter()
+        json_trace = storage.subtree_size(root_hash)
+        json_trace_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        graph = GraphSnapshot(snap_path)
+        snap_open = time.perf_counter() - start
+        start = time.perf_counter()
+        snap_trace = graph.subtree_size(root_hash)
+        snap_trace_time = time.perf_counter() - start
+        graph.close()
+        assert snap_trace == json_trace == args.nodes
+
+        print(f"{'':<10} {'size':>10} {'export':>10} {'open':>10} {'trace':>10}")
+        print(f"{'json':<10} {os.path.getsize(json_path) / 2**20:8.1f}MB {json_export:9.2f}s "
+              f"{json_open:9.3f}s {json_trace_time:9.3f}s")
+        print(f"{'snapshot':<10} {_dir_size(snap_path) / 2**20:8.1f}MB {snap_export:9.2f}s "
+              f"{snap_open:9.3f}s {snap_trace_time:9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
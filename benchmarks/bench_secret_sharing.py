@@ -0,0 +1,120 @@
+"""
+Shamir split and reconstruction cost across share set sizes.
+
+pytest-benchmark suite over 2-of-3 .. 10-of-20 share sets (plus large share
+counts for split). The "per_chunk" and "power_sum" cases are the previous
+algorithms, kept as baselines: reconstruction rebuilding the Lagrange basis
+with a recursive extended-GCD inverse for every chunk, and share evaluation
+computing each term with pow(x, i, p) instead of Horner's rule. The
+"by_field" cases compare the prime-field and GF(256) schemes end to end,
+recording each share value's serialized size in extra_info.
+
+Usage:
+    python -m pytest benchmarks/bench_secret_sharing.py --benchmark-only [--benchmark-group-by=param:scheme]
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from coc_framework.core.secret_sharing import (
+    HYBRID_THRESHOLD_BYTES,
+    PRIME,
+    SHARE_SCHEMES,
+    _evaluate_share_values,
+    _random_field_elements,
+    _split_into_chunks,
+    reconstruct_secret,
+    split_secret,
+)
+
+SCHEMES = [(2, 3), (3, 5), (5, 8), (7, 12), (10, 20)]
+SPLIT_SCHEMES = SCHEMES + [(10, 200), (50, 1000)]
+# Largest direct-path payload: the chunk count is what the shared basis amortises.
+SECRET = "s" * HYBRID_THRESHOLD_BYTES
+
+
+def _egcd_inverse(a: int, p: int) -> int:
+    def extended_gcd(a, b):
+        if a == 0:
+            return b, 0, 1
+        gcd, x1, y1 = extended_gcd(b % a, a)
+        return gcd, y1 - (b // a) * x1, x1
+
+    _, x, _ = extended_gcd(a % p, p)
+    return (x % p + p) % p
+
+
+def _per_chunk_reconstruct(shares) -> bytes:
+    selected = shares[:shares[0].threshold]
+    chunks = []
+    for chunk_idx in range(len(selected[0].value.split("|"))):
+        points = [(s.index, int(s.value.split("|")[chunk_idx], 16)) for s in selected]
+        secret = 0
+        for i, (xi, yi) in enumerate(points):
+            numerator = denominator = 1
+            for j, (xj, _) in enumerate(points):
+                if i != j:
+                    numerator = numerator * -xj % PRIME
+                    denominator = denominator * (xi - xj) % PRIME
+            secret = (secret + yi * numerator * _egcd_inverse(denominator, PRIME)) % PRIME
+        chunks.append(secret.to_bytes(31, "big"))
+    length = int.from_bytes(chunks[0][:4], "big")
+    return b"".join(chunks[1:])[:length]
+
+
+@pytest.fixture(params=SCHEMES, ids=lambda s: f"{s[0]}-of-{s[1]}")
+def shares(request):
+    threshold, total = request.param
+    shares, _ = split_secret(SECRET, threshold, total)
+    return shares
+
+
+def test_reconstruct_shared_basis(benchmark, shares):
+    assert benchmark(reconstruct_secret, shares) == SECRET
+
+
+def test_reconstruct_per_chunk(benchmark, shares):
+    assert benchmark(_per_chunk_reconstruct, shares) == SECRET.encode()
+
+
+def _polynomials(threshold: int):
+    return [[int.from_bytes(chunk, "big")] + _random_field_elements(threshold - 1)
+            for chunk in _split_into_chunks(SECRET.encode())]
+
+
+def _power_sum_values(polynomials, num_shares: int):
+    columns = [[sum(c * pow(x, i, PRIME) for i, c in enumerate(coefficients)) % PRIME
+                for x in range(1, num_shares + 1)] for coefficients in polynomials]
+    return ["|".join(hex(column[i]) for column in columns) for i in range(num_shares)]
+
+
+@pytest.mark.parametrize("scheme", SPLIT_SCHEMES, ids=lambda s: f"{s[0]}-of-{s[1]}")
+def test_evaluate_horner(benchmark, scheme):
+    threshold, total = scheme
+    values = benchmark(_evaluate_share_values, _polynomials(threshold), range(1, total + 1), PRIME)
+    assert len(values) == total
+
+
+@pytest.mark.parametrize("scheme", SPLIT_SCHEMES, ids=lambda s: f"{s[0]}-of-{s[1]}")
+def test_evaluate_power_sum(benchmark, scheme):
+    threshold, total = scheme
+    assert len(benchmark(_power_sum_values, _polynomials(threshold), total)) == total
+
+
+@pytest.mark.parametrize("field", SHARE_SCHEMES)
+@pytest.mark.parametrize("scheme", SCHEMES + [(10, 200)], ids=lambda s: f"{s[0]}-of-{s[1]}")
+def test_split_by_field(benchmark, scheme, field):
+    shares, _ = benchmark(split_secret, SECRET, *scheme, max_workers=1, scheme=field)
+    benchmark.extra_info["share_value_bytes"] = len(shares[0].to_dict()["value"])
+    assert len(shares) == scheme[1]
+
+
+@pytest.mark.parametrize("field", SHARE_SCHEMES)
+@pytest.mark.parametrize("scheme", SCHEMES + [(10, 200)], ids=lambda s: f"{s[0]}-of-{s[1]}")
+def test_reconstruct_by_field(benchmark, scheme, field):
+    shares, hmac_key = split_secret(SECRET, *scheme, scheme=field)
+    assert benchmark(reconstruct_secret, shares, hmac_key) == SECRET
@@ -0,0 +1,135 @@
+"""
+SQLiteStorage on-disk size and read latency: JSON rows (schema v2) vs binary rows (v3).
+
+The v2 database is written with the legacy JSON layout, then opened with
+SQLiteStorage, which migrates it in place to the binary layout.
+
+Usage:
+    python benchmarks/bench_sqlite_encoding.py [--nodes 50000] [--reads 20000] [--repeats 3]
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_sqlite_storage import build_forward_chain
+from coc_framework.core.coc_node import CoCNode
+from coc_framework.interfaces.storage_backend import SQLiteStorage
+
+
+def write_v2(path: str, nodes) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE nodes (
+            node_hash TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            owner_id TEXT NOT NULL,
+            data TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+        CREATE INDEX idx_nodes_content_hash ON nodes(content_hash);
+        CREATE INDEX idx_nodes_owner_id ON nodes(owner_id);
+        CREATE TABLE schema_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+        INSERT INTO schema_meta VALUES ('version', '2');
+    """)
+    conn.executemany(
+        "INSERT INTO nodes VALUES (?, ?, ?, ?, ?)",
+        [(n.node_hash, n.content_hash, n.owner_id, json.dumps(n.to_dict()), n.timestamp)
+         for n in nodes],
+    )
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+
+
+def vacuum_size(path: str) -> int:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=DELETE")
+    conn.execute("VACUUM")
+    conn.close()
+    return os.path.getsize(path)
+
+
+def best_of(repeats: int, fn, keys) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for key in keys:
+            fn(key)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def read_v2(path: str, keys, repeats: int) -> float:
+    """Same query and decode as the v2 SQLiteStorage.get_node."""
+    conn = sqlite3.connect(path)
+
+    def get_node(key):
+        row = conn.execute("SELECT data FROM nodes WHERE node_hash = ?", (key,)).fetchone()
+        return CoCNode.from_dict(json.loads(row[0]))
+
+    def scan(_):
+        rows = conn.execute("SELECT data FROM nodes").fetchall()
+        return [CoCNode.from_dict(json.loads(row[0])) for row in rows]
+
+    elapsed = best_of(repeats, get_node, keys)
+    scan_elapsed = best_of(repeats, scan, [None])
+    conn.close()
+    return elapsed, scan_elapsed
+
+
+def read_v3(path: str, keys, repeats: int) -> float:
+    storage = SQLiteStorage(path)
+    elapsed = best_of(repeats, storage.get_node, keys)
+    scan_elapsed = best_of(repeats, lambda _: storage.get_all_nodes(), [None])
+    storage.close()
+    return elapsed, scan_elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--reads", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Building {args.nodes:,} signed forward nodes...")
+    nodes = [node for node, _ in build_forward_chain(args.nodes)]
+    keys = [random.choice(nodes).node_hash for _ in range(args.reads)]
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        write_v2(path, nodes)
+        v2_size = os.path.getsize(path)
+        v2_read, v2_scan = read_v2(path, keys, args.repeats)
+
+        start = time.perf_counter()
+        SQLiteStorage(path).close()
+        migrate = time.perf_counter() - start
+        v3_size = vacuum_size(path)
+        v3_read, v3_scan = read_v3(path, keys, args.repeats)
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    print(f"{'':<16} {'size':>12} {'get_node':>12} {'get_all_nodes':>14}")
+    for label, size, read, scan in (
+        ("v2 JSON", v2_size, v2_read, v2_scan),
+        ("v3 binary", v3_size, v3_read, v3_scan),
+    ):
+        print(f"{label:<16} {size / 2**20:10.1f}MB {read / args.reads * 1e6:10.1f}us {scan:13.2f}s")
+    print(f"\nMigration: {migrate:.2f}s; size {1 - v3_size / v2_size:.0%} smaller; "
+          f"get_node {v2_read / v3_read:.2f}x, get_all_nodes {v2_scan / v3_scan:.2f}x vs v2")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+SQLiteStorage write throughput on a forward scenario.
+
+Each forward stores the watermarked content and a child CoCNode, as
+Peer.forward_content does. Nodes are signed up front so only storage cost
+is timed.
+
+Usage:
+    python benchmarks/bench_sqlite_storage.py [--nodes 100000] [--skip-baseline]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from coc_framework.core.coc_node import CoCNode
+from coc_framework.core.crypto_core import CryptoCore
+from coc_framework.interfaces.storage_backend import SQLiteStorage
+
+
+def build_forward_chain(count: int, fanout: int = 4):
+    """Build a forward tree: each node forwards to ``fanout`` children."""
+    signing_key, _ = CryptoCore.generate_keypair()
+    root_content = "root document"
+    root = CoCNode(CryptoCore.hash_content(root_content), "peer-0", signing_key, ["peer-1"])
+    items = [(root, root_content)]
+    parent_index = 0
+    while len(items) < count:
+        parent = items[parent_index][0]
+        for _ in range(fanout):
+            if len(items) >= count:
+                break
+            i = len(items)
+            content = f"forwarded copy {i}"
+            child = CoCNode(
+                content_hash=CryptoCore.hash_content(content),
+                owner_id=f"peer-{i % 50}",
+                signing_key=signing_key,
+                recipient_ids=[f"peer-{(i + 1) % 50}"],
+                parent_hash=parent.node_hash,
+                depth=parent.depth + 1,
+            )
+            parent.add_child(child)
+            items.append((child, content))
+        parent_index += 1
+    return items
+
+
+def run(label: str, items, **storage_kwargs) -> float:
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        storage = SQLiteStorage(path, **storage_kwargs)
+        start = time.perf_counter()
+        for node, content in items:
+            storage.add_content(node.content_hash, content)
+            storage.add_node(node)
+        storage.close()
+        elapsed = time.perf_counter() - start
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+    ops = len(items) * 2 / elapsed
+    print(f"{label:<40} {elapsed:8.2f}s  {ops:12,.0f} ops/s")
+    return ops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--skip-baseline", action="store_true",
+        help="skip the rollback-journal/FULL-sync run (one fsync per write)",
+    )
+    args = parser.parse_args()
+
+    print(f"Building {args.nodes:,} signed forward nodes...")
+    items = build_forward_chain(args.nodes)
+
+    results = {}
+    if not args.skip_baseline:
+        results["baseline"] = run(
+            "commit per write, DELETE journal, FULL", items,
+            journal_mode="DELETE", synchronous="FULL",
+        )
+    results["wal"] = run("commit per write, WAL, NORMAL", items)
+    results["batched"] = run(
+        f"batch_size={args.batch_size}, WAL, NORMAL", items, batch_size=args.batch_size,
+    )
+
+    reference = results.get("baseline", results["wal"])
+    print(f"\nBatched speed-up vs {'baseline' if 'baseline' in results else 'WAL'}: "
+          f"{results['batched'] / reference:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,7 @@ from .core import (
     SignatureVerificationError,
     # Cryptography
     CryptoCore,
+    BatchVerifier,
     # Audit logging
     AuditLog,
     AuditLogger,
@@ -71,7 +72,10 @@ from .interfaces import (
     # Storage
     StorageBackend,
     InMemoryStorage,
+    GraphStorage,
     SQLiteStorage,
+    GraphSnapshot,
+    write_snapshot,
     # Notifications
     NotificationHandler,
     SilentNotificationHandler,
@@ -99,6 +103,7 @@ __all__ = [
     "CoCNode",
     "SignatureVerificationError",
     "CryptoCore",
+    "BatchVerifier",
     # Audit logging
     "AuditLog",
     "AuditLogger",
@@ -142,7 +147,10 @@ __all__ = [
     # Storage
     "StorageBackend",
     "InMemoryStorage",
+    "GraphStorage",
     "SQLiteStorage",
+    "GraphSnapshot",
+    "write_snapshot",
     # Notifications
     "NotificationHandler",
     "SilentNotificationHandler",
@@ -106,6 +106,11 @@ class AuditLogResponse(BaseModel):
     entries: List[AuditEntry]
     integrity_valid: bool
     total_entries: int
+    # Entry position to pass as ``cursor`` for the next page
+    next_cursor: int = 0
+    has_more: bool = False
+    # Entries covered by the cached verification behind integrity_valid
+    verified_entries: int = 0
 
 
 class LeakDetectionResponse(BaseModel):
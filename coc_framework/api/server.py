@@ -12,12 +12,13 @@ import os
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 from coc_framework.api.schemas import (
@@ -566,39 +567,59 @@ async def get_all_nodes():
 
 # ── Audit Log ────────────────────────────────────────────────────────────────
 
-@app.get("/api/audit", response_model=AuditLogResponse, tags=["Audit"])
-async def get_audit_log():
-    engine = _get_engine()
-    entries: List[AuditEntry] = []
+AUDIT_PAGE_SIZE = 100
+AUDIT_MAX_PAGE_SIZE = 1000
 
-    try:
-        with open(engine.audit_log.log_file, "r") as f:
-            lines = f.readlines()
-
-        for line in lines:
-            line = line.strip()
-            if line.startswith("#") or not line:
-                continue
-            parts = line.split(" | ")
-            if len(parts) >= 7:
-                entries.append(
-                    AuditEntry(
-                        event_type=parts[0],
-                        actor=parts[1],
-                        target=parts[2],
-                        timestamp=parts[3],
-                        details=parts[4],
-                        prev_hash=parts[5],
-                        entry_hash=parts[6],
-                    )
-                )
-    except FileNotFoundError:
-        pass
 
-    integrity = engine.audit_log.verify_log_integrity()
+@app.get("/api/audit", response_model=AuditLogResponse, tags=["Audit"])
+async def get_audit_log(
+    cursor: int = 0,
+    limit: int = AUDIT_PAGE_SIZE,
+    event_type: Optional[str] = None,
+    actor: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    stream: bool = False,
+):
+    """Page through the audit log from ``cursor`` (an entry position).
+
+    ``next_cursor`` resumes after the last entry scanned, so polling it
+    follows the log as it grows. ``stream=true`` sends every matching entry
+    from ``cursor`` on as NDJSON instead, ignoring ``limit``. Integrity comes
+    from the log's cached verification watermark.
+    """
+    audit_log = _get_engine().audit_log
+    if cursor < 0 or not 0 < limit <= AUDIT_MAX_PAGE_SIZE:
+        raise HTTPException(400, f"cursor must be >= 0 and limit in 1..{AUDIT_MAX_PAGE_SIZE}")
+
+    integrity, verified = await asyncio.to_thread(audit_log.integrity_status)
+    end = audit_log.total_entries
+    matches = audit_log.query_entries(
+        cursor, end, event_type=event_type, actor=actor, since=since, until=until
+    )
+
+    if stream:
+        return StreamingResponse(
+            (json.dumps(entry) + "\n" for _, entry in matches),
+            media_type="application/x-ndjson",
+            headers={
+                "X-Audit-Integrity-Valid": str(integrity).lower(),
+                "X-Audit-Verified-Entries": str(verified),
+            },
+        )
 
+    # One extra match tells whether another page exists without a false "more"
+    # when the last page is exactly full.
+    page = await asyncio.to_thread(lambda: list(islice(matches, limit + 1)))
+    has_more = len(page) > limit
+    page = page[:limit]
     return AuditLogResponse(
-        entries=entries, integrity_valid=integrity, total_entries=len(entries)
+        entries=[AuditEntry(**entry) for _, entry in page],
+        integrity_valid=integrity,
+        total_entries=end,
+        next_cursor=page[-1][0] + 1 if has_more else max(cursor, end),
+        has_more=has_more,
+        verified_entries=verified,
     )
 
 
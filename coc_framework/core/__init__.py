@@ -5,7 +5,8 @@ Core components for the Chain of Custody privacy framework.
 """
 
 from .coc_node import CoCNode, SignatureVerificationError
-from .crypto_core import CryptoCore
+from .crypto_core import CryptoCore, BatchVerifier
+from .signature_cache import SignatureCache, get_signature_cache
 from .audit_log import AuditLog
 from .deletion_engine import DeletionEngine
 from .network_sim import Peer, Network
@@ -18,6 +19,8 @@ try:
         AuditEventType,
         TamperEvidentLog,
         LogEntry,
+        Checkpoint,
+        MerkleLog,
     )
 except ImportError:
     AuditLogger = None
@@ -25,6 +28,8 @@ except ImportError:
     AuditEventType = None
     TamperEvidentLog = None
     LogEntry = None
+    Checkpoint = None
+    MerkleLog = None
 
 try:
     from .deletion_engine import DeletionToken, DeletionReceipt, DeletionTracker
@@ -40,9 +45,10 @@ except ImportError:
     Share = None
 
 try:
-    from .timelock import TimeLockEngine, EncryptedContent, TimeLockStatus
+    from .timelock import TimeLockEngine, AsyncTimeLockEngine, EncryptedContent, TimeLockStatus
 except ImportError:
     TimeLockEngine = None
+    AsyncTimeLockEngine = None
     EncryptedContent = None
     TimeLockStatus = None
 
@@ -107,6 +113,9 @@ __all__ = [
     "CoCNode",
     "SignatureVerificationError",
     "CryptoCore",
+    "BatchVerifier",
+    "SignatureCache",
+    "get_signature_cache",
     # Audit logging
     "AuditLog",
     "AuditLogger",
@@ -114,6 +123,8 @@ __all__ = [
     "AuditEventType",
     "TamperEvidentLog",
     "LogEntry",
+    "Checkpoint",
+    "MerkleLog",
     # Deletion
     "DeletionEngine",
     "DeletionToken",
@@ -127,6 +138,7 @@ __all__ = [
     "Share",
     # Timelock
     "TimeLockEngine",
+    "AsyncTimeLockEngine",
     "EncryptedContent",
     "TimeLockStatus",
     # Steganography
@@ -1,14 +1,43 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple
+import bisect
 import hashlib
 import json
 import os
+import re
+import struct
+import threading
+import time
 
+from .crypto_core import CryptoCore
 from .logging import audit_logger as get_audit_logger
 
 
+# AuditLog takes a checkpoint every this many entries once its chain is trusted.
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+# Full re-verification fans segments out to a process pool above this many entries.
+VERIFY_PARALLEL_THRESHOLD = 50_000
+# AuditLog starts a new segment file once the active one would exceed this size.
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+# Sidecar holding one little-endian uint64 start offset per entry of a segment.
+INDEX_SUFFIX = ".idx"
+_OFFSET = struct.Struct("<Q")
+# Field names of a parsed AuditLog line, in file order.
+AUDIT_ENTRY_FIELDS = ("event_type", "actor", "target", "timestamp", "details", "prev_hash", "entry_hash")
+# Free-text fields are written escaped so they can never contain the " | "
+# delimiter or end the line; the hash covers the escaped form.
+_FREE_TEXT_FIELDS = (0, 1, 2, 4)
+_FIELD_ESCAPES = str.maketrans({"\\": "\\\\", "|": "\\|", "\n": "\\n", "\r": "\\r"})
+_FIELD_UNESCAPE = re.compile(r"\\(.)")
+_UNESCAPED_CHARS = {"n": "\n", "r": "\r"}
+
+
 class AuditEventType(Enum):
     # Content lifecycle
     CONTENT_CREATED = "content_created"
@@ -94,11 +123,243 @@ class LogEntry:
         )
 
 
-class TamperEvidentLog:
-    """In-memory hash-chained log for tamper detection."""
+@dataclass
+class Checkpoint:
+    """Commitment that the chain up to and including entry ``index`` ends in ``entry_hash``.
+
+    ``offset`` is the logical position just past that entry across the
+    segment files (file logs only).
+    Checkpoints signed by the log writer can be trusted across processes.
+    """
+    index: int
+    entry_hash: str
+    timestamp: str
+    offset: int = 0
+    signature: str = ""
+
+    def _get_data_to_sign(self) -> str:
+        return f"{self.index}|{self.entry_hash}|{self.offset}|{self.timestamp}"
+
+    def sign(self, signing_key) -> None:
+        self.signature = CryptoCore.sign_message(signing_key, self._get_data_to_sign()).hex()
+
+    def verify(self, verify_key) -> bool:
+        if not self.signature:
+            return False
+        try:
+            return CryptoCore.verify_signature(verify_key, self._get_data_to_sign(), bytes.fromhex(self.signature))
+        except Exception:
+            return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "Checkpoint":
+        return Checkpoint(**data)
+
+
+def _entry_hash(data: Dict[str, Any], timestamp: str, prev_hash: str) -> str:
+    content_to_hash = json.dumps({
+        "data": data,
+        "timestamp": timestamp,
+        "prev_hash": prev_hash,
+    }, sort_keys=True)
+    return hashlib.sha256(content_to_hash.encode("utf-8")).hexdigest()
+
+
+def _verify_entry_segment(entries: List[Tuple[Dict[str, Any], str, str, str]], prev_hash: str) -> bool:
+    """Re-hash (data, timestamp, prev_hash, entry_hash) tuples chained from ``prev_hash``."""
+    for data, timestamp, entry_prev_hash, entry_hash in entries:
+        if entry_prev_hash != prev_hash or _entry_hash(data, timestamp, entry_prev_hash) != entry_hash:
+            return False
+        prev_hash = entry_hash
+    return True
+
+
+def _map_segments(fn, segments: List[tuple], max_workers: Optional[int]) -> List[Any]:
+    """Run ``fn(*segment)`` for each segment, across a process pool when there are several."""
+    if len(segments) > 1 and max_workers != 1:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(fn, *zip(*segments)))
+        except (OSError, BrokenProcessPool):
+            # Sandboxed hosts may forbid worker processes; fall back to inline.
+            pass
+    return [fn(*segment) for segment in segments]
+
+
+def _merkle_leaf(entry_hash: str) -> bytes:
+    return hashlib.sha256(b"\x00" + bytes.fromhex(entry_hash)).digest()
+
+
+def _merkle_node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _split_point(n: int) -> int:
+    """Largest power of two strictly below ``n`` (n >= 2)."""
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+class MerkleLog:
+    """Append-only Merkle accumulator over log entry hashes (RFC 6962 hashing).
+
+    Leaves are the chain's hex entry hashes. Every complete power-of-two
+    subtree is kept, so roots and proofs for any past size take O(log n)
+    hashes. Roots and proof elements are hex strings; the static
+    ``verify_*`` methods let auditors check them without the log.
+    """
 
     def __init__(self):
+        self._levels: List[List[bytes]] = [[]]
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    def append(self, entry_hash: str) -> int:
+        """Add a leaf and return its index."""
+        index = len(self._levels[0])
+        self._levels[0].append(_merkle_leaf(entry_hash))
+        level, i = 0, index
+        while i & 1:
+            if level + 1 == len(self._levels):
+                self._levels.append([])
+            nodes = self._levels[level]
+            self._levels[level + 1].append(_merkle_node(nodes[i - 1], nodes[i]))
+            level, i = level + 1, i >> 1
+        return index
+
+    def _hash(self, lo: int, hi: int) -> bytes:
+        n = hi - lo
+        if n & (n - 1) == 0:
+            return self._levels[n.bit_length() - 1][lo // n]
+        k = _split_point(n)
+        return _merkle_node(self._hash(lo, lo + k), self._hash(lo + k, hi))
+
+    def _check_size(self, size: Optional[int]) -> int:
+        if size is None:
+            size = len(self)
+        if not 0 < size <= len(self):
+            raise ValueError(f"Tree size {size} out of range (1..{len(self)})")
+        return size
+
+    def root(self, size: Optional[int] = None) -> str:
+        """Root of the first ``size`` leaves (default: all)."""
+        if size == 0 or not len(self):
+            return hashlib.sha256(b"").hexdigest()
+        return self._hash(0, self._check_size(size)).hex()
+
+    def leaf_hash(self, index: int) -> str:
+        return self._levels[0][index].hex()
+
+    def inclusion_proof(self, index: int, size: Optional[int] = None) -> List[str]:
+        """Audit path for leaf ``index`` in the tree of the first ``size`` leaves."""
+        size = self._check_size(size)
+        if not 0 <= index < size:
+            raise ValueError(f"Leaf index {index} out of range for size {size}")
+        path = []
+        lo, hi = 0, size
+        while hi - lo > 1:
+            k = _split_point(hi - lo)
+            if index < lo + k:
+                path.append(self._hash(lo + k, hi))
+                hi = lo + k
+            else:
+                path.append(self._hash(lo, lo + k))
+                lo += k
+        return [h.hex() for h in reversed(path)]
+
+    def consistency_proof(self, old_size: int, new_size: Optional[int] = None) -> List[str]:
+        """Proof that the tree of ``old_size`` leaves is a prefix of ``new_size``."""
+        new_size = self._check_size(new_size)
+        if not 0 < old_size <= new_size:
+            raise ValueError(f"Old size {old_size} out of range (1..{new_size})")
+        proof = []
+        lo, hi, m, complete = 0, new_size, old_size, True
+        while m != hi - lo:
+            k = _split_point(hi - lo)
+            if m <= k:
+                proof.append(self._hash(lo + k, hi))
+                hi = lo + k
+            else:
+                proof.append(self._hash(lo, lo + k))
+                lo, m, complete = lo + k, m - k, False
+        if not complete:
+            proof.append(self._hash(lo, hi))
+        return [h.hex() for h in reversed(proof)]
+
+    @staticmethod
+    def verify_inclusion(entry_hash: str, index: int, size: int, proof: List[str], root: str) -> bool:
+        """Check an inclusion proof for ``entry_hash`` at ``index`` against ``root``."""
+        if not 0 <= index < size:
+            return False
+        try:
+            node = _merkle_leaf(entry_hash)
+            fn, sn = index, size - 1
+            for sibling in proof:
+                sibling = bytes.fromhex(sibling)
+                if sn == 0:
+                    return False
+                if fn & 1 or fn == sn:
+                    node = _merkle_node(sibling, node)
+                    while not fn & 1 and fn != 0:
+                        fn, sn = fn >> 1, sn >> 1
+                else:
+                    node = _merkle_node(node, sibling)
+                fn, sn = fn >> 1, sn >> 1
+        except ValueError:
+            return False
+        return sn == 0 and node.hex() == root
+
+    @staticmethod
+    def verify_consistency(old_size: int, new_size: int, old_root: str, new_root: str, proof: List[str]) -> bool:
+        """Check that ``old_root`` (``old_size`` leaves) is a prefix of ``new_root``."""
+        if not 0 < old_size <= new_size:
+            return False
+        if old_size == new_size:
+            return not proof and old_root == new_root
+        try:
+            nodes = [bytes.fromhex(h) for h in proof]
+        except ValueError:
+            return False
+        if old_size & (old_size - 1) == 0:
+            nodes.insert(0, bytes.fromhex(old_root))
+        if not nodes:
+            return False
+        fn, sn = old_size - 1, new_size - 1
+        while fn & 1:
+            fn, sn = fn >> 1, sn >> 1
+        old_node = new_node = nodes[0]
+        for sibling in nodes[1:]:
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                old_node = _merkle_node(sibling, old_node)
+                new_node = _merkle_node(sibling, new_node)
+                while not fn & 1 and fn != 0:
+                    fn, sn = fn >> 1, sn >> 1
+            else:
+                new_node = _merkle_node(new_node, sibling)
+            fn, sn = fn >> 1, sn >> 1
+        return sn == 0 and old_node.hex() == old_root and new_node.hex() == new_root
+
+
+class TamperEvidentLog:
+    """In-memory hash-chained log for tamper detection.
+
+    With ``checkpoint_interval`` set, a checkpoint is taken every that many
+    appends and ``verify()`` only re-hashes entries after the latest one;
+    ``verify(full=True)`` re-checks everything, one segment per checkpoint.
+    Entry hashes are also accumulated in ``merkle`` for inclusion proofs.
+    """
+
+    def __init__(self, checkpoint_interval: int = 0, signing_key=None):
         self._entries: List[LogEntry] = []
+        self._merkle = MerkleLog()
+        self._checkpoints: List[Checkpoint] = []
+        self._checkpoint_interval = checkpoint_interval
+        self._signing_key = signing_key
 
     def __len__(self) -> int:
         return len(self._entries)
@@ -106,12 +367,7 @@ class TamperEvidentLog:
     def append(self, data: Dict[str, Any]) -> str:
         timestamp = datetime.now(timezone.utc).isoformat()
         prev_hash = self._entries[-1].entry_hash if self._entries else ""
-        content_to_hash = json.dumps({
-            "data": data,
-            "timestamp": timestamp,
-            "prev_hash": prev_hash,
-        }, sort_keys=True)
-        entry_hash = hashlib.sha256(content_to_hash.encode("utf-8")).hexdigest()
+        entry_hash = _entry_hash(data, timestamp, prev_hash)
         entry = LogEntry(
             data=data,
             timestamp=timestamp,
@@ -119,25 +375,69 @@ class TamperEvidentLog:
             entry_hash=entry_hash,
         )
         self._entries.append(entry)
+        self._merkle.append(entry_hash)
+        if self._checkpoint_interval and len(self._entries) % self._checkpoint_interval == 0:
+            self.checkpoint()
         return entry_hash
 
-    def verify(self) -> bool:
+    @property
+    def merkle(self) -> MerkleLog:
+        return self._merkle
+
+    def checkpoint(self) -> Optional[Checkpoint]:
+        """Commit to the current head. Returns None for an empty log."""
+        if not self._entries:
+            return None
+        if self._checkpoints and self._checkpoints[-1].index == len(self._entries) - 1:
+            return self._checkpoints[-1]
+        checkpoint = Checkpoint(
+            index=len(self._entries) - 1,
+            entry_hash=self._entries[-1].entry_hash,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+        )
+        if self._signing_key is not None:
+            checkpoint.sign(self._signing_key)
+        self._checkpoints.append(checkpoint)
+        return checkpoint
+
+    def get_checkpoints(self) -> List[Checkpoint]:
+        return list(self._checkpoints)
+
+    def _segment(self, start: int, end: int) -> List[Tuple[Dict[str, Any], str, str, str]]:
+        return [
+            (e.data, e.timestamp, e.prev_hash, e.entry_hash) for e in self._entries[start:end]
+        ]
+
+    def _checkpoint_holds(self, checkpoint: Checkpoint) -> bool:
+        return (
+            checkpoint.index < len(self._entries)
+            and self._entries[checkpoint.index].entry_hash == checkpoint.entry_hash
+        )
+
+    def verify(
+        self,
+        full: bool = False,
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = VERIFY_PARALLEL_THRESHOLD,
+    ) -> bool:
         if not self._entries:
             return True
-        prev_hash = ""
-        for entry in self._entries:
-            if entry.prev_hash != prev_hash:
-                return False
-            content_to_hash = json.dumps({
-                "data": entry.data,
-                "timestamp": entry.timestamp,
-                "prev_hash": entry.prev_hash,
-            }, sort_keys=True)
-            recalculated_hash = hashlib.sha256(content_to_hash.encode("utf-8")).hexdigest()
-            if recalculated_hash != entry.entry_hash:
+        if not full and self._checkpoints:
+            last = self._checkpoints[-1]
+            if not self._checkpoint_holds(last):
                 return False
-            prev_hash = entry.entry_hash
-        return True
+            return _verify_entry_segment(self._segment(last.index + 1, len(self._entries)), last.entry_hash)
+
+        if not all(self._checkpoint_holds(cp) for cp in self._checkpoints):
+            return False
+        bounds = [0] + [cp.index + 1 for cp in self._checkpoints] + [len(self._entries)]
+        segments = [
+            (self._segment(start, end), self._entries[start - 1].entry_hash if start else "")
+            for start, end in zip(bounds, bounds[1:])
+            if start < end
+        ]
+        workers = max_workers if len(self._entries) >= parallel_threshold else 1
+        return all(_map_segments(_verify_entry_segment, segments, workers))
 
     def get_entries(self) -> List[LogEntry]:
         return list(self._entries)
@@ -150,16 +450,39 @@ class TamperEvidentLog:
 
 
 class AuditLogger:
-    """High-level audit logger with filtering and export capabilities."""
+    """High-level audit logger with filtering and export capabilities.
 
-    def __init__(self):
-        self._log = TamperEvidentLog()
+    Events are indexed on append by type, actor and target, plus a sorted
+    timestamp index, so queries cost time proportional to their candidates
+    rather than to the whole log.
+    """
+
+    def __init__(self, checkpoint_interval: int = 0, signing_key=None):
+        self._log = TamperEvidentLog(checkpoint_interval=checkpoint_interval, signing_key=signing_key)
+        self._records: List[Dict[str, Any]] = []
+        self._by_type: Dict[str, List[int]] = {}
+        self._by_actor: Dict[str, List[int]] = {}
+        self._by_target: Dict[str, List[int]] = {}
+        # Parallel lists kept sorted by timestamp; appends in time order stay O(1).
+        self._ts_keys: List[str] = []
+        self._ts_positions: List[int] = []
 
     def __len__(self) -> int:
         return len(self._log)
 
     def log_event(self, event: AuditEvent) -> str:
-        return self._log.append(event.to_dict())
+        record = event.to_dict()
+        entry_hash = self._log.append(record)
+        position = len(self._records)
+        self._records.append(record)
+        self._by_type.setdefault(record["event_type"], []).append(position)
+        self._by_actor.setdefault(event.actor_id, []).append(position)
+        if event.target_id is not None:
+            self._by_target.setdefault(event.target_id, []).append(position)
+        i = bisect.bisect_right(self._ts_keys, event.timestamp)
+        self._ts_keys.insert(i, event.timestamp)
+        self._ts_positions.insert(i, position)
+        return entry_hash
 
     def log(
         self,
@@ -177,20 +500,94 @@ class AuditLogger:
         )
         return self.log_event(event)
 
+    def _candidates(
+        self,
+        event_type: Optional[AuditEventType],
+        actor_id: Optional[str],
+        target_id: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+    ) -> List[int]:
+        """Log positions matching every given predicate, in log order."""
+        lists = []
+        if event_type is not None:
+            lists.append(self._by_type.get(event_type.value, []))
+        if actor_id is not None:
+            lists.append(self._by_actor.get(actor_id, []))
+        if target_id is not None:
+            lists.append(self._by_target.get(target_id, []))
+        if start is not None or end is not None:
+            lo = 0 if start is None else bisect.bisect_left(self._ts_keys, start)
+            hi = len(self._ts_keys) if end is None else bisect.bisect_right(self._ts_keys, end)
+            in_range = self._ts_positions[lo:hi]
+            # Only the list that drives iteration below needs log order.
+            if not lists or len(in_range) < min(map(len, lists)):
+                in_range = sorted(in_range)
+            lists.append(in_range)
+        if not lists:
+            return list(range(len(self._records)))
+
+        lists.sort(key=len)
+        smallest, others = lists[0], lists[1:]
+        if not others:
+            return list(smallest)
+        if len(smallest) * 4 < min(len(o) for o in others):
+            # Check the few candidates directly instead of hashing the larger lists.
+            records = self._records
+            return [
+                p for p in smallest
+                if (event_type is None or records[p]["event_type"] == event_type.value)
+                and (actor_id is None or records[p]["actor_id"] == actor_id)
+                and (target_id is None or records[p]["target_id"] == target_id)
+                and (start is None or start <= records[p]["timestamp"])
+                and (end is None or records[p]["timestamp"] <= end)
+            ]
+        keep = set(smallest).intersection(*others)
+        return [p for p in smallest if p in keep]
+
+    def query(
+        self,
+        event_type: Optional[AuditEventType] = None,
+        actor_id: Optional[str] = None,
+        target_id: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[AuditEvent]:
+        """Events matching all given predicates, in log order.
+
+        ``start``/``end`` are inclusive ISO timestamps. ``offset`` and
+        ``limit`` page through the matches.
+        """
+        positions = self._candidates(event_type, actor_id, target_id, start, end)
+        stop = None if limit is None else offset + limit
+        return [AuditEvent.from_dict(self._records[p]) for p in positions[offset:stop]]
+
+    def count(
+        self,
+        event_type: Optional[AuditEventType] = None,
+        actor_id: Optional[str] = None,
+        target_id: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> int:
+        return len(self._candidates(event_type, actor_id, target_id, start, end))
+
     def get_all_events(self) -> List[AuditEvent]:
-        return [AuditEvent.from_dict(entry.data) for entry in self._log.get_entries()]
+        return [AuditEvent.from_dict(record) for record in self._records]
 
     def get_events_by_type(self, event_type: AuditEventType) -> List[AuditEvent]:
-        return [e for e in self.get_all_events() if e.event_type == event_type]
+        return self.query(event_type=event_type)
 
     def get_events_by_actor(self, actor_id: str) -> List[AuditEvent]:
-        return [e for e in self.get_all_events() if e.actor_id == actor_id]
+        return self.query(actor_id=actor_id)
 
     def get_events_for_target(self, target_id: str) -> List[AuditEvent]:
-        return [e for e in self.get_all_events() if e.target_id == target_id]
+        return self.query(target_id=target_id)
 
     def get_events_in_range(self, start: str, end: str) -> List[AuditEvent]:
-        return [e for e in self.get_all_events() if start <= e.timestamp <= end]
+        return self.query(start=start, end=end)
 
     def export_audit_trail(self, format: str = "json") -> str:
         entries = self._log.get_entries()
@@ -218,75 +615,630 @@ class AuditLogger:
         else:
             raise ValueError(f"Unsupported format: {format}")
 
-    def verify_integrity(self) -> bool:
-        return self._log.verify()
+    def verify_integrity(self, full: bool = False) -> bool:
+        return self._log.verify(full=full)
+
+def _verify_log_lines(lines: Iterable[bytes], prev_hash: str) -> Tuple[Optional[str], int, Optional[Dict[str, Any]]]:
+    """Check ``AuditLog`` lines chained from ``prev_hash``.
+
+    Returns (last_hash, entry_count, error); ``error`` is None when intact.
+    """
+    count = 0
+    for raw in lines:
+        if raw.startswith(b"#"):
+            continue
+        parts = raw.decode("utf-8").strip().split(" | ")
+        if len(parts) != 7:
+            continue
+        if parts[5] != prev_hash:
+            return prev_hash, count, {"reason": "Chain broken", "entry": count, "expected_hash": prev_hash, "found_hash": parts[5]}
+        recalculated_hash = hashlib.sha256(" | ".join(parts[:-1]).encode("utf-8")).hexdigest()
+        if recalculated_hash != parts[6]:
+            return prev_hash, count, {"reason": "Hash mismatch", "entry": count, "recalculated_hash": recalculated_hash, "stored_hash": parts[6]}
+        prev_hash = parts[6]
+        count += 1
+    return prev_hash, count, None
+
+
+def _escape_field(value: str) -> str:
+    return str(value).translate(_FIELD_ESCAPES)
+
+
+def _unescape_field(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _FIELD_UNESCAPE.sub(lambda m: _UNESCAPED_CHARS.get(m.group(1), m.group(1)), value)
+
+
+def _entry_dict(parts: List[str]) -> Dict[str, str]:
+    """Field dict for a parsed entry, with the free-text fields unescaped."""
+    entry = dict(zip(AUDIT_ENTRY_FIELDS, parts))
+    for i in _FREE_TEXT_FIELDS:
+        entry[AUDIT_ENTRY_FIELDS[i]] = _unescape_field(parts[i])
+    return entry
+
+
+def _parse_entry(raw: bytes) -> Optional[List[str]]:
+    """Split an ``AuditLog`` line into its seven fields, or None for headers and junk."""
+    if raw.startswith(b"#"):
+        return None
+    parts = raw.decode("utf-8").strip().split(" | ")
+    return parts if len(parts) == 7 else None
+
+
+def _entry_time(timestamp: str) -> Optional[datetime]:
+    try:
+        return _as_utc(datetime.fromisoformat(timestamp))
+    except ValueError:
+        return None
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Naive datetimes are taken to be UTC, like the log's own timestamps."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _segment_path(log_file: str, number: int) -> str:
+    return log_file if number == 0 else f"{log_file}.{number:06d}"
+
+
+def _iter_log_lines(segments: List[Tuple[str, int]], start: int = 0, end: Optional[int] = None):
+    """Stream (line, end position) pairs over the logical byte range [start, end).
+
+    ``segments`` lists each segment file with its logical base offset; the
+    last one is read to EOF when ``end`` is None.
+    """
+    for i, (path, base) in enumerate(segments):
+        if i + 1 < len(segments) and segments[i + 1][1] <= start:
+            continue
+        if end is not None and base >= end:
+            return
+        with open(path, "rb") as f:
+            position = max(start - base, 0)
+            f.seek(position)
+            position += base
+            for raw in f:
+                position += len(raw)
+                yield raw, position
+                if end is not None and position >= end:
+                    return
+
+
+def _scan_entry_offsets(path: str, start: int):
+    """Offsets of the complete entry lines in ``path`` from ``start`` on."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        position = start
+        for raw in f:
+            if raw.endswith(b"\n") and _parse_entry(raw) is not None:
+                yield position
+            position += len(raw)
+
+
+def _verify_log_segment(
+    segments: List[Tuple[str, int]],
+    start: int,
+    end: Optional[int],
+    prev_hash: str,
+    expected_hash: Optional[str],
+):
+    """Verify the logical bytes [start, end) of a segmented audit log; ``end=None`` reads to EOF."""
+    position = start
+
+    def lines():
+        nonlocal position
+        for raw, position in _iter_log_lines(segments, start, end):
+            yield raw
+
+    last_hash, count, error = _verify_log_lines(lines(), prev_hash)
+    if error is None and expected_hash is not None and last_hash != expected_hash:
+        error = {"reason": "Checkpoint mismatch", "entry": count, "expected_hash": expected_hash, "found_hash": last_hash}
+    return last_hash, count, error, position
+
 
 class AuditLog:
-    """File-based hash-chained audit log."""
+    """File-based hash-chained audit log.
+
+    Entries go to a chain of segment files: ``audit.log`` and, once it
+    reaches ``segment_max_bytes``, ``audit.log.000001`` and so on. The
+    active segment stays open and each ``log_event()`` / ``log_events()``
+    call is flushed to the OS before returning. ``fsync_batch_size`` and/or
+    ``fsync_interval`` group-commit the fsyncs, which otherwise happen only
+    on rotation, ``flush()`` and ``close()``. Each segment has a ``.idx`` sidecar of little-endian 64-bit
+    entry offsets (rebuilt from the segment when missing or stale), so
+    ``read_entries()`` seeks straight to a page.
+
+    Checkpoints (entry index, hash and logical offset, i.e. the sizes of the
+    earlier segments plus the position in the current one) let
+    ``verify_log_integrity()`` re-hash only the entries written after the
+    latest trusted one. A checkpoint is trusted if this process wrote or
+    verified the chain up to it, or if it was loaded from the
+    ``.checkpoints`` sidecar with a valid signature. Only signed checkpoints
+    are persisted.
+
+    ``merkle`` accumulates entry hashes for O(log n) inclusion and
+    consistency proofs; it is built from the segments on first use.
+    """
     
-    def __init__(self, log_directory=None):
+    def __init__(
+        self,
+        log_directory=None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        signing_key=None,
+        verify_key=None,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        fsync_batch_size: Optional[int] = None,
+        fsync_interval: Optional[float] = None,
+    ):
+        if segment_max_bytes < 1:
+            raise ValueError("segment_max_bytes must be >= 1")
+        if fsync_batch_size is not None and fsync_batch_size < 1:
+            raise ValueError("fsync_batch_size must be >= 1")
+        if fsync_interval is not None and fsync_interval <= 0:
+            raise ValueError("fsync_interval must be > 0")
         if log_directory is None:
             script_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
             log_directory = os.path.join(script_dir, "data", "logs")
         os.makedirs(log_directory, exist_ok=True)
         self.log_file = os.path.join(log_directory, "audit.log")
-        self.last_hash = self._get_last_hash()
+        self.checkpoint_file = self.log_file + ".checkpoints"
+        self.checkpoint_interval = checkpoint_interval
+        self.segment_max_bytes = segment_max_bytes
+        self._fsync_batch_size = fsync_batch_size
+        self._fsync_interval = fsync_interval
+        self._pending_syncs = 0
+        self._last_sync = time.monotonic()
+        self._signing_key = signing_key
+        if verify_key is None and signing_key is not None:
+            verify_key = signing_key.verify_key
+        self._verify_key = verify_key
         self._log = get_audit_logger()
-        if not self.last_hash:
+        self._lock = threading.RLock()
+        self._file = None
+        self._index = None
+        self._position = 0
+        # Per segment: path, logical base offset and number of indexed entries.
+        self._segments: List[str] = []
+        self._bases: List[int] = []
+        self._counts: List[int] = []
+        self._load_segments()
+        self.last_hash = self._get_last_hash()
+        # Number of entries, known only once the chain is trusted (created or verified here).
+        self.entry_count: Optional[int] = None
+        self._checkpoints: List[Checkpoint] = []
+        self._merkle: Optional[MerkleLog] = None
+        # Watermark of the last verification: entries on disk at the time and the result.
+        self._verified_entries = 0
+        self._verified: Optional[bool] = None
+        # Entries covered by the last verification, up to and including a broken one.
+        self.scanned_entries = 0
+        if not self._segments:
             self._initialize_log()
-        self._log.info("Audit Log initialized", log_file=self.log_file)
+        else:
+            # Never re-initialize an existing log: that would delete its segments.
+            self._open_active_segment()
+            self._checkpoints = self._load_checkpoints()
+            if not self.last_hash:
+                self._log.warning("Audit log has no parseable entries, appending GENESIS")
+                self.log_event("GENESIS", "SYSTEM", "Log Initialized", "Initial state.")
+        self._log.info("Audit Log initialized", log_file=self.log_file, segments=len(self._segments))
+
+    def _load_segments(self) -> None:
+        if not os.path.exists(self.log_file):
+            return
+        base = 0
+        while os.path.exists(_segment_path(self.log_file, len(self._segments))):
+            path = _segment_path(self.log_file, len(self._segments))
+            self._segments.append(path)
+            self._bases.append(base)
+            self._counts.append(self._reconcile_index(path))
+            base += os.path.getsize(path)
+
+    def _reconcile_index(self, path: str) -> int:
+        """Bring the segment's offset index up to date; returns its entry count."""
+        size = os.path.getsize(path)
+        index_path = path + INDEX_SUFFIX
+        with open(index_path, 'ab') as index:
+            index_size = index.tell()
+            count = index_size // _OFFSET.size
+            scan_from = 0
+            with open(index_path, 'rb') as f:
+                # Drop offsets past EOF (truncated segment), then resume after the last entry.
+                while count:
+                    f.seek((count - 1) * _OFFSET.size)
+                    (last,) = _OFFSET.unpack(f.read(_OFFSET.size))
+                    if last < size:
+                        with open(path, 'rb') as segment:
+                            segment.seek(last)
+                            scan_from = last + len(segment.readline())
+                        break
+                    count -= 1
+            if count * _OFFSET.size != index_size:
+                index.truncate(count * _OFFSET.size)
+            for offset in _scan_entry_offsets(path, scan_from):
+                index.write(_OFFSET.pack(offset))
+                count += 1
+        return count
 
     def _get_last_hash(self) -> str:
-        try:
-            with open(self.log_file, 'rb') as f:
-                f.seek(-2, os.SEEK_END)
-                while f.read(1) != b'\n':
-                    f.seek(-2, os.SEEK_CUR)
-                last_line = f.readline().decode().strip()
-                return last_line.split(" | ")[-1]
-        except (IOError, IndexError):
-            return ""
+        """Hash of the last entry that parses, or "" if none does.
+
+        Normally that is the last indexed entry. Lines that do not parse
+        (written before fields were escaped, or a stale index) are skipped
+        here exactly as verification skips them, so the chain continues
+        from the entry the verifier will see last.
+        """
+        for path, count in zip(reversed(self._segments), reversed(self._counts)):
+            if not count:
+                continue
+            with open(path + INDEX_SUFFIX, 'rb') as index, open(path, 'rb') as f:
+                for i in range(count - 1, -1, -1):
+                    index.seek(i * _OFFSET.size)
+                    (offset,) = _OFFSET.unpack(index.read(_OFFSET.size))
+                    f.seek(offset)
+                    parts = _parse_entry(f.readline())
+                    if parts is not None:
+                        return parts[6]
+        return ""
 
     def _initialize_log(self):
+        """Create a new log. Only called when no segment file exists."""
+        # A sidecar index without its segment is stale and would be trusted on
+        # the next open; it is derived data and can always be rebuilt.
+        if os.path.exists(self.log_file + INDEX_SUFFIX):
+            os.remove(self.log_file + INDEX_SUFFIX)
         with open(self.log_file, 'w') as f:
             f.write("# Audit Log - Chain of Custody Simulator\n")
             f.write("# Each entry is chained by hashing the previous entry's hash.\n")
+        if os.path.exists(self.checkpoint_file):
+            # Checkpoints of a log that is gone: keep them aside, never delete.
+            os.replace(self.checkpoint_file, self.checkpoint_file + ".orphaned")
+            self._log.warning("Moved checkpoints without a log aside", path=self.checkpoint_file + ".orphaned")
+        self._segments, self._bases, self._counts = [self.log_file], [0], [0]
+        self._open_active_segment()
+        self.entry_count = 0
         self.log_event("GENESIS", "SYSTEM", "Log Initialized", "Initial state.")
 
-    def log_event(self, event_type: str, actor: str, target: str, details: str = ""):
+    def _open_active_segment(self) -> None:
+        path = self._segments[-1]
+        self._file = open(path, 'ab')
+        self._index = open(path + INDEX_SUFFIX, 'ab')
+        self._position = self._file.tell()
+
+    def _close_active_segment(self) -> None:
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._index.close()
+            self._file = self._index = None
+
+    def _rotate(self) -> None:
+        self._close_active_segment()
+        self._bases.append(self._bases[-1] + os.path.getsize(self._segments[-1]))
+        self._segments.append(_segment_path(self.log_file, len(self._segments)))
+        self._counts.append(0)
+        self._open_active_segment()
+        self._log.info("Audit log segment rotated", segment=self._segments[-1])
+
+    def _sync(self) -> None:
+        # The index is rebuilt from the segment on open, so it only needs flushing.
+        self._file.flush()
+        self._index.flush()
+        os.fsync(self._file.fileno())
+        self._pending_syncs = 0
+        self._last_sync = time.monotonic()
+
+    def _commit(self, entries: int = 1) -> None:
+        self._pending_syncs += entries
+        if self._fsync_batch_size is not None and self._pending_syncs >= self._fsync_batch_size:
+            self._sync()
+        elif (
+            self._fsync_interval is not None
+            and time.monotonic() - self._last_sync >= self._fsync_interval
+        ):
+            self._sync()
+
+    def flush(self) -> None:
+        """fsync the active segment, committing any pending group."""
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_active_segment()
+
+    def __enter__(self) -> "AuditLog":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def segment_files(self) -> List[str]:
+        return list(self._segments)
+
+    def _segment_bounds(self) -> List[Tuple[str, int]]:
+        return list(zip(self._segments, self._bases))
+
+    @property
+    def total_entries(self) -> int:
+        """Entries on disk according to the segment indexes (verified or not)."""
+        return sum(self._counts)
+
+    def _load_checkpoints(self) -> List[Checkpoint]:
+        if self._verify_key is None:
+            return []
+        try:
+            size = self._bases[-1] + os.path.getsize(self._segments[-1])
+            with open(self.checkpoint_file, 'r') as f:
+                loaded = [Checkpoint.from_dict(json.loads(line)) for line in f if line.strip()]
+        except (OSError, ValueError, TypeError):
+            return []
+        trusted = [cp for cp in loaded if cp.offset <= size and cp.verify(self._verify_key)]
+        if len(trusted) != len(loaded):
+            self._log.warning("Ignoring untrusted checkpoints", count=len(loaded) - len(trusted))
+        return trusted
+
+    def _add_checkpoint(self, index: int, entry_hash: str, offset: int) -> None:
+        if self._checkpoints and self._checkpoints[-1].offset >= offset:
+            return
+        checkpoint = Checkpoint(
+            index=index,
+            entry_hash=entry_hash,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            offset=offset,
+        )
+        if self._signing_key is not None:
+            checkpoint.sign(self._signing_key)
+            with open(self.checkpoint_file, 'a') as f:
+                f.write(json.dumps(checkpoint.to_dict()) + "\n")
+        self._checkpoints.append(checkpoint)
+
+    def get_checkpoints(self) -> List[Checkpoint]:
+        return list(self._checkpoints)
+
+    @property
+    def merkle(self) -> MerkleLog:
+        with self._lock:
+            if self._merkle is None:
+                merkle = MerkleLog()
+                for raw, _ in _iter_log_lines(self._segment_bounds()):
+                    parts = _parse_entry(raw)
+                    if parts is not None:
+                        merkle.append(parts[6])
+                self._merkle = merkle
+            return self._merkle
+
+    def log_event(self, event_type: str, actor: str, target: str, details: str = "") -> str:
+        return self.log_events([(event_type, actor, target, details)])[0]
+
+    def log_events(self, events: Iterable[Tuple[str, str, str, str]]) -> List[str]:
+        """Append (event_type, actor, target, details) events with a single flush and commit.
+
+        Returns the entry hashes in order.
+        """
+        with self._lock:
+            self._position = self._file.tell()
+            hashes = [self._write_entry(*event) for event in events]
+            self._file.flush()
+            self._commit(len(hashes))
+            return hashes
+
+    def _write_entry(self, event_type: str, actor: str, target: str, details: str = "") -> str:
         timestamp = datetime.now(timezone.utc).isoformat()
+        event_type, actor, target, details = map(_escape_field, (event_type, actor, target, details))
         log_entry_content = f"{event_type} | {actor} | {target} | {timestamp} | {details} | {self.last_hash}"
         new_hash = hashlib.sha256(log_entry_content.encode('utf-8')).hexdigest()
-        full_log_entry = f"{log_entry_content} | {new_hash}\n"
-        with open(self.log_file, 'a') as f:
-            f.write(full_log_entry)
+        data = f"{log_entry_content} | {new_hash}\n".encode('utf-8')
+        if self._counts[-1] and self._position + len(data) > self.segment_max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._index.write(_OFFSET.pack(self._position))
+        self._position += len(data)
+        self._counts[-1] += 1
         self._log.info("Event logged", event_type=event_type, actor=actor, target=target)
         self.last_hash = new_hash
+        if self._merkle is not None:
+            self._merkle.append(new_hash)
+        if self.entry_count is not None:
+            self.entry_count += 1
+            if self.checkpoint_interval and self.entry_count % self.checkpoint_interval == 0:
+                self._add_checkpoint(self.entry_count - 1, new_hash, self._bases[-1] + self._position)
+        return new_hash
 
-    def verify_log_integrity(self) -> bool:
-        self._log.info("Verifying log integrity")
-        try:
-            with open(self.log_file, 'r') as f:
-                lines = f.readlines()
-            log_entries = [line.strip() for line in lines if not line.startswith("#")]
-            current_hash_from_prev_line = ""
-            for i, entry in enumerate(log_entries):
-                parts = entry.split(" | ")
-                if len(parts) != 7:
+    def _indexed_segments(self) -> List[Tuple[str, int]]:
+        """Snapshot of (segment path, entry count) with the active index flushed."""
+        with self._lock:
+            if self._index is not None:
+                self._index.flush()
+            return list(zip(self._segments, self._counts))
+
+    def iter_entries(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, str]]:
+        """Stream parsed entries ``start`` up to ``stop``, seeking via the segment indexes.
+
+        Entries appended after the call starts are not included.
+        """
+        if start < 0:
+            raise ValueError("start must be >= 0")
+        first = 0
+        for path, count in self._indexed_segments():
+            if stop is not None and first >= stop:
+                return
+            if start >= first + count:
+                first += count
+                continue
+            local = max(start - first, 0)
+            remaining = (count if stop is None else min(count, stop - first)) - local
+            if remaining <= 0:
+                return
+            with open(path + INDEX_SUFFIX, 'rb') as f:
+                f.seek(local * _OFFSET.size)
+                (offset,) = _OFFSET.unpack(f.read(_OFFSET.size))
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                for raw in f:
+                    parts = _parse_entry(raw)
+                    if parts is None:
+                        continue
+                    yield _entry_dict(parts)
+                    remaining -= 1
+                    if not remaining:
+                        break
+            first += count
+
+    def read_entries(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """Return up to ``limit`` entries starting at entry ``offset``."""
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be >= 0")
+        return list(islice(self.iter_entries(offset), limit))
+
+    def _entry_at(self, segments: List[Tuple[str, int]], index: int) -> Optional[List[str]]:
+        for path, count in segments:
+            if index < count:
+                with open(path + INDEX_SUFFIX, 'rb') as f:
+                    f.seek(index * _OFFSET.size)
+                    (offset,) = _OFFSET.unpack(f.read(_OFFSET.size))
+                with open(path, 'rb') as f:
+                    f.seek(offset)
+                    return _parse_entry(f.readline())
+            index -= count
+        raise IndexError(index)
+
+    def seek_time(self, since: datetime) -> int:
+        """Index of the first entry stamped at or after ``since``.
+
+        Binary search over the segment indexes, relying on entries being
+        appended in timestamp order as ``log_event`` does.
+        """
+        since = _as_utc(since)
+        segments = self._indexed_segments()
+        lo, hi = 0, sum(count for _, count in segments)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            parts = self._entry_at(segments, mid)
+            stamp = _entry_time(parts[3]) if parts else None
+            if stamp is None or stamp < since:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def query_entries(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        event_type: Optional[str] = None,
+        actor: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """Stream (index, entry) pairs in [start, stop) matching every given filter.
+
+        ``since``/``until`` bound the timestamp inclusively: the scan starts
+        at ``seek_time(since)`` and ends at the first entry after ``until``.
+        """
+        if since is not None:
+            since = _as_utc(since)
+            start = max(start, self.seek_time(since))
+        if until is not None:
+            until = _as_utc(until)
+        for index, entry in enumerate(self.iter_entries(start, stop), start):
+            if event_type is not None and entry["event_type"] != event_type:
+                continue
+            if actor is not None and entry["actor"] != actor:
+                continue
+            if since is not None or until is not None:
+                stamp = _entry_time(entry["timestamp"])
+                if stamp is None or (since is not None and stamp < since):
                     continue
-                prev_hash_in_entry = parts[5]
-                if prev_hash_in_entry != current_hash_from_prev_line:
-                    self._log.error("Chain broken", line=i+1, expected_hash=current_hash_from_prev_line, found_hash=prev_hash_in_entry)
-                    return False
-                content_to_hash = " | ".join(parts[:-1])
-                recalculated_hash = hashlib.sha256(content_to_hash.encode('utf-8')).hexdigest()
-                stored_hash = parts[6]
-                if recalculated_hash != stored_hash:
-                    self._log.error("Hash mismatch", line=i+1, recalculated_hash=recalculated_hash, stored_hash=stored_hash)
+                if until is not None and stamp > until:
+                    return
+            yield index, entry
+
+    def _checkpoint_holds(self, files: ExitStack, opened: Dict[int, Any], checkpoint: Checkpoint) -> bool:
+        """The entry ending at ``checkpoint.offset`` still carries its hash."""
+        tail = f"{checkpoint.entry_hash}\n".encode('utf-8')
+        segment = bisect.bisect_left(self._bases, checkpoint.offset) - 1
+        local = checkpoint.offset - self._bases[segment] if segment >= 0 else 0
+        if local < len(tail):
+            return False
+        if segment not in opened:
+            opened[segment] = files.enter_context(open(self._segments[segment], 'rb'))
+        f = opened[segment]
+        f.seek(local - len(tail))
+        return f.read(len(tail)) == tail
+
+    def verify_log_integrity(self, full: bool = False, max_workers: Optional[int] = None) -> bool:
+        """Verify the hash chain, streaming the segments.
+
+        By default only entries after the latest trusted checkpoint are
+        re-hashed. ``full=True`` re-hashes everything, verifying the stretches
+        between checkpoints in parallel once the log is large enough.
+        """
+        self._log.info("Verifying log integrity", full=full)
+        with self._lock:
+            self._verified_entries = self.total_entries
+            self._verified = False
+            self.scanned_entries = 0
+            try:
+                with ExitStack() as files:
+                    opened: Dict[int, Any] = {}
+                    if not all(self._checkpoint_holds(files, opened, cp) for cp in self._checkpoints):
+                        self._log.error("Checkpoint mismatch", checkpoints=len(self._checkpoints))
+                        return False
+                # Each stretch runs from one trusted checkpoint to the next (or EOF)
+                # and must end exactly on the next checkpoint's hash.
+                segments = self._segment_bounds()
+                bounds = [None] + self._checkpoints if full or not self._checkpoints else [self._checkpoints[-1]]
+                stretches = []
+                for i, start in enumerate(bounds):
+                    end = bounds[i + 1] if i + 1 < len(bounds) else None
+                    stretches.append((
+                        segments,
+                        start.offset if start else 0,
+                        end.offset if end else None,
+                        start.entry_hash if start else "",
+                        end.entry_hash if end else None,
+                    ))
+                first_index = bounds[0].index + 1 if bounds[0] else 0
+                known = self.entry_count or (self._checkpoints[-1].index + 1 if self._checkpoints else 0)
+                workers = max_workers if known >= VERIFY_PARALLEL_THRESHOLD else 1
+                results = _map_segments(_verify_log_segment, stretches, workers)
+            except FileNotFoundError:
+                self._log.error("Log file not found")
+                return False
+
+            count = first_index
+            for last_hash, segment_count, error, end_offset in results:
+                if error is not None:
+                    error["entry"] += count
+                    self.scanned_entries = error["entry"] + 1
+                    self._log.error(error.pop("reason"), **error)
                     return False
-                current_hash_from_prev_line = stored_hash
-            self._log.info("Log integrity verified successfully")
+                count += segment_count
+            self.entry_count = count
+            self.scanned_entries = count
+            if count:
+                self._add_checkpoint(count - 1, last_hash, end_offset)
+            self._verified = True
+            self._log.info("Log integrity verified successfully", entries=count)
             return True
-        except FileNotFoundError:
-            self._log.error("Log file not found")
-            return False
+
+    def verify_chain(self, full: bool = False) -> Tuple[bool, int]:
+        """Run ``verify_log_integrity`` and return (valid, ``scanned_entries``) atomically."""
+        with self._lock:
+            return self.verify_log_integrity(full=full), self.scanned_entries
+
+    def integrity_status(self) -> Tuple[bool, int]:
+        """Cached verification result as (valid, entries covered).
+
+        ``verify_log_integrity()`` runs (incrementally, from the latest
+        trusted checkpoint) only if entries were appended since the last
+        verification, so the result is a watermark rather than a re-hash:
+        tampering with already-verified entries shows up on the next
+        explicit ``verify_log_integrity()``.
+        """
+        with self._lock:
+            if self._verified is None or self.total_entries != self._verified_entries:
+                self.verify_log_integrity()
+            return self._verified, self._verified_entries
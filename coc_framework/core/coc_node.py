@@ -1,21 +1,108 @@
 from __future__ import annotations
-from datetime import datetime, timezone
-from typing import Optional, List, Set, Dict
-from .crypto_core import CryptoCore
+import re
+from collections.abc import MutableSet
+from datetime import datetime, timezone, timedelta
+from typing import Iterable, Iterator, Optional, List, Dict, Tuple, Union
+from .crypto_core import CryptoCore, VerificationItem
+from .signature_cache import get_signature_cache
 
 
 # Schema version for node serialization format
 NODE_SCHEMA_VERSION = 2
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_ONE_MICROSECOND = timedelta(microseconds=1)
+# Exactly what datetime.isoformat() emits for a UTC-aware value, so anything
+# matching (bar an all-zero fraction, which isoformat omits) round-trips.
+_CANONICAL_UTC_ISO = re.compile(
+    r"\d{4}-\d{2}-\d{2}T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{6})?\+00:00", re.ASCII
+)
+
+# A hash as held in memory: 32 raw bytes for canonical SHA-256 hex, otherwise
+# the original string (legacy or test identifiers).
+PackedHash = Union[bytes, str]
+
+
+def pack_hash(value: Optional[str]) -> Optional[PackedHash]:
+    """Raw bytes for lowercase 64-char hex, else the value unchanged."""
+    if value is not None and len(value) == 64 and _HEX_DIGITS.issuperset(value):
+        return bytes.fromhex(value)
+    return value
+
+
+def unpack_hash(value: Optional[PackedHash]) -> Optional[str]:
+    return value.hex() if type(value) is bytes else value
+
+
+def timestamp_to_micros(timestamp: str) -> Optional[int]:
+    """Epoch microseconds if the ISO string round-trips exactly, else None."""
+    if (
+        type(timestamp) is not str
+        or not _CANONICAL_UTC_ISO.fullmatch(timestamp)
+        or timestamp.endswith(".000000+00:00")
+    ):
+        return None
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    return (dt - _EPOCH) // _ONE_MICROSECOND
+
+
+def micros_to_timestamp(micros: int) -> str:
+    return (_EPOCH + micros * _ONE_MICROSECOND).isoformat()
+
 
 class SignatureVerificationError(Exception):
     pass
 
 
+class ChildHashes(MutableSet):
+    """Set view over a node's packed children tuple."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: CoCNode):
+        self._node = node
+
+    def __contains__(self, node_hash) -> bool:
+        return isinstance(node_hash, str) and pack_hash(node_hash) in self._node._children
+
+    def __iter__(self) -> Iterator[str]:
+        return (unpack_hash(child) for child in self._node._children)
+
+    def __len__(self) -> int:
+        return len(self._node._children)
+
+    def add(self, node_hash: str) -> None:
+        packed = pack_hash(node_hash)
+        if packed not in self._node._children:
+            self._node._children += (packed,)
+
+    def discard(self, node_hash: str) -> None:
+        if node_hash in self:
+            packed = pack_hash(node_hash)
+            self._node._children = tuple(c for c in self._node._children if c != packed)
+
+    def __repr__(self) -> str:
+        return f"{{{', '.join(repr(h) for h in self)}}}"
+
+
 class CoCNode:
-    """Chain of Custody Node with Ed25519 signatures and schema versioning."""
+    """Chain of Custody Node with Ed25519 signatures and schema versioning.
+
+    Hashes are held as raw bytes, the timestamp as epoch microseconds and
+    children as a tuple; the hex/ISO forms exposed by the properties below
+    are built on access.
+    """
     
     _SIG_DELIMITER = "|"
+
+    __slots__ = (
+        "schema_version", "owner_id", "recipient_ids", "depth", "signature",
+        "_node_hash", "_content_hash", "_parent_hash", "_timestamp", "_children",
+    )
     
     def __init__(
         self, 
@@ -32,8 +119,8 @@ class CoCNode:
         self.parent_hash = parent_hash
         self.owner_id = owner_id
         self.recipient_ids = sorted(recipient_ids)
-        self.timestamp = datetime.now(timezone.utc).isoformat()
-        self.children_hashes: Set[str] = set()
+        self._timestamp = (datetime.now(timezone.utc) - _EPOCH) // _ONE_MICROSECOND
+        self._children: Tuple[PackedHash, ...] = ()
         self.depth = depth
 
         if signing_key:
@@ -42,7 +129,102 @@ class CoCNode:
             self.node_hash = CryptoCore.hash_content(f"{self.signature.hex()}{self._SIG_DELIMITER}{self.content_hash}")
         else:
             self.signature = None
-            self.node_hash = None
+            self._node_hash = None
+
+    @classmethod
+    def from_packed(
+        cls,
+        node_hash: Optional[PackedHash],
+        content_hash: PackedHash,
+        parent_hash: Optional[PackedHash],
+        owner_id: str,
+        recipient_ids: List[str],
+        timestamp: Union[int, str],
+        children: Tuple[PackedHash, ...],
+        depth: int,
+        signature: Optional[bytes],
+        schema_version: int = NODE_SCHEMA_VERSION,
+    ) -> CoCNode:
+        """Rebuild a node from already-packed fields (e.g. a storage row).
+
+        ``recipient_ids`` must already be sorted.
+        """
+        node = cls.__new__(cls)
+        node.schema_version = schema_version
+        node._node_hash = node_hash
+        node._content_hash = content_hash
+        node._parent_hash = parent_hash
+        node.owner_id = owner_id
+        node.recipient_ids = recipient_ids
+        node._timestamp = timestamp
+        node._children = children
+        node.depth = depth
+        node.signature = signature
+        return node
+
+    @property
+    def node_hash(self) -> Optional[str]:
+        return unpack_hash(self._node_hash)
+
+    @node_hash.setter
+    def node_hash(self, value: Optional[str]) -> None:
+        self._node_hash = pack_hash(value)
+
+    @property
+    def content_hash(self) -> str:
+        return unpack_hash(self._content_hash)
+
+    @content_hash.setter
+    def content_hash(self, value: str) -> None:
+        self._content_hash = pack_hash(value)
+
+    @property
+    def parent_hash(self) -> Optional[str]:
+        return unpack_hash(self._parent_hash)
+
+    @parent_hash.setter
+    def parent_hash(self, value: Optional[str]) -> None:
+        self._parent_hash = pack_hash(value)
+
+    @property
+    def timestamp(self) -> str:
+        if type(self._timestamp) is int:
+            return micros_to_timestamp(self._timestamp)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: str) -> None:
+        micros = timestamp_to_micros(value)
+        self._timestamp = value if micros is None else micros
+
+    @property
+    def timestamp_micros(self) -> Optional[int]:
+        """Epoch microseconds, or None for timestamps kept verbatim."""
+        return self._timestamp if type(self._timestamp) is int else None
+
+    @property
+    def packed_node_hash(self) -> Optional[PackedHash]:
+        return self._node_hash
+
+    @property
+    def packed_content_hash(self) -> PackedHash:
+        return self._content_hash
+
+    @property
+    def packed_parent_hash(self) -> Optional[PackedHash]:
+        return self._parent_hash
+
+    @property
+    def packed_children(self) -> Tuple[PackedHash, ...]:
+        return self._children
+
+    @property
+    def children_hashes(self) -> ChildHashes:
+        return ChildHashes(self)
+
+    @children_hashes.setter
+    def children_hashes(self, value: Iterable[str]) -> None:
+        self._children = tuple(dict.fromkeys(pack_hash(h) for h in value))
 
     def _get_signing_data(self) -> str:
         """Generate canonical string for signature. Format: version|content_hash|parent_hash|owner_id|recipients|timestamp"""
@@ -79,47 +261,61 @@ class CoCNode:
     @staticmethod
     def from_dict(data: Dict) -> CoCNode:
         schema_version = data.get("schema_version", 1)
-        
-        node = CoCNode(
-            content_hash=data["content_hash"],
+        timestamp = data["timestamp"]
+        micros = timestamp_to_micros(timestamp)
+        return CoCNode.from_packed(
+            node_hash=pack_hash(data["node_hash"]),
+            content_hash=pack_hash(data["content_hash"]),
+            parent_hash=pack_hash(data.get("parent_hash")),
             owner_id=data["owner_id"],
-            signing_key=None,
-            recipient_ids=data.get("recipient_ids", []),
-            parent_hash=data.get("parent_hash"),
+            recipient_ids=sorted(data.get("recipient_ids", [])),
+            timestamp=timestamp if micros is None else micros,
+            children=tuple(dict.fromkeys(pack_hash(h) for h in data.get("children_hashes", []))),
             depth=data.get("depth", 0),
-            schema_version=schema_version
+            signature=bytes.fromhex(data["signature"]) if data.get("signature") else None,
+            schema_version=schema_version,
         )
-        node.node_hash = data["node_hash"]
-        node.signature = bytes.fromhex(data["signature"]) if data.get("signature") else None
-        node.timestamp = data["timestamp"]
-        node.children_hashes = set(data.get("children_hashes", []))
-        return node
+
+    def _get_verification_data(self) -> str:
+        # Handle different schema versions
+        if self.schema_version >= 2:
+            return self._get_signing_data()
+        # Legacy v1 format (no delimiters, no version)
+        receivers_str = ",".join(self.recipient_ids)
+        return f"{self.content_hash}{self.parent_hash or ''}{self.owner_id}{receivers_str}{self.timestamp}"
+
+    def verification_item(self, verify_key) -> Optional[VerificationItem]:
+        """(verify_key, message, signature) triple for BatchVerifier, or None if unsigned."""
+        if not self.signature:
+            return None
+        return verify_key, self._get_verification_data(), self.signature
 
     def verify_signature(self, verify_key) -> bool:
         if not self.signature:
             return False
-        
-        # Handle different schema versions
-        if self.schema_version >= 2:
-            signature_data = self._get_signing_data()
-        else:
-            # Legacy v1 format (no delimiters, no version)
-            receivers_str = ",".join(self.recipient_ids)
-            signature_data = f"{self.content_hash}{self.parent_hash or ''}{self.owner_id}{receivers_str}{self.timestamp}"
-        
-        return CryptoCore.verify_signature(verify_key, signature_data, self.signature)
+        return get_signature_cache().verify(
+            self.node_hash, verify_key, self._get_verification_data(), self.signature
+        )
 
     def get_all_descendants(self, storage) -> List[CoCNode]:
+        if hasattr(storage, "descendants"):
+            return storage.descendants(self.node_hash)
         descendants = []
-        for child_hash in self.children_hashes:
+        seen = {self.node_hash}  # corrupt children_hashes may form a cycle
+        stack = list(self.children_hashes)
+        while stack:
+            child_hash = stack.pop()
+            if child_hash in seen:
+                continue
+            seen.add(child_hash)
             child_node = storage.get_node(child_hash)
             if child_node:
                 descendants.append(child_node)
-                descendants.extend(child_node.get_all_descendants(storage))
+                stack.extend(child_node.children_hashes)
         return descendants
 
     def __repr__(self):
-        hash_str = self.node_hash[:8] if self.node_hash else "None"
+        hash_str = self.node_hash[:8] if self._node_hash else "None"
         parent_str = self.parent_hash[:8] if self.parent_hash else "ROOT"
         owner_str = self.owner_id[:8] if self.owner_id else "None"
         return f"CoCNode(hash={hash_str}, parent={parent_str}, owner={owner_str})"
@@ -1,7 +1,20 @@
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Sequence, Tuple
 from nacl.signing import SigningKey, VerifyKey
 from nacl.encoding import HexEncoder
 
+
+# Batches smaller than this are verified inline; process start-up and pickling
+# cost more than the signatures themselves for small provenance trees.
+BATCH_PARALLEL_THRESHOLD = 2048
+BATCH_CHUNK_SIZE = 512
+
+# (verify_key, message, signature) as accepted by CryptoCore.verify_signature
+VerificationItem = Tuple[VerifyKey, str, bytes]
+
+
 class CryptoCore:
     @staticmethod
     def generate_keypair():
@@ -28,6 +41,102 @@ class CryptoCore:
         """Creates a SHA-256 hash of the given content."""
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
+    @staticmethod
+    def verify_batch(
+        items: Sequence[Optional[VerificationItem]],
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = BATCH_PARALLEL_THRESHOLD,
+    ) -> List[bool]:
+        """Verifies many signatures at once. Returns one result per item, in order.
+
+        A ``None`` item (e.g. an unsigned node) always yields ``False``. Batches
+        of at least ``parallel_threshold`` items are spread across a process pool.
+        """
+        raw = [_to_raw_item(item) for item in items]
+        if len(raw) < parallel_threshold:
+            return _verify_raw_chunk(raw)
+
+        chunks = [raw[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(raw), BATCH_CHUNK_SIZE)]
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                results: List[bool] = []
+                for chunk_result in pool.map(_verify_raw_chunk, chunks):
+                    results.extend(chunk_result)
+                return results
+        except (OSError, BrokenProcessPool):
+            # Sandboxed hosts may forbid worker processes; fall back to inline.
+            return _verify_raw_chunk(raw)
+
+
+RawVerificationItem = Tuple[bytes, bytes, bytes]
+
+
+def _to_raw_item(item: Optional[VerificationItem]) -> Optional[RawVerificationItem]:
+    """Reduces an item to picklable bytes so it can cross a process boundary."""
+    if item is None:
+        return None
+    verify_key, message, signature = item
+    if verify_key is None or not signature:
+        return None
+    return bytes(verify_key), message.encode('utf-8'), bytes(signature)
+
+
+def _verify_raw_chunk(chunk: List[Optional[RawVerificationItem]]) -> List[bool]:
+    results = []
+    keys = {}
+    for item in chunk:
+        if item is None:
+            results.append(False)
+            continue
+        key_bytes, message, signature = item
+        try:
+            verify_key = keys.get(key_bytes)
+            if verify_key is None:
+                verify_key = keys[key_bytes] = VerifyKey(key_bytes)
+            verify_key.verify(message, signature)
+            results.append(True)
+        except Exception:
+            results.append(False)
+    return results
+
+
+class BatchVerifier:
+    """Collects signatures from CoCNodes, receipts and envelopes and verifies them together.
+
+    Any object exposing ``verification_item(verify_key)`` can be submitted;
+    ``submit`` returns the index of its result in the list from ``verify``.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = BATCH_PARALLEL_THRESHOLD,
+    ):
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        self._items: List[Optional[VerificationItem]] = []
+
+    def add(self, verify_key: VerifyKey, message: str, signature: bytes) -> int:
+        self._items.append((verify_key, message, signature))
+        return len(self._items) - 1
+
+    def submit(self, signed, verify_key: VerifyKey) -> int:
+        self._items.append(signed.verification_item(verify_key))
+        return len(self._items) - 1
+
+    def verify(self) -> List[bool]:
+        return CryptoCore.verify_batch(
+            self._items,
+            max_workers=self.max_workers,
+            parallel_threshold=self.parallel_threshold,
+        )
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
 if __name__ == '__main__':
     # --- DEMONSTRATION ---
     crypto = CryptoCore()
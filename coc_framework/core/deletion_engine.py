@@ -5,7 +5,8 @@ from typing import TYPE_CHECKING, Dict, Optional, Set, List, Any
 import hashlib
 import secrets
 import time
-from .crypto_core import CryptoCore
+from .crypto_core import CryptoCore, VerificationItem
+from .signature_cache import get_signature_cache
 from .logging import deletion_logger, peer_logger
 from coc_framework.interfaces.storage_backend import ContentTombstone, DEFAULT_TOMBSTONE_GRACE_SECONDS
 
@@ -85,6 +86,14 @@ class DeletionReceipt:
         except Exception:
             return False
 
+    def verification_item(self, verify_key) -> Optional[VerificationItem]:
+        if not self.signature:
+            return None
+        try:
+            return verify_key, self._get_data_to_sign(), bytes.fromhex(self.signature)
+        except ValueError:
+            return None
+
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
@@ -259,7 +268,9 @@ class DeletionEngine:
             return False
 
         token_data = token._get_signing_data()
-        if not CryptoCore.verify_signature(originator.verify_key, token_data, bytes.fromhex(token.signature)):
+        if not get_signature_cache().verify(
+            token_hash, originator.verify_key, token_data, bytes.fromhex(token.signature)
+        ):
             self._log.warning("Invalid signature for deletion token")
             self.audit_log.log_event("DELETE_FAIL", receiving_peer.peer_id, f"Node: {token.node_hash}", "Invalid signature")
             return False
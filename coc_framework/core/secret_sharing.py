@@ -1,22 +1,56 @@
 """Shamir's Secret Sharing with HMAC authentication per share."""
 
+import base64
 import secrets
 import hashlib
 import hmac
 import os
-from typing import List, Tuple, Optional, Dict, Set
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from functools import lru_cache
+import tempfile
+from typing import BinaryIO, Iterable, Iterator, List, Tuple, Optional, Dict, Set, Union
 from dataclasses import dataclass, asdict, field
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 # 256-bit prime for finite field arithmetic
 PRIME = 2**256 - 189
+# split_secret moves share evaluation to a process pool at this many
+# polynomial evaluations (shares x chunks), in batches of SPLIT_BATCH_SHARES.
+SPLIT_PARALLEL_THRESHOLD = 200_000
+SPLIT_BATCH_SHARES = 2048
+
+# Sharing schemes: Shamir over the prime field above (31-byte chunks, hex
+# share values) or byte-wise over GF(2^8) (raw share bytes, at most 255 shares).
+SCHEME_PRIME = "prime"
+SCHEME_GF256 = "gf256"
+SHARE_SCHEMES = (SCHEME_PRIME, SCHEME_GF256)
+GF256_MAX_SHARES = 255
+
+# Compact binary share form (Share.to_bytes): a fixed header, then the value,
+# share_id, nonce, ciphertext_ref and ciphertext, each prefixed with a u32
+# length. Prime-field values are packed as 32-byte big-endian elements.
+_SHARE_FORMAT_VERSION = 1
+# version, flags, index, threshold, total_shares, chunk_size, content_hash, mac
+_SHARE_HEADER = struct.Struct(">BBIIII32s32s")
+_SHARE_FIELD_LENGTH = struct.Struct(">I")
+_FLAG_HYBRID = 0x01
+_FLAG_GF256 = 0x02
+_FLAG_MAC = 0x04
 
 
 @dataclass
 class Share:
-    """Single share with HMAC for integrity verification."""
+    """Single share with HMAC for integrity verification.
+
+    ``value`` is '|'-joined hex for the prime scheme and raw bytes for
+    gf256; ``to_dict`` carries gf256 values as base64.
+    """
     index: int
-    value: str
+    value: Union[str, bytes]
     share_id: str
     content_hash: str
     threshold: int
@@ -24,55 +58,172 @@ class Share:
     mac: str = ""
     is_hybrid: bool = False  # True when AES+Shamir hybrid encryption was used
     ciphertext: str = ""  # hex-encoded AES-GCM ciphertext (only set on hybrid shares)
-    nonce: str = ""  # hex-encoded AES-GCM nonce (only set on hybrid shares)
+    nonce: str = ""  # hex-encoded AES-GCM nonce (nonce prefix for streamed shares)
+    scheme: str = SCHEME_PRIME
+    ciphertext_ref: str = ""  # CiphertextStore reference (only set on streamed shares)
+    chunk_size: int = 0  # plaintext bytes per sealed chunk (only set on streamed shares)
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        data = asdict(self)
+        if isinstance(self.value, bytes):
+            data["value"] = base64.b64encode(self.value).decode("ascii")
+        return data
 
     @staticmethod
     def from_dict(data: Dict) -> "Share":
-        return Share(**data)
+        share = Share(**data)
+        if share.scheme == SCHEME_GF256 and isinstance(share.value, str):
+            share.value = base64.b64decode(share.value)
+        return share
+
+    def to_bytes(self) -> bytes:
+        """Compact binary form: raw hashes, MAC and ciphertext, packed field elements."""
+        if self.scheme == SCHEME_GF256:
+            value = self.value
+        else:
+            value = b"".join(int(v, 16).to_bytes(32, 'big') for v in self.value.split("|"))
+        flags = ((_FLAG_HYBRID if self.is_hybrid else 0)
+                 | (_FLAG_GF256 if self.scheme == SCHEME_GF256 else 0)
+                 | (_FLAG_MAC if self.mac else 0))
+        header = _SHARE_HEADER.pack(
+            _SHARE_FORMAT_VERSION, flags, self.index, self.threshold, self.total_shares,
+            self.chunk_size, bytes.fromhex(self.content_hash), bytes.fromhex(self.mac or "00" * 32),
+        )
+        fields = (value, self.share_id.encode('utf-8'), bytes.fromhex(self.nonce),
+                  bytes.fromhex(self.ciphertext_ref), bytes.fromhex(self.ciphertext))
+        return header + b"".join(_SHARE_FIELD_LENGTH.pack(len(f)) + f for f in fields)
 
+    @staticmethod
+    def from_bytes(data: bytes) -> "Share":
+        """Parse ``Share.to_bytes`` output. Raises ValueError if malformed."""
+        view = memoryview(data)
+        try:
+            version, flags, index, threshold, total, chunk_size, content_hash, mac = _SHARE_HEADER.unpack_from(view)
+            offset = _SHARE_HEADER.size
+            fields = []
+            for _ in range(5):
+                (length,) = _SHARE_FIELD_LENGTH.unpack_from(view, offset)
+                offset += _SHARE_FIELD_LENGTH.size
+                if offset + length > len(view):
+                    raise ValueError("Truncated share")
+                fields.append(bytes(view[offset:offset + length]))
+                offset += length
+        except struct.error as e:
+            raise ValueError(f"Malformed share: {e}") from None
+        if version != _SHARE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported share format version: {version}")
+        if offset != len(view):
+            raise ValueError("Trailing bytes after share")
+        value, share_id, nonce, ciphertext_ref, ciphertext = fields
+        if flags & _FLAG_GF256:
+            scheme = SCHEME_GF256
+        else:
+            scheme = SCHEME_PRIME
+            if not value or len(value) % 32:
+                raise ValueError("Malformed prime-field share value")
+            value = "|".join(hex(int.from_bytes(value[i:i + 32], 'big')) for i in range(0, len(value), 32))
+        return Share(
+            index=index,
+            value=value,
+            share_id=share_id.decode('utf-8'),
+            content_hash=content_hash.hex(),
+            threshold=threshold,
+            total_shares=total,
+            mac=mac.hex() if flags & _FLAG_MAC else "",
+            is_hybrid=bool(flags & _FLAG_HYBRID),
+            ciphertext=ciphertext.hex(),
+            nonce=nonce.hex(),
+            scheme=scheme,
+            ciphertext_ref=ciphertext_ref.hex(),
+            chunk_size=chunk_size,
+        )
 
-def _mod_inverse(a: int, p: int) -> int:
-    def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
-        if a == 0:
-            return b, 0, 1
-        gcd, x1, y1 = extended_gcd(b % a, a)
-        x = y1 - (b // a) * x1
-        y = x1
-        return gcd, x, y
 
-    _, x, _ = extended_gcd(a % p, p)
-    return (x % p + p) % p
+def _batch_inverse(values: List[int], p: int) -> List[int]:
+    """Invert every value mod ``p`` with a single modular inversion (Montgomery's trick)."""
+    prefix = []
+    product = 1
+    for value in values:
+        prefix.append(product)
+        product = product * value % p
+    inverse = pow(product, -1, p)  # ValueError if any value is 0 mod p
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = inverse * prefix[i] % p
+        inverse = inverse * values[i] % p
+    return result
 
 
 def _evaluate_polynomial(coefficients: List[int], x: int, prime: int) -> int:
+    """Horner evaluation; ``coefficients`` run from the constant term up.
+
+    ``x`` is a small share index, so the accumulator grows by only
+    log2(x) bits per step and one final reduction beats one per step.
+    """
     result = 0
-    for i, coeff in enumerate(coefficients):
-        result = (result + coeff * pow(x, i, prime)) % prime
-    return result
+    for coeff in reversed(coefficients):
+        result = result * x + coeff
+    return result % prime
+
+
+def _random_field_elements(count: int) -> List[int]:
+    """``count`` uniform values below PRIME from a single CSPRNG read."""
+    raw = secrets.token_bytes(32 * count)
+    values = [int.from_bytes(raw[i:i + 32], 'big') for i in range(0, len(raw), 32)]
+    # Rejection keeps the distribution uniform; a redraw is needed with p ~ 2^-248.
+    return [v if v < PRIME else secrets.randbelow(PRIME) for v in values]
+
+
+def _evaluate_share_values(polynomials: List[List[int]], xs: Iterable[int], prime: int) -> List[str]:
+    """Wire-format share values: every chunk polynomial at each x, hex-joined by '|'."""
+    return ["|".join(hex(_evaluate_polynomial(coefficients, x, prime)) for coefficients in polynomials)
+            for x in xs]
+
+
+def _share_values(
+    polynomials: List[List[int]],
+    num_shares: int,
+    max_workers: Optional[int],
+    parallel_threshold: int,
+) -> List[str]:
+    if num_shares * len(polynomials) < parallel_threshold or max_workers == 1:
+        return _evaluate_share_values(polynomials, range(1, num_shares + 1), PRIME)
+    batches = [range(start, min(start + SPLIT_BATCH_SHARES, num_shares + 1))
+               for start in range(1, num_shares + 1, SPLIT_BATCH_SHARES)]
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            values: List[str] = []
+            for batch in pool.map(_evaluate_share_values, repeat(polynomials), batches, repeat(PRIME)):
+                values.extend(batch)
+            return values
+    except (OSError, BrokenProcessPool):
+        # Sandboxed hosts may forbid worker processes; fall back to inline.
+        return _evaluate_share_values(polynomials, range(1, num_shares + 1), PRIME)
 
 
-def _lagrange_interpolation(shares: List[Tuple[int, int]], prime: int) -> int:
-    secret = 0
-    k = len(shares)
+def _lagrange_basis(xs: List[int], prime: int) -> List[int]:
+    """Lagrange coefficients at x=0 for the share x-coordinates ``xs``.
 
-    for i in range(k):
-        xi, yi = shares[i]
+    The secret of every chunk is ``sum(y_i * basis[i]) mod prime``, so the
+    basis is computed once per share set rather than once per chunk.
+    """
+    numerators = []
+    denominators = []
+    for i, xi in enumerate(xs):
         numerator = 1
         denominator = 1
-
-        for j in range(k):
+        for j, xj in enumerate(xs):
             if i != j:
-                xj = shares[j][0]
-                numerator = (numerator * (-xj)) % prime
-                denominator = (denominator * (xi - xj)) % prime
+                numerator = numerator * -xj % prime
+                denominator = denominator * (xi - xj) % prime
+        numerators.append(numerator)
+        denominators.append(denominator)
+    return [n * inv % prime for n, inv in zip(numerators, _batch_inverse(denominators, prime))]
 
-        lagrange_coeff = (numerator * _mod_inverse(denominator, prime)) % prime
-        secret = (secret + yi * lagrange_coeff) % prime
 
-    return secret
+def _lagrange_interpolation(shares: List[Tuple[int, int]], prime: int) -> int:
+    basis = _lagrange_basis([x for x, _ in shares], prime)
+    return sum(y * coeff for (_, y), coeff in zip(shares, basis)) % prime
 
 
 def _bytes_to_int(data: bytes) -> int:
@@ -83,9 +234,25 @@ def _int_to_bytes(num: int, length: int) -> bytes:
     return num.to_bytes(length, byteorder='big')
 
 
-def _compute_share_mac(share_value: str, index: int, content_hash: str, hmac_key: bytes) -> str:
-    data = f"{index}|{share_value}|{content_hash}".encode('utf-8')
-    return hmac.new(hmac_key, data, hashlib.sha256).hexdigest()
+def _share_mac_message(share_value: Union[str, bytes], index: int, content_hash: str) -> bytes:
+    if isinstance(share_value, bytes):
+        return f"{index}|".encode('utf-8') + share_value + f"|{content_hash}".encode('utf-8')
+    return f"{index}|{share_value}|{content_hash}".encode('utf-8')
+
+
+def _compute_share_mac(share_value: Union[str, bytes], index: int, content_hash: str, hmac_key: bytes) -> str:
+    return hmac.new(hmac_key, _share_mac_message(share_value, index, content_hash), hashlib.sha256).hexdigest()
+
+
+def _compute_share_macs(shares: Iterable[Tuple[Union[str, bytes], int, str]], hmac_key: bytes) -> List[str]:
+    """MACs for many (value, index, content_hash) triples, keying HMAC once."""
+    keyed = hmac.new(hmac_key, digestmod=hashlib.sha256)
+    macs = []
+    for value, index, content_hash in shares:
+        mac = keyed.copy()
+        mac.update(_share_mac_message(value, index, content_hash))
+        macs.append(mac.hexdigest())
+    return macs
 
 
 def verify_share_mac(share: Share, hmac_key: bytes) -> bool:
@@ -100,6 +267,99 @@ class ShareIntegrityError(Exception):
     pass
 
 
+def authenticate_shares(shares: List[Share], hmac_key: bytes) -> None:
+    """Verify every share's MAC in one pass. Raises ShareIntegrityError naming the first bad share.
+
+    All MACs are computed from a single keyed HMAC state and compared with one
+    constant-time comparison; shares are only checked one by one on failure.
+    """
+    expected = _compute_share_macs(((s.value, s.index, s.content_hash) for s in shares), hmac_key)
+    if all(len(share.mac) == 64 for share in shares) and hmac.compare_digest(
+        "".join(share.mac for share in shares), "".join(expected)
+    ):
+        return
+    for share, mac in zip(shares, expected):
+        if not hmac.compare_digest(share.mac, mac):
+            raise ShareIntegrityError(
+                f"Share {share.share_id} failed integrity verification (possible tampering)"
+            )
+
+
+# ── GF(256) Byte-wise Sharing ────────────────────────────────────────────────
+# Each secret byte is shared with its own polynomial over GF(2^8) (AES
+# polynomial x^8 + x^4 + x^3 + x + 1). Multiplying a whole byte string by a
+# constant is one bytes.translate() through that constant's table, and
+# addition is XOR, done on the strings as big integers.
+
+_GF256_EXP = [0] * 510
+_GF256_LOG = [0] * 256
+_value = 1
+for _power in range(255):
+    _GF256_EXP[_power] = _GF256_EXP[_power + 255] = _value
+    _GF256_LOG[_value] = _power
+    # Multiply by the generator 3: v ^ xtime(v)
+    _value ^= ((_value << 1) ^ (0x11B if _value & 0x80 else 0))
+del _value, _power
+
+
+def _gf256_mul(a: int, b: int) -> int:
+    if a == 0 or b == 0:
+        return 0
+    return _GF256_EXP[_GF256_LOG[a] + _GF256_LOG[b]]
+
+
+def _gf256_inverse(a: int) -> int:
+    if a == 0:
+        raise ValueError("0 has no inverse in GF(256)")
+    return _GF256_EXP[255 - _GF256_LOG[a]]
+
+
+@lru_cache(maxsize=256)
+def _gf256_mul_table(c: int) -> bytes:
+    """Translation table multiplying every byte by ``c``."""
+    return bytes(_gf256_mul(c, v) for v in range(256))
+
+
+def _gf256_share_values(secret: bytes, threshold: int, num_shares: int) -> List[bytes]:
+    """Share bytes for x = 1..num_shares; each is as long as the secret."""
+    length = len(secret)
+    randoms = secrets.token_bytes(length * (threshold - 1))
+    # Highest degree first for Horner's rule; the constant term is the secret.
+    coefficients = [int.from_bytes(randoms[i * length:(i + 1) * length], 'big')
+                    for i in range(threshold - 1)]
+    coefficients.reverse()
+    coefficients.append(int.from_bytes(secret, 'big'))
+    values = []
+    for x in range(1, num_shares + 1):
+        table = _gf256_mul_table(x)
+        acc = coefficients[0]
+        for coeff in coefficients[1:]:
+            acc = int.from_bytes(acc.to_bytes(length, 'big').translate(table), 'big') ^ coeff
+        values.append(acc.to_bytes(length, 'big'))
+    return values
+
+
+def _gf256_lagrange_basis(xs: List[int]) -> List[int]:
+    """Lagrange coefficients at x=0 over GF(256), where subtraction is XOR."""
+    basis = []
+    for i, xi in enumerate(xs):
+        coeff = 1
+        for j, xj in enumerate(xs):
+            if i != j:
+                coeff = _gf256_mul(coeff, _gf256_mul(xj, _gf256_inverse(xi ^ xj)))
+        basis.append(coeff)
+    return basis
+
+
+def _gf256_combine(points: List[Tuple[int, bytes]]) -> bytes:
+    length = len(points[0][1])
+    basis = _gf256_lagrange_basis([x for x, _ in points])
+    acc = 0
+    for (_, y), coeff in zip(points, basis):
+        acc ^= int.from_bytes(y.translate(_gf256_mul_table(coeff)), 'big')
+    return acc.to_bytes(length, 'big')
+
+
 # ── Hybrid Encryption Helpers ────────────────────────────────────────────────
 # For payloads > HYBRID_THRESHOLD_BYTES, we encrypt the content with AES-256-GCM
 # and only split the 32-byte key via Shamir. This reduces polynomial count from
@@ -123,13 +383,130 @@ def _aes_decrypt(key: bytes, nonce: bytes, ciphertext: bytes) -> bytes:
     return aesgcm.decrypt(nonce, ciphertext, None)
 
 
-def split_secret(content: str, threshold: int, num_shares: int) -> Tuple[List[Share], bytes]:
-    """Split content into shares. Returns (shares, hmac_key).
-    
-    For content > HYBRID_THRESHOLD_BYTES, uses hybrid encryption:
-    AES-256-GCM encrypts the content, then only the 32-byte AES key
-    is split via Shamir. This drastically reduces overhead for large payloads.
+# ── Streaming Hybrid Sharing ─────────────────────────────────────────────────
+# split_stream encrypts a file or byte iterator chunk by chunk straight into a
+# CiphertextStore, so neither the plaintext nor the ciphertext is ever held in
+# memory whole. Each STREAM_CHUNK_SIZE chunk is sealed with AES-256-GCM under
+# nonce = 7-byte random prefix || 4-byte chunk counter || last-chunk flag, so
+# dropped, reordered or truncated chunks fail authentication. The ciphertext is
+# stored once under its SHA-256; shares carry the key share plus that reference.
+
+STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_NONCE_PREFIX_BYTES = 7
+_GCM_TAG_BYTES = 16
+
+
+class CiphertextStore:
+    """Content-addressed ciphertext files under ``root``.
+
+    A ciphertext's reference is the hex SHA-256 of its bytes; it is stored
+    at ``<root>/<ref[:2]>/<ref>``.
     """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path(self, ref: str) -> str:
+        if len(ref) != 64 or not set(ref) <= set("0123456789abcdef"):
+            raise ValueError(f"Invalid ciphertext reference: {ref!r}")
+        return os.path.join(self.root, ref[:2], ref)
+
+    def __contains__(self, ref: str) -> bool:
+        return os.path.exists(self.path(ref))
+
+    def put(self, blocks: Iterable[bytes]) -> str:
+        """Write ``blocks`` to a new file and return its reference."""
+        digest = hashlib.sha256()
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for block in blocks:
+                    digest.update(block)
+                    f.write(block)
+                f.flush()
+                os.fsync(f.fileno())
+            ref = digest.hexdigest()
+            path = self.path(ref)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return ref
+
+    def read(self, ref: str, block_size: int) -> Iterator[bytes]:
+        """Yield the stored ciphertext in ``block_size`` blocks."""
+        with open(self.path(ref), "rb") as f:
+            yield from iter(lambda: f.read(block_size), b"")
+
+    def delete(self, ref: str) -> bool:
+        try:
+            os.remove(self.path(ref))
+        except FileNotFoundError:
+            return False
+        return True
+
+
+def _stream_nonce(prefix: bytes, counter: int, last: bool) -> bytes:
+    if counter >= 2**32:
+        raise ValueError("Stream too long for a 32-bit chunk counter")
+    return prefix + counter.to_bytes(4, "big") + (b"\x01" if last else b"\x00")
+
+
+def _rechunk(source: Union[BinaryIO, Iterable[bytes]], chunk_size: int) -> Iterator[bytes]:
+    """Re-slice a binary file or byte iterator into ``chunk_size`` blocks."""
+    pieces = iter(lambda: source.read(chunk_size), b"") if hasattr(source, "read") else source
+    buffer = bytearray()
+    for piece in pieces:
+        buffer += piece
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _encrypt_stream(key: bytes, prefix: bytes, blocks: Iterator[bytes], digest) -> Iterator[bytes]:
+    """Seal each plaintext block, updating ``digest`` with the plaintext."""
+    aesgcm = AESGCM(key)
+    block = next(blocks, b"")  # empty input still yields one (final) record
+    counter = 0
+    while True:
+        following = next(blocks, None)
+        digest.update(block)
+        yield aesgcm.encrypt(_stream_nonce(prefix, counter, following is None), block, None)
+        if following is None:
+            return
+        block = following
+        counter += 1
+
+
+def _decrypt_stream(key: bytes, prefix: bytes, records: Iterator[bytes]) -> Iterator[bytes]:
+    """Open sealed records in order. Raises InvalidTag on tampering or truncation."""
+    aesgcm = AESGCM(key)
+    record = next(records, None)
+    if record is None:
+        raise InvalidTag()
+    counter = 0
+    while record is not None:
+        following = next(records, None)
+        yield aesgcm.decrypt(_stream_nonce(prefix, counter, following is None), record, None)
+        record = following
+        counter += 1
+
+
+def _stored_plaintext(key: bytes, share: Share, store: CiphertextStore) -> Iterator[bytes]:
+    records = store.read(share.ciphertext_ref, share.chunk_size + _GCM_TAG_BYTES)
+    return _decrypt_stream(key, bytes.fromhex(share.nonce), records)
+
+
+def _check_split_params(threshold: int, num_shares: int, scheme: str) -> None:
+    if scheme not in SHARE_SCHEMES:
+        raise ValueError(f"Unknown sharing scheme: {scheme}")
+    if scheme == SCHEME_GF256 and num_shares > GF256_MAX_SHARES:
+        raise ValueError(f"GF(256) sharing supports at most {GF256_MAX_SHARES} shares")
     if threshold > num_shares:
         raise ValueError(f"Threshold ({threshold}) cannot exceed number of shares ({num_shares})")
     if threshold < 2:
@@ -137,47 +514,36 @@ def split_secret(content: str, threshold: int, num_shares: int) -> Tuple[List[Sh
     if num_shares < 2:
         raise ValueError("Must create at least 2 shares")
 
-    hmac_key = secrets.token_bytes(32)
-    content_bytes = content.encode('utf-8')
-    content_hash = hashlib.sha256(content_bytes).hexdigest()
-
-    use_hybrid = len(content_bytes) > HYBRID_THRESHOLD_BYTES
 
-    if use_hybrid:
-        # Hybrid path: AES encrypt content, Shamir split only the key
-        aes_key, aes_nonce, ciphertext = _aes_encrypt(content_bytes)
-        secret_bytes = aes_key  # 32 bytes — fits in ~2 Shamir chunks
+def _make_shares(
+    secret_bytes: bytes,
+    threshold: int,
+    num_shares: int,
+    content_hash: str,
+    scheme: str,
+    max_workers: Optional[int] = None,
+    parallel_threshold: int = SPLIT_PARALLEL_THRESHOLD,
+    **share_fields,
+) -> Tuple[List[Share], bytes]:
+    """Shamir-split ``secret_bytes`` into MAC'd shares. Returns (shares, hmac_key)."""
+    if scheme == SCHEME_GF256:
+        values = _gf256_share_values(secret_bytes, threshold, num_shares)
     else:
-        # Direct path: Shamir split the content itself
-        secret_bytes = content_bytes
-        aes_nonce = b''
-        ciphertext = b''
-
-    chunks = _split_into_chunks(secret_bytes)
-    
-    all_shares_data: List[List[Tuple[int, int]]] = []
-
-    for chunk in chunks:
-        secret = _bytes_to_int(chunk)
-        coefficients = [secret]  # a_0 = secret, rest are random
-        for _ in range(threshold - 1):
-            coefficients.append(secrets.randbelow(PRIME))
-
-        chunk_shares = []
-        for x in range(1, num_shares + 1):
-            y = _evaluate_polynomial(coefficients, x, PRIME)
-            chunk_shares.append((x, y))
-
-        all_shares_data.append(chunk_shares)
+        chunks = _split_into_chunks(secret_bytes)
+        # a_0 is the chunk, a_1 .. a_{t-1} are random, all drawn in one read.
+        randoms = _random_field_elements(len(chunks) * (threshold - 1))
+        polynomials = [
+            [_bytes_to_int(chunk)] + randoms[i * (threshold - 1):(i + 1) * (threshold - 1)]
+            for i, chunk in enumerate(chunks)
+        ]
+        values = _share_values(polynomials, num_shares, max_workers, parallel_threshold)
 
+    hmac_key = secrets.token_bytes(32)
     share_id_base = secrets.token_hex(8)
+    macs = _compute_share_macs(((value, i + 1, content_hash) for i, value in enumerate(values)), hmac_key)
     shares = []
 
-    for i in range(num_shares):
-        combined_value = "|".join(hex(all_shares_data[chunk_idx][i][1]) 
-                                   for chunk_idx in range(len(chunks)))
-        mac = _compute_share_mac(combined_value, i + 1, content_hash, hmac_key)
-        
+    for i, (combined_value, mac) in enumerate(zip(values, macs)):
         share = Share(
             index=i + 1,
             value=combined_value,
@@ -186,15 +552,79 @@ def split_secret(content: str, threshold: int, num_shares: int) -> Tuple[List[Sh
             threshold=threshold,
             total_shares=num_shares,
             mac=mac,
-            is_hybrid=use_hybrid,
-            ciphertext=ciphertext.hex() if use_hybrid else "",
-            nonce=aes_nonce.hex() if use_hybrid else "",
+            scheme=scheme,
+            **share_fields,
         )
         shares.append(share)
 
     return shares, hmac_key
 
 
+def split_secret(
+    content: str,
+    threshold: int,
+    num_shares: int,
+    max_workers: Optional[int] = None,
+    parallel_threshold: int = SPLIT_PARALLEL_THRESHOLD,
+    scheme: str = SCHEME_PRIME,
+) -> Tuple[List[Share], bytes]:
+    """Split content into shares. Returns (shares, hmac_key).
+    
+    For content > HYBRID_THRESHOLD_BYTES, uses hybrid encryption:
+    AES-256-GCM encrypts the content, then only the 32-byte AES key
+    is split via Shamir. This drastically reduces overhead for large payloads.
+    Every hybrid share embeds the full ciphertext; see ``split_stream`` to
+    store it once instead.
+
+    ``scheme`` picks prime-field (default) or GF(256) byte-wise sharing.
+    For the prime scheme, once shares x chunks reaches ``parallel_threshold``
+    the share values are evaluated on a process pool of ``max_workers``
+    (``max_workers=1`` keeps it inline).
+    """
+    _check_split_params(threshold, num_shares, scheme)
+
+    content_bytes = content.encode('utf-8')
+    content_hash = hashlib.sha256(content_bytes).hexdigest()
+
+    if len(content_bytes) > HYBRID_THRESHOLD_BYTES:
+        # Hybrid path: AES encrypt content, Shamir split only the key
+        aes_key, aes_nonce, ciphertext = _aes_encrypt(content_bytes)
+        return _make_shares(
+            aes_key, threshold, num_shares, content_hash, scheme, max_workers, parallel_threshold,
+            is_hybrid=True, ciphertext=ciphertext.hex(), nonce=aes_nonce.hex(),
+        )
+    # Direct path: Shamir split the content itself
+    return _make_shares(content_bytes, threshold, num_shares, content_hash, scheme, max_workers, parallel_threshold)
+
+
+def split_stream(
+    source: Union[BinaryIO, Iterable[bytes]],
+    threshold: int,
+    num_shares: int,
+    store: CiphertextStore,
+    scheme: str = SCHEME_PRIME,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Tuple[List[Share], bytes]:
+    """Encrypt a binary file or byte iterator into ``store`` and split its key.
+
+    Returns (shares, hmac_key) like ``split_secret``. The shares are hybrid
+    shares whose ``ciphertext_ref`` names the single stored ciphertext and
+    whose ``content_hash`` is the SHA-256 of the streamed plaintext.
+    """
+    _check_split_params(threshold, num_shares, scheme)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    aes_key = AESGCM.generate_key(bit_length=256)
+    prefix = os.urandom(_STREAM_NONCE_PREFIX_BYTES)
+    digest = hashlib.sha256()
+    ref = store.put(_encrypt_stream(aes_key, prefix, _rechunk(source, chunk_size), digest))
+    return _make_shares(
+        aes_key, threshold, num_shares, digest.hexdigest(), scheme,
+        is_hybrid=True, nonce=prefix.hex(), ciphertext_ref=ref, chunk_size=chunk_size,
+    )
+
+
 def _split_into_chunks(data: bytes, chunk_size: int = 31) -> List[bytes]:
     """Split data into 31-byte chunks (fits within 256-bit prime field)."""
     chunks = []
@@ -210,17 +640,27 @@ def _split_into_chunks(data: bytes, chunk_size: int = 31) -> List[bytes]:
     return chunks
 
 
-def reconstruct_secret(shares: List[Share], hmac_key: Optional[bytes] = None) -> Optional[str]:
-    """Reconstruct content from shares. Raises ShareIntegrityError if HMAC fails.
-    
-    Handles both direct and hybrid (AES+Shamir) shares transparently.
-    """
+def _prime_combine(shares: List[Share]) -> bytes:
+    basis = _lagrange_basis([share.index for share in shares], PRIME)
+    columns = [[int(v, 16) for v in share.value.split("|")] for share in shares]
+    chunks = [
+        _int_to_bytes(sum(y * coeff for y, coeff in zip(ys, basis)) % PRIME, 31)
+        for ys in zip(*columns)
+    ]
+    original_length = int.from_bytes(chunks[0][:4], byteorder='big')
+    return b''.join(chunks[1:])[:original_length]
+
+
+def _combine_shares(shares: List[Share], hmac_key: Optional[bytes]) -> bytes:
+    """Validate ``shares`` (and their MACs, given ``hmac_key``) and recover the secret bytes."""
     if not shares:
         raise ValueError("No shares provided")
 
     threshold = shares[0].threshold
     content_hash = shares[0].content_hash
     is_hybrid = shares[0].is_hybrid
+    scheme = shares[0].scheme
+    ciphertext_ref = shares[0].ciphertext_ref
 
     if len(shares) < threshold:
         raise ValueError(f"Need at least {threshold} shares, got {len(shares)}")
@@ -232,30 +672,51 @@ def reconstruct_secret(shares: List[Share], hmac_key: Optional[bytes] = None) ->
             raise ValueError("Shares have inconsistent threshold values")
         if share.is_hybrid != is_hybrid:
             raise ValueError("Shares have inconsistent hybrid flags")
-        if hmac_key is not None and not verify_share_mac(share, hmac_key):
-            raise ShareIntegrityError(
-                f"Share {share.share_id} failed integrity verification (possible tampering)"
-            )
-
-    num_chunks = len(shares[0].value.split("|"))
-    reconstructed_chunks = []
+        if share.scheme != scheme:
+            raise ValueError("Shares have inconsistent sharing schemes")
+        if share.ciphertext_ref != ciphertext_ref:
+            raise ValueError("Shares reference different ciphertexts")
+    if hmac_key is not None:
+        authenticate_shares(shares, hmac_key)
+
+    # Repeated indices add nothing: keep the first share for each index.
+    distinct: Dict[int, Share] = {}
+    for share in shares:
+        distinct.setdefault(share.index, share)
+    if len(distinct) < threshold:
+        raise ValueError(f"Need at least {threshold} shares with distinct indices, got {len(distinct)}")
+    selected = list(distinct.values())[:threshold]
+    if scheme == SCHEME_GF256:
+        if not all(1 <= share.index <= GF256_MAX_SHARES for share in selected):
+            raise ValueError("GF(256) share indices must be in 1..255")
+        if len({len(share.value) for share in selected}) != 1:
+            raise ValueError("Shares have inconsistent lengths")
+        return _gf256_combine([(share.index, share.value) for share in selected])
+    return _prime_combine(selected)
+
+
+def reconstruct_secret(
+    shares: List[Share],
+    hmac_key: Optional[bytes] = None,
+    store: Optional[CiphertextStore] = None,
+) -> Optional[str]:
+    """Reconstruct content from shares. Raises ShareIntegrityError if HMAC fails.
     
-    for chunk_idx in range(num_chunks):
-        chunk_shares = []
-        for share in shares[:threshold]:
-            chunk_values = share.value.split("|")
-            y = int(chunk_values[chunk_idx], 16)
-            chunk_shares.append((share.index, y))
-        secret_int = _lagrange_interpolation(chunk_shares, PRIME)
-        chunk_bytes = _int_to_bytes(secret_int, 31)
-        reconstructed_chunks.append(chunk_bytes)
-
-    length_chunk = reconstructed_chunks[0]
-    original_length = int.from_bytes(length_chunk[:4], byteorder='big')
-    combined = b''.join(reconstructed_chunks[1:])
-    secret_bytes = combined[:original_length]
-
-    if is_hybrid:
+    Handles both direct and hybrid (AES+Shamir) shares transparently.
+    Shares from ``split_stream`` need the ``store`` holding their ciphertext;
+    use ``reconstruct_stream`` to avoid joining it in memory.
+    """
+    secret_bytes = _combine_shares(shares, hmac_key)
+    content_hash = shares[0].content_hash
+
+    if shares[0].ciphertext_ref:
+        if store is None:
+            raise ValueError("Shares reference stored ciphertext; a CiphertextStore is required")
+        try:
+            content_bytes = b"".join(_stored_plaintext(secret_bytes, shares[0], store))
+        except InvalidTag:
+            return None
+    elif shares[0].is_hybrid:
         # Hybrid path: secret_bytes is the AES key, decrypt the ciphertext
         aes_key = secret_bytes
         ciphertext = bytes.fromhex(shares[0].ciphertext)
@@ -279,6 +740,37 @@ def reconstruct_secret(shares: List[Share], hmac_key: Optional[bytes] = None) ->
     return content
 
 
+def reconstruct_stream(
+    shares: List[Share],
+    store: CiphertextStore,
+    hmac_key: Optional[bytes] = None,
+) -> Iterator[bytes]:
+    """Recover the key from ``split_stream`` shares and stream the plaintext.
+
+    Shares are validated before this returns. Each chunk is authenticated
+    before it is yielded; a tampered or truncated ciphertext, or a plaintext
+    not matching ``content_hash``, raises ShareIntegrityError mid-stream.
+    """
+    aes_key = _combine_shares(shares, hmac_key)
+    share = shares[0]
+    if not share.ciphertext_ref:
+        raise ValueError("Shares do not reference stored ciphertext")
+    blocks = _stored_plaintext(aes_key, share, store)
+
+    def stream() -> Iterator[bytes]:
+        digest = hashlib.sha256()
+        try:
+            for block in blocks:
+                digest.update(block)
+                yield block
+        except InvalidTag:
+            raise ShareIntegrityError(f"Ciphertext {share.ciphertext_ref} failed authentication") from None
+        if digest.hexdigest() != share.content_hash:
+            raise ShareIntegrityError("Reconstructed content does not match its content hash")
+
+    return stream()
+
+
 def verify_share(share: Share, content_hash: str) -> bool:
     return share.content_hash == content_hash
 
@@ -286,9 +778,10 @@ def verify_share(share: Share, content_hash: str) -> bool:
 class SecretSharingEngine:
     """High-level interface with HMAC key storage and authorization tracking."""
 
-    def __init__(self, default_threshold: int = 3, default_shares: int = 5):
+    def __init__(self, default_threshold: int = 3, default_shares: int = 5, default_scheme: str = SCHEME_PRIME):
         self.default_threshold = default_threshold
         self.default_shares = default_shares
+        self.default_scheme = default_scheme
         self._share_registry: Dict[str, List[str]] = {}  # content_hash -> [peer_ids]
         self._hmac_keys: Dict[str, bytes] = {}  # content_hash -> hmac_key
         self._authorized_recipients: Dict[str, Set[str]] = {}  # content_hash -> {peer_ids}
@@ -298,9 +791,13 @@ class SecretSharingEngine:
         self,
         content: str,
         recipient_ids: List[str],
-        threshold: Optional[int] = None
+        threshold: Optional[int] = None,
+        scheme: Optional[str] = None,
     ) -> Dict[str, Share]:
-        """Split content and assign shares to recipients. Returns {peer_id: Share}."""
+        """Split content and assign shares to recipients. Returns {peer_id: Share}.
+
+        ``scheme`` overrides the engine's ``default_scheme`` for this split.
+        """
         num_shares = len(recipient_ids)
         if threshold is None:
             threshold = max(2, num_shares // 2 + 1)
@@ -308,7 +805,7 @@ class SecretSharingEngine:
         if num_shares < 2:
             raise ValueError("Need at least 2 recipients for secret sharing")
 
-        shares, hmac_key = split_secret(content, threshold, num_shares)
+        shares, hmac_key = split_secret(content, threshold, num_shares, scheme=scheme or self.default_scheme)
         share_map = {peer_id: shares[i] for i, peer_id in enumerate(recipient_ids)}
 
         content_hash = shares[0].content_hash
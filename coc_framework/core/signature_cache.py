@@ -0,0 +1,115 @@
+"""Process-wide cache of Ed25519 verification results for immutable signed data."""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .crypto_core import CryptoCore
+
+
+DEFAULT_SIGNATURE_CACHE_SIZE = 65536
+DEFAULT_SIGNATURE_CACHE_TTL = 3600.0
+
+
+def key_fingerprint(verify_key) -> bytes:
+    """Stable identifier for a verify key (its raw 32-byte encoding)."""
+    return bytes(verify_key)
+
+
+class SignatureCache:
+    """Bounded LRU/TTL cache of verification results keyed by (data_id, key fingerprint).
+
+    ``data_id`` names the signed object (node hash, token hash, ...). Each entry
+    also records a digest of the message and signature, so an object whose
+    fields were altered after signing misses the cache and is re-verified.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_SIGNATURE_CACHE_SIZE,
+        ttl_seconds: Optional[float] = DEFAULT_SIGNATURE_CACHE_TTL,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self._entries: OrderedDict[Tuple[str, bytes], Tuple[bytes, bool, float]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _digest(message: str, signature: bytes) -> bytes:
+        return hashlib.sha256(message.encode("utf-8") + b"|" + bytes(signature)).digest()
+
+    def get(self, data_id: str, verify_key, message: str, signature: bytes) -> Optional[bool]:
+        key = (data_id, key_fingerprint(verify_key))
+        digest = self._digest(message, signature)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                cached_digest, result, stored_at = entry
+                expired = self._ttl is not None and time.monotonic() - stored_at > self._ttl
+                if not expired and cached_digest == digest:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, data_id: str, verify_key, message: str, signature: bytes, result: bool) -> None:
+        key = (data_id, key_fingerprint(verify_key))
+        digest = self._digest(message, signature)
+        with self._lock:
+            self._entries[key] = (digest, result, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def verify(self, data_id: Optional[str], verify_key, message: str, signature: bytes) -> bool:
+        """Return the cached result for this signature, verifying it on a miss."""
+        if not data_id or verify_key is None:
+            return CryptoCore.verify_signature(verify_key, message, signature)
+        cached = self.get(data_id, verify_key, message, signature)
+        if cached is not None:
+            return cached
+        result = CryptoCore.verify_signature(verify_key, message, signature)
+        self.put(data_id, verify_key, message, signature, result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "ttl_seconds": self._ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_signature_cache = SignatureCache()
+
+
+def get_signature_cache() -> SignatureCache:
+    """Return the process-wide signature cache."""
+    return _signature_cache
@@ -1,21 +1,29 @@
 """Time-lock encryption with AES-256-GCM and automatic key expiration."""
 
+import asyncio
 import hashlib
+import heapq
+import logging
 import os
 import secrets
 import threading
-import time
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta, timezone
 from enum import Enum, auto
-from typing import Callable, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 try:
+    from cryptography.exceptions import InvalidTag
     from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     CRYPTO_AVAILABLE = True
 except ImportError:
     CRYPTO_AVAILABLE = False
 
+if TYPE_CHECKING:
+    from coc_framework.interfaces.timelock_store import TimeLockKeyBackend
+
+logger = logging.getLogger(__name__)
+
 
 class CryptoUnavailableError(RuntimeError):
     pass
@@ -78,15 +86,32 @@ class EncryptedContent:
 
 
 class KeyStore:
-    """Secure key storage with automatic expiration."""
-    
-    def __init__(self):
+    """Secure key storage with automatic expiration.
+
+    Expiry deadlines sit in a min-heap; the cleanup daemon sleeps until the
+    earliest one (or a newly stored earlier one) and wipes keys as they
+    expire, so each wake-up costs O(log n) per expired key instead of a
+    scan of every key. Heap entries are not removed on destroy or
+    re-store; they are skipped when popped unless they still match the
+    key's current expiry. ``on_expire(lock_id)`` is called, outside the
+    lock, for every key wiped because it expired.
+    """
+    
+    def __init__(self, on_expire: Optional[Callable[[str], None]] = None):
         self._keys: Dict[str, Tuple[bytes, datetime]] = {}
+        self._heap: List[Tuple[datetime, str]] = []  # (expiry, lock_id), possibly stale
         self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
         self._cleanup_thread: Optional[threading.Thread] = None
         self._running = False
+        self.on_expire = on_expire
+        # Set by AsyncExpiryScheduler.attach: called as (store, expiry) when
+        # a new earliest deadline is scheduled.
+        self._deadline_listener: Optional[Callable[["KeyStore", datetime], None]] = None
     
     def start_cleanup_daemon(self, interval: float = 1.0):
+        """Start the expiry daemon. It sleeps at most ``interval`` seconds at a
+        time, bounding the effect of wall-clock jumps on the next deadline."""
         self._running = True
         self._cleanup_thread = threading.Thread(
             target=self._cleanup_loop,
@@ -96,25 +121,64 @@ class KeyStore:
         self._cleanup_thread.start()
     
     def stop_cleanup_daemon(self):
-        self._running = False
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify()
         if self._cleanup_thread:
             self._cleanup_thread.join(timeout=2.0)
     
     def _cleanup_loop(self, interval: float):
         while self._running:
             self._cleanup_expired()
-            time.sleep(interval)
-    
-    def _cleanup_expired(self):
+            with self._wakeup:
+                if not self._running:
+                    break
+                timeout = interval
+                if self._heap:
+                    until_next = (self._heap[0][0] - datetime.now(timezone.utc)).total_seconds()
+                    timeout = min(interval, max(0.0, until_next))
+                self._wakeup.wait(timeout)
+    
+    def _cleanup_expired(self) -> List[str]:
+        """Wipe every key whose deadline has passed; returns their lock_ids."""
         now = datetime.now(timezone.utc)
+        expired = []
         with self._lock:
-            expired = [
-                lock_id for lock_id, (_, expiry) in self._keys.items()
-                if now > expiry
-            ]
-            for lock_id in expired:
-                self._secure_wipe(lock_id)
-                del self._keys[lock_id]
+            while self._heap and self._heap[0][0] < now:
+                expiry, lock_id = heapq.heappop(self._heap)
+                entry = self._keys.get(lock_id)
+                if entry is not None and entry[1] == expiry:
+                    self._secure_wipe(lock_id)
+                    del self._keys[lock_id]
+                    expired.append(lock_id)
+        self._notify_expired(expired)
+        return expired
+    
+    def _notify_expired(self, lock_ids: List[str]):
+        if self.on_expire is None:
+            return
+        for lock_id in lock_ids:
+            try:
+                self.on_expire(lock_id)
+            except Exception:
+                logger.exception(f"on_expire handler failed for lock {lock_id}")
+    
+    def _schedule(self, lock_id: str, expiry: datetime):
+        """Push a deadline (caller holds the lock) and wake the daemon if it is now the earliest."""
+        heapq.heappush(self._heap, (expiry, lock_id))
+        if len(self._heap) > 2 * len(self._keys) + 64:
+            # Mostly stale entries from destroys and re-stores: rebuild.
+            self._heap = [(exp, lid) for lid, (_, exp) in self._keys.items()]
+            heapq.heapify(self._heap)
+        if self._heap[0] == (expiry, lock_id):
+            self._wakeup.notify()
+            if self._deadline_listener is not None:
+                self._deadline_listener(self, expiry)
+    
+    def next_deadline(self) -> Optional[datetime]:
+        """Earliest scheduled expiry (possibly of a key since destroyed), or None."""
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
     
     def _secure_wipe(self, lock_id: str):
         """Best-effort secure key deletion (overwrite before delete)."""
@@ -125,17 +189,31 @@ class KeyStore:
     def store_key(self, lock_id: str, key: bytes, expiry: datetime):
         with self._lock:
             self._keys[lock_id] = (key, expiry)
+            self._schedule(lock_id, expiry)
     
     def get_key(self, lock_id: str) -> Optional[bytes]:
         with self._lock:
             if lock_id not in self._keys:
                 return None
             key, expiry = self._keys[lock_id]
-            if datetime.now(timezone.utc) > expiry:
-                self._secure_wipe(lock_id)
-                del self._keys[lock_id]
+            if datetime.now(timezone.utc) <= expiry:
+                return key
+            self._secure_wipe(lock_id)
+            del self._keys[lock_id]
+        self._notify_expired([lock_id])
+        return None
+    
+    def extend_expiry(self, lock_id: str, additional: timedelta) -> Optional[datetime]:
+        """Push a live key's deadline back by ``additional``; returns the new expiry."""
+        with self._lock:
+            entry = self._keys.get(lock_id)
+            if entry is None or datetime.now(timezone.utc) > entry[1]:
                 return None
-            return key
+            key, expiry = entry
+            new_expiry = expiry + additional
+            self._keys[lock_id] = (key, new_expiry)
+            self._schedule(lock_id, new_expiry)
+            return new_expiry
     
     def destroy_key(self, lock_id: str) -> bool:
         with self._lock:
@@ -156,14 +234,59 @@ class KeyStore:
             return None
 
 
+def _seal(key: bytes, nonce: bytes, plaintext: bytes) -> Tuple[str, bytes]:
+    """SHA-256 and AES-256-GCM encrypt ``plaintext``. Returns (content_hash, ciphertext)."""
+    _require_crypto()
+    return hashlib.sha256(plaintext).hexdigest(), AESGCM(key).encrypt(nonce, plaintext, None)
+
+
+def _open(key: bytes, encrypted: EncryptedContent) -> Optional[str]:
+    """Decrypt and hash-check ``encrypted``; None if anything fails."""
+    try:
+        _require_crypto()
+        aesgcm = AESGCM(key)
+        plaintext = aesgcm.decrypt(encrypted.nonce, encrypted.ciphertext, None)
+        content = plaintext.decode('utf-8')
+        if hashlib.sha256(plaintext).hexdigest() != encrypted.metadata.content_hash:
+            return None
+        return content
+    except Exception:
+        return None
+
+
+def wrap_key(master_key: bytes, lock_id: str, key: bytes) -> bytes:
+    """AES-256-GCM encrypt ``key`` under ``master_key`` with ``lock_id`` as
+    associated data, so a wrapped key cannot be moved to another lock.
+    Returns nonce || ciphertext."""
+    _require_crypto()
+    nonce = secrets.token_bytes(12)
+    return nonce + AESGCM(master_key).encrypt(nonce, key, lock_id.encode('utf-8'))
+
+
+def unwrap_key(master_key: bytes, lock_id: str, wrapped: bytes) -> bytes:
+    """Inverse of ``wrap_key``; raises ValueError if the key fails authentication."""
+    _require_crypto()
+    try:
+        return AESGCM(master_key).decrypt(wrapped[:12], wrapped[12:], lock_id.encode('utf-8'))
+    except InvalidTag:
+        raise ValueError(f"Wrapped key for lock {lock_id} failed authentication (wrong master key?)")
+
+
 class TimeLockEngine:
-    """High-level interface for time-locked encryption with automatic key destruction."""
+    """High-level interface for time-locked encryption with automatic key destruction.
+
+    ``cleanup_interval=None`` starts no daemon thread; expiry is then only
+    enforced lazily on access unless something else drives the key store
+    (see ``AsyncTimeLockEngine``).
+    """
     
-    def __init__(self, cleanup_interval: float = 1.0):
-        self.key_store = KeyStore()
+    def __init__(self, cleanup_interval: Optional[float] = 1.0):
+        self.key_store = KeyStore(on_expire=self._on_key_expired)
         self._metadata_store: Dict[str, TimeLockMetadata] = {}
         self._callbacks: Dict[str, Callable[[str], None]] = {}
-        self.key_store.start_cleanup_daemon(cleanup_interval)
+        self._destroy_listeners: List[Callable[[str], None]] = []
+        if cleanup_interval is not None:
+            self.key_store.start_cleanup_daemon(cleanup_interval)
     
     def __enter__(self):
         return self
@@ -181,21 +304,24 @@ class TimeLockEngine:
         ttl_seconds: int,
         on_expire: Optional[Callable[[str], None]] = None
     ) -> EncryptedContent:
-        lock_id = secrets.token_hex(16)
         key = secrets.token_bytes(32)
         nonce = secrets.token_bytes(12)
         created_at = datetime.now(timezone.utc)
+        content_hash, ciphertext = _seal(key, nonce, content.encode('utf-8'))
+        return self._register(key, nonce, ciphertext, content_hash, created_at, ttl_seconds, on_expire)
+    
+    def _register(
+        self,
+        key: bytes,
+        nonce: bytes,
+        ciphertext: bytes,
+        content_hash: str,
+        created_at: datetime,
+        ttl_seconds: int,
+        on_expire: Optional[Callable[[str], None]],
+    ) -> EncryptedContent:
+        lock_id = secrets.token_hex(16)
         expires_at = created_at + timedelta(seconds=ttl_seconds)
-        
-        plaintext = content.encode('utf-8')
-        content_hash = hashlib.sha256(plaintext).hexdigest()
-        
-        _require_crypto()
-        aesgcm = AESGCM(key)
-        ciphertext = aesgcm.encrypt(nonce, plaintext, None)
-        
-        self.key_store.store_key(lock_id, key, expires_at)
-        
         metadata = TimeLockMetadata(
             lock_id=lock_id,
             content_hash=content_hash,
@@ -205,36 +331,46 @@ class TimeLockEngine:
             status="ACTIVE"
         )
         self._metadata_store[lock_id] = metadata
-        
         if on_expire:
             self._callbacks[lock_id] = on_expire
-        
+        # Store the key last: once scheduled it may expire at any moment.
+        self.key_store.store_key(lock_id, key, expires_at)
         return EncryptedContent(ciphertext=ciphertext, nonce=nonce, metadata=metadata)
     
-    def decrypt(self, encrypted: EncryptedContent) -> Optional[str]:
+    def _key_for(self, encrypted: EncryptedContent) -> Optional[bytes]:
         lock_id = encrypted.metadata.lock_id
         key = self.key_store.get_key(lock_id)
+        if key is None and lock_id in self._metadata_store:
+            if self._metadata_store[lock_id].status != "DESTROYED":
+                self._metadata_store[lock_id].status = "EXPIRED"
+        return key
+    
+    def decrypt(self, encrypted: EncryptedContent) -> Optional[str]:
+        key = self._key_for(encrypted)
         if key is None:
-            if lock_id in self._metadata_store:
-                if self._metadata_store[lock_id].status != "DESTROYED":
-                    self._metadata_store[lock_id].status = "EXPIRED"
             return None
-        
-        try:
-            _require_crypto()
-            aesgcm = AESGCM(key)
-            plaintext = aesgcm.decrypt(encrypted.nonce, encrypted.ciphertext, None)
-            content = plaintext.decode('utf-8')
-            if hashlib.sha256(plaintext).hexdigest() != encrypted.metadata.content_hash:
-                return None
-            return content
-        except Exception:
-            return None
-    
+        return _open(key, encrypted)
+    
+    def _on_key_expired(self, lock_id: str) -> None:
+        metadata = self._metadata_store.get(lock_id)
+        if metadata is not None and metadata.status != "DESTROYED":
+            metadata.status = "EXPIRED"
+        callback = self._callbacks.pop(lock_id, None)
+        if callback is not None:
+            callback(lock_id)
+
+    def add_destroy_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(lock_id)`` whenever a lock is destroyed, e.g. to drop cached plaintext."""
+        self._destroy_listeners.append(listener)
+
     def destroy(self, lock_id: str) -> bool:
         success = self.key_store.destroy_key(lock_id)
         if success and lock_id in self._metadata_store:
             self._metadata_store[lock_id].status = "DESTROYED"
+        if success:
+            self._callbacks.pop(lock_id, None)  # on_expire is for expiry only
+            for listener in self._destroy_listeners:
+                listener(lock_id)
         return success
     
     def get_status(self, lock_id: str) -> TimeLockStatus:
@@ -255,20 +391,321 @@ class TimeLockEngine:
         return max(0, remaining)
     
     def extend_ttl(self, lock_id: str, additional_seconds: int) -> bool:
-        key = self.key_store.get_key(lock_id)
-        if key is None:
-            return False
-        current_expiry = self.key_store.get_expiry(lock_id)
-        if current_expiry is None:
+        new_expiry = self.key_store.extend_expiry(lock_id, timedelta(seconds=additional_seconds))
+        if new_expiry is None:
             return False
-        new_expiry = current_expiry + timedelta(seconds=additional_seconds)
-        self.key_store.store_key(lock_id, key, new_expiry)
         if lock_id in self._metadata_store:
             self._metadata_store[lock_id].expires_at = new_expiry.isoformat()
             self._metadata_store[lock_id].ttl_seconds += additional_seconds
         return True
 
 
+class AsyncExpiryScheduler:
+    """A single event-loop task that expires keys for any number of KeyStores.
+
+    Each attached store reports its earliest deadline; the task sleeps until
+    the soonest across all stores, runs that store's ``_cleanup_expired`` and
+    re-queues its next deadline. At most one live heap entry is kept per
+    store (entries superseded by an earlier deadline are skipped when
+    popped). Deadlines may be reported from any thread. The task starts on
+    the running loop at the first ``attach`` or deadline made from inside
+    it, and restarts if the application moves to a new loop.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, KeyStore]] = []
+        self._scheduled: Dict[int, datetime] = {}  # id(store) -> deadline of its live heap entry
+        self._stores: Dict[int, KeyStore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def attach(self, store: KeyStore) -> None:
+        self._stores[id(store)] = store
+        store._deadline_listener = self._on_deadline
+        deadline = store.next_deadline()
+        if deadline is not None:
+            self._on_deadline(store, deadline)
+
+    def detach(self, store: KeyStore) -> None:
+        if self._stores.pop(id(store), None) is not None:
+            store._deadline_listener = None
+            self._scheduled.pop(id(store), None)
+
+    def _ensure_task(self) -> bool:
+        """Start the task on the running loop, if called from one. Returns True if on that loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if self._loop is not loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        return True
+
+    def _on_deadline(self, store: KeyStore, deadline: datetime) -> None:
+        if self._ensure_task() or self._loop is None or self._loop.is_closed():
+            self._push(store, deadline)
+        else:
+            self._loop.call_soon_threadsafe(self._push, store, deadline)
+
+    def _push(self, store: KeyStore, deadline: datetime) -> None:
+        key = id(store)
+        if key not in self._stores:
+            return
+        current = self._scheduled.get(key)
+        if current is not None and current <= deadline:
+            return
+        self._scheduled[key] = deadline
+        heapq.heappush(self._heap, (deadline, key, store))
+        if self._wakeup is not None and self._heap[0][1] == key:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            now = datetime.now(timezone.utc)
+            # Strictly past, matching KeyStore._cleanup_expired, so a store
+            # never gets re-queued at a deadline it will not yet wipe.
+            while self._heap and self._heap[0][0] < now:
+                deadline, key, store = heapq.heappop(self._heap)
+                if self._scheduled.get(key) != deadline:
+                    continue  # superseded or detached
+                del self._scheduled[key]
+                store._cleanup_expired()
+                following = store.next_deadline()
+                if following is not None:
+                    self._push(store, following)
+            timeout = max(0.0, (self._heap[0][0] - now).total_seconds()) if self._heap else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def close(self) -> None:
+        """Stop the task; stores stay attached and a later deadline restarts it."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class AsyncTimeLockEngine(TimeLockEngine):
+    """TimeLockEngine for asyncio applications, without a daemon thread.
+
+    Key expiry runs on ``scheduler``, an ``AsyncExpiryScheduler`` task that
+    many engines can share (each engine gets its own if none is given).
+    ``encrypt`` and ``decrypt`` are coroutines: AES-GCM runs inline for
+    content up to ``offload_threshold`` bytes and in the default thread
+    pool above it, so large payloads never block the loop.
+
+    After ``open(backend, master_key)`` keys are also written, wrapped, to a
+    ``TimeLockKeyBackend`` so locks survive a restart. ``encrypt``,
+    ``extend_ttl_async`` and ``destroy_async`` return once the backend has
+    the change; the inherited synchronous ``extend_ttl`` / ``destroy`` keep
+    their signatures but raise while a backend is open, since they cannot
+    wait for it. Nothing is read at startup: ``decrypt`` and the async
+    variants load an unknown lock on first use, and callers of the
+    synchronous ``get_status`` / ``get_remaining_time`` await ``load``
+    first. A purge task wipes backend keys as they expire, leaving
+    tombstones that load as EXPIRED.
+    """
+
+    def __init__(
+        self,
+        scheduler: Optional[AsyncExpiryScheduler] = None,
+        offload_threshold: int = 64 * 1024,
+    ):
+        super().__init__(cleanup_interval=None)
+        self.scheduler = scheduler if scheduler is not None else AsyncExpiryScheduler()
+        self.offload_threshold = offload_threshold
+        self.scheduler.attach(self.key_store)
+        self.backend: Optional["TimeLockKeyBackend"] = None
+        self.purge_interval = 60.0
+        self._master_key: Optional[bytes] = None
+        self._purge_task: Optional[asyncio.Task] = None
+        self._purge_wakeup: Optional[asyncio.Event] = None
+        self._purge_at: Optional[datetime] = None
+
+    def shutdown(self):
+        self.scheduler.detach(self.key_store)
+
+    async def open(self, backend: "TimeLockKeyBackend", master_key: bytes, purge_interval: float = 60.0) -> int:
+        """Persist keys to ``backend`` wrapped under ``master_key``.
+
+        Purges already-expired keys and starts the purge task; the purge
+        task sleeps until the backend's earliest expiry, at most
+        ``purge_interval`` seconds. Returns the number of keys purged.
+        """
+        if len(master_key) != 32:
+            raise ValueError("master_key must be 32 bytes")
+        if purge_interval <= 0:
+            raise ValueError("purge_interval must be > 0")
+        self.backend = backend
+        self._master_key = master_key
+        self.purge_interval = purge_interval
+        purged = await backend.purge_expired(datetime.now(timezone.utc))
+        self._purge_wakeup = asyncio.Event()
+        self._purge_task = asyncio.get_running_loop().create_task(self._purge_loop())
+        return purged
+
+    async def close(self) -> None:
+        """Stop the purge task and close the backend; in-memory locks are kept."""
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            try:
+                await self._purge_task
+            except asyncio.CancelledError:
+                pass
+            self._purge_task = None
+        if self.backend is not None:
+            await self.backend.close()
+            self.backend = None
+
+    async def _purge_loop(self) -> None:
+        while True:
+            # Cleared before querying so a lock persisted meanwhile wakes us.
+            self._purge_wakeup.clear()
+            self._purge_at = None
+            next_expiry = None
+            try:
+                await self.backend.purge_expired(datetime.now(timezone.utc))
+                next_expiry = await self.backend.next_expiry()
+            except Exception:
+                logger.exception("Purging expired time-lock keys failed")
+            now = datetime.now(timezone.utc)
+            self._purge_at = now + timedelta(seconds=self.purge_interval)
+            if next_expiry is not None and next_expiry < self._purge_at:
+                self._purge_at = max(now, next_expiry)
+            try:
+                await asyncio.wait_for(self._purge_wakeup.wait(), (self._purge_at - now).total_seconds())
+            except asyncio.TimeoutError:
+                pass
+
+    def _wake_purger(self, expires_at: datetime) -> None:
+        if self._purge_wakeup is not None and (self._purge_at is None or expires_at < self._purge_at):
+            self._purge_wakeup.set()
+
+    async def load(self, lock_id: str) -> bool:
+        """Bring a lock persisted by an earlier process into memory.
+
+        Returns True if the lock is known afterwards. Tombstones load with
+        their final status, and a key that has expired but not yet been
+        purged loads as EXPIRED; neither brings a key into memory.
+        """
+        if lock_id in self._metadata_store:
+            return True
+        if self.backend is None:
+            return False
+        stored = await self.backend.get(lock_id)
+        if stored is None or lock_id in self._metadata_store:  # missing, or loaded meanwhile
+            return lock_id in self._metadata_store
+        metadata = TimeLockMetadata.from_dict(stored.metadata)
+        if stored.wrapped_key is None or stored.expires_at < datetime.now(timezone.utc):
+            metadata.status = "EXPIRED" if stored.wrapped_key is not None else stored.status
+            self._metadata_store[lock_id] = metadata
+            return True
+        key = unwrap_key(self._master_key, lock_id, stored.wrapped_key)
+        self._metadata_store[lock_id] = metadata
+        self.key_store.store_key(lock_id, key, stored.expires_at)
+        return True
+
+    async def encrypt(
+        self,
+        content: str,
+        ttl_seconds: int,
+        on_expire: Optional[Callable[[str], None]] = None
+    ) -> EncryptedContent:
+        key = secrets.token_bytes(32)
+        nonce = secrets.token_bytes(12)
+        created_at = datetime.now(timezone.utc)
+        plaintext = content.encode('utf-8')
+        if len(plaintext) > self.offload_threshold:
+            content_hash, ciphertext = await asyncio.to_thread(_seal, key, nonce, plaintext)
+        else:
+            content_hash, ciphertext = _seal(key, nonce, plaintext)
+        encrypted = self._register(key, nonce, ciphertext, content_hash, created_at, ttl_seconds, on_expire)
+        if self.backend is not None:
+            try:
+                await self._persist(key, encrypted.metadata)
+            except Exception:
+                # Never hand out a lock that would not survive a restart.
+                lock_id = encrypted.metadata.lock_id
+                self.key_store.destroy_key(lock_id)
+                self._metadata_store.pop(lock_id, None)
+                self._callbacks.pop(lock_id, None)
+                raise
+        return encrypted
+
+    async def _persist(self, key: bytes, metadata: TimeLockMetadata) -> None:
+        expires_at = datetime.fromisoformat(metadata.expires_at)
+        wrapped = wrap_key(self._master_key, metadata.lock_id, key)
+        await self.backend.put(metadata.lock_id, wrapped, expires_at, metadata.to_dict())
+        self._wake_purger(expires_at)
+
+    async def decrypt(self, encrypted: EncryptedContent) -> Optional[str]:
+        await self.load(encrypted.metadata.lock_id)
+        key = self._key_for(encrypted)
+        if key is None:
+            return None
+        if len(encrypted.ciphertext) - 16 > self.offload_threshold:  # minus the GCM tag
+            return await asyncio.to_thread(_open, key, encrypted)
+        return _open(key, encrypted)
+
+    def _require_no_backend(self, method: str) -> None:
+        if self.backend is not None:
+            raise RuntimeError(f"{method}() cannot persist to the open backend; await {method}_async()")
+
+    def extend_ttl(self, lock_id: str, additional_seconds: int) -> bool:
+        self._require_no_backend("extend_ttl")
+        return super().extend_ttl(lock_id, additional_seconds)
+
+    def destroy(self, lock_id: str) -> bool:
+        self._require_no_backend("destroy")
+        return super().destroy(lock_id)
+
+    async def extend_ttl_async(self, lock_id: str, additional_seconds: int) -> bool:
+        await self.load(lock_id)
+        old_expiry = self.key_store.get_expiry(lock_id)
+        if not TimeLockEngine.extend_ttl(self, lock_id, additional_seconds):
+            return False
+        if self.backend is None:
+            return True
+        metadata = self._metadata_store[lock_id]
+        try:
+            persisted = await self.backend.update_expiry(
+                lock_id, datetime.fromisoformat(metadata.expires_at), metadata.to_dict()
+            )
+        except Exception:
+            self._undo_extend(lock_id, old_expiry, additional_seconds)
+            raise
+        if not persisted:
+            self._undo_extend(lock_id, old_expiry, additional_seconds)
+        return persisted
+
+    def _undo_extend(self, lock_id: str, old_expiry: datetime, additional_seconds: int) -> None:
+        """The backend kept the old expiry; memory must not outlive it."""
+        new_expiry = self.key_store.get_expiry(lock_id)
+        if new_expiry is not None:
+            self.key_store.extend_expiry(lock_id, old_expiry - new_expiry)
+        metadata = self._metadata_store[lock_id]
+        metadata.expires_at = old_expiry.isoformat()
+        metadata.ttl_seconds -= additional_seconds
+
+    async def destroy_async(self, lock_id: str) -> bool:
+        await self.load(lock_id)
+        # Wipe the durable copy first: a restart must not resurrect the key.
+        if self.backend is not None:
+            await self.backend.destroy(lock_id)
+        return TimeLockEngine.destroy(self, lock_id)
+
+
 class SimulatedTimeLockService:
     """Simulated time-lock service for testing with manual time advancement."""
     
@@ -1,6 +1,7 @@
 """TrustFlow Interfaces - Abstract base classes and default implementations."""
 
-from .storage_backend import StorageBackend, InMemoryStorage, SQLiteStorage
+from .storage_backend import StorageBackend, InMemoryStorage, GraphStorage, SQLiteStorage
+from .graph_snapshot import GraphSnapshot, write_snapshot
 from .notification_handler import (
     NotificationHandler,
     SilentNotificationHandler,
@@ -9,11 +10,15 @@ from .notification_handler import (
 from .peer_discovery import PeerDiscovery, RegistryPeerDiscovery
 from .transfer_monitor import TransferMonitor, NullTransferMonitor
 from .encryption_policy import EncryptionPolicy, NoEncryption
+from .timelock_store import TimeLockKeyBackend, SQLiteTimeLockKeyBackend
 
 __all__ = [
     "StorageBackend",
     "InMemoryStorage",
+    "GraphStorage",
     "SQLiteStorage",
+    "GraphSnapshot",
+    "write_snapshot",
     "NotificationHandler",
     "SilentNotificationHandler",
     "LoggingNotificationHandler",
@@ -23,4 +28,6 @@ __all__ = [
     "NullTransferMonitor",
     "EncryptionPolicy",
     "NoEncryption",
+    "TimeLockKeyBackend",
+    "SQLiteTimeLockKeyBackend",
 ]
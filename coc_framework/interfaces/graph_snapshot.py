@@ -0,0 +1,499 @@
+"""Columnar, memory-mappable snapshots of the CoC graph.
+
+A snapshot is a directory holding one file per table. Each file starts with
+a 16-byte header (magic, format version, row count) followed by fixed-width
+little-endian columns, each padded to an 8-byte boundary, so any column can
+be mapped straight into numpy/Arrow or read through :meth:`GraphSnapshot.column`.
+
+Tables (``K`` keys, ``N`` nodes, ``E`` edges, ``R`` recipients, ``S`` strings):
+
+    keys.col        hash 32s, flags B
+        Every node hash in the graph. Rows ``[0, N)`` are stored nodes sorted
+        by hash, rows ``[N, K)`` are parents/children referenced but absent.
+    nodes.col       content_hash 32s, parent i, owner I, timestamp q, depth i,
+                    schema_version H, flags B, signature 64s,
+                    recipients_end I, children_end I
+        Row ``i`` describes key ``i``. ``parent`` is a key id or -1. Recipients
+        and children are CSR ranges ending at ``*_end[i]`` and starting at the
+        previous row's end.
+    edges.col       parent I, child I       (key ids, grouped by parent)
+    recipients.col  peer I                  (string ids)
+    strings.col     end I, then the UTF-8 blob
+        Peer ids, plus any hash or timestamp that has no packed form (the
+        32-byte slot / timestamp column then holds the string id).
+
+Usage:
+    write_snapshot(storage, "graph.snap")     # any StorageBackend or node iterable
+    with GraphSnapshot("graph.snap") as graph:
+        graph.descendants(root_hash)
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from coc_framework.core.coc_node import CoCNode, PackedHash, pack_hash, unpack_hash
+from .storage_backend import ContentTombstone, StorageBackend
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+_MAGIC = b"COCSNAP\x00"
+_HEADER = struct.Struct("<8sHHI")
+_ALIGN = 8
+_HASH_WIDTH = 32
+_SIGNATURE_WIDTH = 64
+_NO_PARENT = -1
+_READ_ONLY = "GraphSnapshot is read-only"
+
+# keys.flags / nodes.flags
+KEY_STRING = 0x01
+NODE_CONTENT_STRING = 0x01
+NODE_TIMESTAMP_STRING = 0x02
+NODE_SIGNED = 0x04
+
+TABLES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "keys": (("hash", "32s"), ("flags", "B")),
+    "nodes": (
+        ("content_hash", "32s"),
+        ("parent", "i"),
+        ("owner", "I"),
+        ("timestamp", "q"),
+        ("depth", "i"),
+        ("schema_version", "H"),
+        ("flags", "B"),
+        ("signature", "64s"),
+        ("recipients_end", "I"),
+        ("children_end", "I"),
+    ),
+    "edges": (("parent", "I"), ("child", "I")),
+    "recipients": (("peer", "I"),),
+    "strings": (("end", "I"),),
+}
+
+
+def _column_width(code: str) -> int:
+    return int(code[:-1]) if code.endswith("s") else struct.calcsize(code)
+
+
+def _padded(size: int) -> int:
+    return -(-size // _ALIGN) * _ALIGN
+
+
+def _column_bytes(column) -> bytes:
+    if isinstance(column, array):
+        if sys.byteorder != "little":
+            column = array(column.typecode, column)
+            column.byteswap()
+        return column.tobytes()
+    return bytes(column)
+
+
+class _StringTable:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.ends = array("I")
+        self.blob = bytearray()
+
+    def intern(self, value: str) -> int:
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = len(self.ends)
+            self.ids[value] = string_id
+            self.blob += value.encode("utf-8")
+            self.ends.append(len(self.blob))
+        return string_id
+
+
+def _write_table(path: str, table: str, rows: int, columns: Dict[str, object], tail: bytes = b"") -> None:
+    with open(os.path.join(path, f"{table}.col"), "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, SNAPSHOT_FORMAT_VERSION, 0, rows))
+        for name, code in TABLES[table]:
+            data = _column_bytes(columns[name])
+            if len(data) != rows * _column_width(code):
+                raise ValueError(f"{table}.{name}: expected {rows} rows")
+            f.write(data)
+            f.write(b"\x00" * (_padded(len(data)) - len(data)))
+        f.write(tail)
+
+
+def write_snapshot(source: Union[StorageBackend, Iterable[CoCNode]], path: str) -> int:
+    """Write every node of ``source`` as a snapshot directory at ``path``.
+
+    ``source`` may be any synchronous ``StorageBackend`` or an iterable of
+    nodes (e.g. ``await postgres_backend.get_all_nodes()``). Returns the
+    number of nodes written.
+    """
+    nodes_in = source.get_all_nodes() if isinstance(source, StorageBackend) else source
+    by_key: Dict[PackedHash, CoCNode] = {}
+    for node in nodes_in:
+        if node.packed_node_hash is None:
+            raise ValueError("Cannot snapshot a node without a node_hash")
+        by_key[node.packed_node_hash] = node
+
+    strings = _StringTable()
+
+    def slot(value: PackedHash) -> Tuple[bytes, int]:
+        if type(value) is bytes and len(value) == _HASH_WIDTH:
+            return value, 0
+        return struct.pack("<I", strings.intern(value)).ljust(_HASH_WIDTH, b"\x00"), KEY_STRING
+
+    present = sorted(by_key, key=slot)
+    referenced = set()
+    for node in by_key.values():
+        if node.packed_parent_hash is not None:
+            referenced.add(node.packed_parent_hash)
+        referenced.update(node.packed_children)
+    external = sorted((k for k in referenced if k not in by_key), key=slot)
+
+    keys = present + external
+    ids = {key: i for i, key in enumerate(keys)}
+    key_hashes, key_flags = bytearray(), array("B")
+    for key in keys:
+        raw, flag = slot(key)
+        key_hashes += raw
+        key_flags.append(flag)
+
+    cols = {name: array(code) for name, code in TABLES["nodes"] if not code.endswith("s")}
+    content_hashes, signatures = bytearray(), bytearray()
+    edge_parents, edge_children, recipients = array("I"), array("I"), array("I")
+    for node_id, key in enumerate(present):
+        node = by_key[key]
+        flags = 0
+        raw, flag = slot(node.packed_content_hash)
+        content_hashes += raw
+        if flag:
+            flags |= NODE_CONTENT_STRING
+        micros = node.timestamp_micros
+        if micros is None:
+            micros = strings.intern(node.timestamp)
+            flags |= NODE_TIMESTAMP_STRING
+        if node.signature:
+            if len(node.signature) != _SIGNATURE_WIDTH:
+                raise ValueError(f"Unsupported signature length {len(node.signature)} for {node!r}")
+            signatures += node.signature
+            flags |= NODE_SIGNED
+        else:
+            signatures += bytes(_SIGNATURE_WIDTH)
+
+        parent = node.packed_parent_hash
+        cols["parent"].append(_NO_PARENT if parent is None else ids[parent])
+        cols["owner"].append(strings.intern(node.owner_id))
+        cols["timestamp"].append(micros)
+        cols["depth"].append(node.depth)
+        cols["schema_version"].append(node.schema_version)
+        cols["flags"].append(flags)
+        recipients.extend(strings.intern(peer) for peer in node.recipient_ids)
+        cols["recipients_end"].append(len(recipients))
+        for child in node.packed_children:
+            edge_parents.append(node_id)
+            edge_children.append(ids[child])
+        cols["children_end"].append(len(edge_children))
+
+    os.makedirs(path, exist_ok=True)
+    _write_table(path, "keys", len(keys), {"hash": key_hashes, "flags": key_flags})
+    _write_table(path, "nodes", len(present), {
+        **cols, "content_hash": content_hashes, "signature": signatures,
+    })
+    _write_table(path, "edges", len(edge_children), {"parent": edge_parents, "child": edge_children})
+    _write_table(path, "recipients", len(recipients), {"peer": recipients})
+    _write_table(path, "strings", len(strings.ends), {"end": strings.ends}, bytes(strings.blob))
+    return len(present)
+
+
+class GraphSnapshot(StorageBackend):
+    """Read-only ``StorageBackend`` over a memory-mapped snapshot.
+
+    Opening maps the files and slices column views; nothing is decoded until
+    a node is requested, so start-up cost does not depend on graph size.
+    Offers the same traversal methods as ``GraphStorage``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._maps: List[mmap.mmap] = []
+        self._views: List[memoryview] = []
+        self._columns: Dict[Tuple[str, str], memoryview] = {}
+        self._rows: Dict[str, int] = {}
+        self._tails: Dict[str, memoryview] = {}
+        try:
+            for table in TABLES:
+                self._map_table(table)
+        except Exception:
+            self.close()
+            raise
+
+        self._node_count = self._rows["nodes"]
+        self._key_hashes = self.column("keys", "hash")
+        self._key_flags = self.column("keys", "flags")
+        self._content = self.column("nodes", "content_hash")
+        self._parent = self.column("nodes", "parent")
+        self._owner = self.column("nodes", "owner")
+        self._timestamp = self.column("nodes", "timestamp")
+        self._depth = self.column("nodes", "depth")
+        self._schema = self.column("nodes", "schema_version")
+        self._flags = self.column("nodes", "flags")
+        self._signature = self.column("nodes", "signature")
+        self._recipients_end = self.column("nodes", "recipients_end")
+        self._children_end = self.column("nodes", "children_end")
+        self._edge_child = self.column("edges", "child")
+        self._recipients = self.column("recipients", "peer")
+        self._string_end = self.column("strings", "end")
+        self._blob = self._tails["strings"]
+        self._strings: List[Optional[str]] = [None] * self._rows["strings"]
+        self._string_keys: Optional[Dict[str, int]] = None
+        self._content_index: Optional[Dict[PackedHash, List[int]]] = None
+
+    def _map_table(self, table: str) -> None:
+        with open(os.path.join(self.path, f"{table}.col"), "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        view = memoryview(mapped)
+        self._views.append(view)
+        magic, version, _, rows = _HEADER.unpack_from(view)
+        if magic != _MAGIC:
+            raise ValueError(f"{table}.col is not a CoC graph snapshot")
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version: {version}")
+        self._rows[table] = rows
+        offset = _HEADER.size
+        for name, code in TABLES[table]:
+            size = rows * _column_width(code)
+            if offset + size > len(view):
+                raise ValueError(f"{table}.col is truncated")
+            column = view[offset:offset + size]
+            if not code.endswith("s"):
+                column = column.cast(code)
+                if sys.byteorder != "little":
+                    swapped = array(code, column)
+                    swapped.byteswap()
+                    column = memoryview(swapped)
+            self._views.append(column)
+            self._columns[(table, name)] = column
+            offset += _padded(size)
+        self._tails[table] = view[offset:]
+        self._views.append(self._tails[table])
+
+    def column(self, table: str, name: str) -> memoryview:
+        """Zero-copy view of one column (fixed-width byte columns stay flat)."""
+        return self._columns[(table, name)]
+
+    def close(self) -> None:
+        """Release the mappings. Views obtained from ``column()`` must be released first."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._columns.clear()
+        self._tails.clear()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps.clear()
+
+    def __enter__(self) -> "GraphSnapshot":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._node_count
+
+    # -- decoding ---------------------------------------------------------
+
+    def _string(self, string_id: int) -> str:
+        value = self._strings[string_id]
+        if value is None:
+            start = self._string_end[string_id - 1] if string_id else 0
+            value = str(self._blob[start:self._string_end[string_id]], "utf-8")
+            self._strings[string_id] = value
+        return value
+
+    def _unslot(self, raw: memoryview, is_string: bool) -> PackedHash:
+        if is_string:
+            return self._string(struct.unpack_from("<I", raw)[0])
+        return bytes(raw)
+
+    def _key(self, key_id: int) -> PackedHash:
+        start = key_id * _HASH_WIDTH
+        return self._unslot(
+            self._key_hashes[start:start + _HASH_WIDTH], self._key_flags[key_id] & KEY_STRING
+        )
+
+    def _node(self, node_id: int) -> CoCNode:
+        flags = self._flags[node_id]
+        start = node_id * _HASH_WIDTH
+        content = self._unslot(self._content[start:start + _HASH_WIDTH], flags & NODE_CONTENT_STRING)
+        timestamp = self._timestamp[node_id]
+        if flags & NODE_TIMESTAMP_STRING:
+            timestamp = self._string(timestamp)
+        signature = None
+        if flags & NODE_SIGNED:
+            start = node_id * _SIGNATURE_WIDTH
+            signature = bytes(self._signature[start:start + _SIGNATURE_WIDTH])
+        parent = self._parent[node_id]
+        recipients_start = self._recipients_end[node_id - 1] if node_id else 0
+        children_start = self._children_end[node_id - 1] if node_id else 0
+        return CoCNode.from_packed(
+            node_hash=self._key(node_id),
+            content_hash=content,
+            parent_hash=None if parent == _NO_PARENT else self._key(parent),
+            owner_id=self._string(self._owner[node_id]),
+            recipient_ids=[
+                self._string(r)
+                for r in self._recipients[recipients_start:self._recipients_end[node_id]]
+            ],
+            timestamp=timestamp,
+            children=tuple(
+                self._key(c)
+                for c in self._edge_child[children_start:self._children_end[node_id]]
+            ),
+            depth=self._depth[node_id],
+            signature=signature,
+            schema_version=self._schema[node_id],
+        )
+
+    def _child_ids(self, node_id: int) -> memoryview:
+        start = self._children_end[node_id - 1] if node_id else 0
+        return self._edge_child[start:self._children_end[node_id]]
+
+    # -- lookups ----------------------------------------------------------
+
+    def node_id(self, node_hash: str) -> Optional[int]:
+        """Row id of a stored node, or None."""
+        key = pack_hash(node_hash)
+        if type(key) is not bytes:
+            if self._string_keys is None:
+                self._string_keys = {
+                    self._key(i): i for i in range(self._node_count) if self._key_flags[i] & KEY_STRING
+                }
+            return self._string_keys.get(key)
+        hashes, flags = self._key_hashes, self._key_flags
+        lo, hi = 0, self._node_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if hashes[mid * _HASH_WIDTH:(mid + 1) * _HASH_WIDTH].tobytes() < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        while lo < self._node_count and hashes[lo * _HASH_WIDTH:(lo + 1) * _HASH_WIDTH] == key:
+            if not flags[lo] & KEY_STRING:
+                return lo
+            lo += 1
+        return None
+
+    def get_node(self, node_hash: str) -> Optional[CoCNode]:
+        node_id = self.node_id(node_hash)
+        return None if node_id is None else self._node(node_id)
+
+    def get_all_nodes(self) -> List[CoCNode]:
+        return [self._node(i) for i in range(self._node_count)]
+
+    def children_of(self, node_hash: str) -> List[str]:
+        node_id = self.node_id(node_hash)
+        if node_id is None:
+            return []
+        return [unpack_hash(self._key(c)) for c in self._child_ids(node_id) if c < self._node_count]
+
+    def _descendant_ids(self, root_id: int) -> List[int]:
+        ends, edge_child, node_count = self._children_end, self._edge_child, self._node_count
+        result = []
+        # A corrupt file could encode a cycle: visit each node at most once.
+        visited = bytearray(node_count)
+        stack = [root_id]
+        while stack:
+            current = stack.pop()
+            if visited[current]:
+                continue
+            visited[current] = 1
+            start = ends[current - 1] if current else 0
+            for child in reversed(edge_child[start:ends[current]].tolist()):
+                if child < node_count and not visited[child]:
+                    stack.append(child)
+            result.append(current)
+        return result[1:]
+
+    def descendants(self, node_hash: str) -> List[CoCNode]:
+        """All stored nodes below ``node_hash`` in depth-first pre-order."""
+        node_id = self.node_id(node_hash)
+        if node_id is None:
+            return []
+        return [self._node(i) for i in self._descendant_ids(node_id)]
+
+    def _ancestor_ids(self, node_id: int) -> List[int]:
+        result = []
+        current = self._parent[node_id]
+        # A hash chain cannot loop, but bound the walk in case of corrupt input.
+        for _ in range(self._node_count):
+            if current == _NO_PARENT or current >= self._node_count:
+                break
+            result.append(current)
+            current = self._parent[current]
+        return result
+
+    def ancestors(self, node_hash: str) -> List[CoCNode]:
+        """Stored ancestors of ``node_hash``, nearest first."""
+        node_id = self.node_id(node_hash)
+        if node_id is None:
+            return []
+        return [self._node(i) for i in self._ancestor_ids(node_id)]
+
+    def root_of(self, node_hash: str) -> Optional[CoCNode]:
+        """Topmost stored ancestor of ``node_hash`` (the node itself if it has none)."""
+        node_id = self.node_id(node_hash)
+        if node_id is None:
+            return None
+        chain = self._ancestor_ids(node_id)
+        return self._node(chain[-1] if chain else node_id)
+
+    def subtree_size(self, node_hash: str) -> int:
+        """Number of stored nodes in the subtree rooted at ``node_hash``, including it."""
+        node_id = self.node_id(node_hash)
+        if node_id is None:
+            return 0
+        return 1 + len(self._descendant_ids(node_id))
+
+    def get_nodes_by_content(self, content_hash: str) -> List[CoCNode]:
+        if self._content_index is None:
+            index: Dict[PackedHash, List[int]] = {}
+            for i in range(self._node_count):
+                start = i * _HASH_WIDTH
+                raw = self._content[start:start + _HASH_WIDTH]
+                index.setdefault(self._unslot(raw, self._flags[i] & NODE_CONTENT_STRING), []).append(i)
+            self._content_index = index
+        return [self._node(i) for i in self._content_index.get(pack_hash(content_hash), ())]
+
+    def is_content_referenced(self, content_hash: str) -> bool:
+        return bool(self.get_nodes_by_content(content_hash))
+
+    # -- StorageBackend: snapshots carry no content or tombstones ----------
+
+    def add_node(self, node: CoCNode) -> None:
+        raise PermissionError(_READ_ONLY)
+
+    def remove_node(self, node_hash: str) -> None:
+        raise PermissionError(_READ_ONLY)
+
+    def add_content(self, content_hash: str, content: str) -> None:
+        raise PermissionError(_READ_ONLY)
+
+    def get_content(self, content_hash: str) -> Optional[str]:
+        return None
+
+    def remove_content(self, content_hash: str) -> None:
+        raise PermissionError(_READ_ONLY)
+
+    def add_tombstone(self, tombstone: ContentTombstone) -> None:
+        raise PermissionError(_READ_ONLY)
+
+    def get_tombstone(self, content_hash: str) -> Optional[ContentTombstone]:
+        return None
+
+    def is_tombstoned(self, content_hash: str) -> bool:
+        return False
+
+    def cleanup_expired_tombstones(self) -> int:
+        return 0
@@ -1,8 +1,16 @@
 import asyncio
-from typing import List, Optional
+import json
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
 from datetime import datetime, timezone
 
 from coc_framework.interfaces.storage_backend import StorageBackend, ContentTombstone
+from coc_framework.interfaces.timelock_store import (
+    STATUS_ACTIVE,
+    STATUS_DESTROYED,
+    STATUS_EXPIRED,
+    StoredKey,
+    TimeLockKeyBackend,
+)
 from coc_framework.core.coc_node import CoCNode
 from trustdocs import database as db
 import logging
@@ -19,6 +27,122 @@ def _parse_ts(ts_value) -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Hard cap for recursive subtree walks; CoC chains are acyclic but a corrupt
+# parent_hash must not be able to make the CTE run forever.
+DEFAULT_SUBTREE_MAX_DEPTH = 1024
+
+_SUBTREE_SQL = """
+    WITH RECURSIVE subtree AS (
+        SELECT n.*, 0 AS level
+        FROM coc_nodes n
+        WHERE n.node_hash = $1
+        UNION ALL
+        SELECT c.*, s.level + 1
+        FROM coc_nodes c
+        JOIN subtree s ON c.parent_hash = s.node_hash
+        WHERE s.level < $2
+    )
+    SELECT
+        s.node_hash, s.content_hash, s.parent_hash, s.owner_peer_id,
+        s.signature, s.depth, s.schema_version, s.created_at, s.level,
+        COALESCE(
+            (SELECT array_agg(r.recipient_peer_id) FROM coc_recipients r
+             WHERE r.node_hash = s.node_hash),
+            '{}'
+        ) AS recipient_ids,
+        COALESCE(
+            (SELECT array_agg(ch.node_hash) FROM coc_nodes ch
+             WHERE ch.parent_hash = s.node_hash),
+            '{}'
+        ) AS children_hashes
+    FROM subtree s
+    ORDER BY s.level, s.created_at
+"""
+
+
+# All nodes with recipients and children aggregated server-side, so the
+# whole graph hydrates in a single round-trip instead of 3N queries.
+_ALL_NODES_SQL = """
+    SELECT
+        n.node_hash, n.content_hash, n.parent_hash, n.owner_peer_id,
+        n.signature, n.depth, n.schema_version, n.created_at,
+        COALESCE(r.recipient_ids, '{}') AS recipient_ids,
+        COALESCE(c.children_hashes, '{}') AS children_hashes
+    FROM coc_nodes n
+    LEFT JOIN (
+        SELECT node_hash, array_agg(recipient_peer_id) AS recipient_ids
+        FROM coc_recipients
+        GROUP BY node_hash
+    ) r ON r.node_hash = n.node_hash
+    LEFT JOIN (
+        SELECT parent_hash, array_agg(node_hash) AS children_hashes
+        FROM coc_nodes
+        WHERE parent_hash IS NOT NULL
+        GROUP BY parent_hash
+    ) c ON c.parent_hash = n.node_hash
+    ORDER BY n.created_at, n.node_hash
+"""
+
+DEFAULT_NODE_BATCH_SIZE = 1000
+
+# Batches at least this large are loaded with COPY into a staging table;
+# smaller ones use a pipelined executemany.
+BULK_COPY_THRESHOLD = 500
+
+_NODE_COLUMNS = (
+    "node_hash", "content_hash", "parent_hash", "owner_peer_id",
+    "signature", "depth", "schema_version", "created_at",
+)
+_RECIPIENT_COLUMNS = ("node_hash", "recipient_peer_id")
+
+_INSERT_NODE_SQL = """
+    INSERT INTO coc_nodes
+        (node_hash, content_hash, parent_hash, owner_peer_id, signature, depth, schema_version, created_at)
+    VALUES ($1,$2,$3,$4,$5,$6,$7,$8)
+    ON CONFLICT (node_hash) DO NOTHING
+"""
+
+# Recipient rows for unknown nodes are skipped rather than failing the
+# whole transaction on the foreign key.
+_INSERT_RECIPIENT_SQL = """
+    INSERT INTO coc_recipients (node_hash, recipient_peer_id)
+    SELECT $1, $2
+    WHERE EXISTS (SELECT 1 FROM coc_nodes WHERE node_hash = $1)
+    ON CONFLICT DO NOTHING
+"""
+
+
+def _node_record(node: CoCNode) -> tuple:
+    return (
+        node.node_hash,
+        node.content_hash,
+        node.parent_hash,
+        node.owner_id,
+        node.signature.hex() if node.signature else None,
+        node.depth,
+        node.schema_version,
+        _parse_ts(node.timestamp),
+    )
+
+
+def _row_to_node(row, recipient_ids: Iterable[str], children_hashes: Iterable[str]) -> CoCNode:
+    """Build a CoCNode from a coc_nodes row plus its recipients and children."""
+    created_at = row["created_at"]
+    node_dict = {
+        "schema_version": row["schema_version"],
+        "node_hash": row["node_hash"],
+        "content_hash": row["content_hash"],
+        "parent_hash": row["parent_hash"],
+        "owner_id": row["owner_peer_id"],
+        "recipient_ids": list(recipient_ids),
+        "timestamp": created_at.isoformat() if isinstance(created_at, datetime) else str(created_at),
+        "children_hashes": list(children_hashes),
+        "depth": row["depth"],
+        "signature": row["signature"]
+    }
+    return CoCNode.from_dict(node_dict)
+
+
 class PostgresStorageBackend:
     """PostgreSQL implementation of the CoC graph backend.
     
@@ -26,32 +150,61 @@ class PostgresStorageBackend:
     """
 
     async def add_node(self, node: CoCNode) -> None:
+        await self.add_nodes_bulk([node])
+
+    async def add_nodes_bulk(
+        self,
+        nodes: Sequence[CoCNode],
+        recipient_links: Iterable[Tuple[str, str]] = (),
+    ) -> None:
+        """Insert many nodes and their recipients in one transaction.
+
+        ``recipient_links`` are extra ``(node_hash, recipient_peer_id)`` rows,
+        e.g. recipients added to an existing parent by a share. Existing nodes
+        and recipient rows are left untouched.
+        """
+        node_records = list({n.node_hash: _node_record(n) for n in nodes}.values())
+        recipient_records = list(dict.fromkeys(
+            [(n.node_hash, pid) for n in nodes for pid in n.recipient_ids]
+            + list(recipient_links)
+        ))
+        if not node_records and not recipient_records:
+            return
         try:
-            ts = _parse_ts(node.timestamp)
             async with db._pool.acquire() as conn:
-                await conn.execute("""
-                    INSERT INTO coc_nodes
-                        (node_hash, content_hash, parent_hash, owner_peer_id, signature, depth, schema_version, created_at)
-                    VALUES ($1,$2,$3,$4,$5,$6,$7,$8)
-                    ON CONFLICT (node_hash) DO NOTHING
-                """,
-                    node.node_hash,
-                    node.content_hash,
-                    node.parent_hash,
-                    node.owner_id,
-                    node.signature.hex() if node.signature else None,
-                    node.depth,
-                    node.schema_version,
-                    ts,
-                )
-                for pid in node.recipient_ids:
-                    await conn.execute("""
-                        INSERT INTO coc_recipients (node_hash, recipient_peer_id)
-                        VALUES ($1, $2)
-                        ON CONFLICT DO NOTHING
-                    """, node.node_hash, pid)
+                async with conn.transaction():
+                    if len(node_records) + len(recipient_records) >= BULK_COPY_THRESHOLD:
+                        await self._copy_with_conflicts(
+                            conn, "coc_nodes", _NODE_COLUMNS, node_records,
+                            "ON CONFLICT (node_hash) DO NOTHING",
+                        )
+                        await self._copy_with_conflicts(
+                            conn, "coc_recipients", _RECIPIENT_COLUMNS, recipient_records,
+                            "WHERE node_hash IN (SELECT node_hash FROM coc_nodes) "
+                            "ON CONFLICT DO NOTHING",
+                        )
+                    else:
+                        if node_records:
+                            await conn.executemany(_INSERT_NODE_SQL, node_records)
+                        if recipient_records:
+                            await conn.executemany(_INSERT_RECIPIENT_SQL, recipient_records)
         except Exception as e:
-            logger.error(f"add_node failed for {getattr(node, 'node_hash', '?')}: {e}", exc_info=True)
+            logger.error(f"add_nodes_bulk failed for {len(node_records)} nodes: {e}", exc_info=True)
+
+    @staticmethod
+    async def _copy_with_conflicts(conn, table: str, columns, records, merge_clause: str) -> None:
+        """COPY records into a temp staging table, then merge them into ``table``."""
+        if not records:
+            return
+        stage = f"_stage_{table}"
+        cols = ", ".join(columns)
+        await conn.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        await conn.copy_records_to_table(stage, records=records, columns=list(columns))
+        await conn.execute(
+            f"INSERT INTO {table} ({cols}) SELECT {cols} FROM {stage} {merge_clause}"
+        )
 
     async def get_node(self, node_hash: str) -> Optional[CoCNode]:
         row = await db.find_one("coc_nodes", node_hash=node_hash)
@@ -80,34 +233,54 @@ class PostgresStorageBackend:
         except Exception:
             children_hashes = []
 
-        created_at = row["created_at"]
-        node_dict = {
-            "schema_version": row["schema_version"],
-            "node_hash": row["node_hash"],
-            "content_hash": row["content_hash"],
-            "parent_hash": row["parent_hash"],
-            "owner_id": row["owner_peer_id"],
-            "recipient_ids": recipients_list,
-            "timestamp": created_at.isoformat() if isinstance(created_at, datetime) else str(created_at),
-            "children_hashes": children_hashes,
-            "depth": row["depth"],
-            "signature": row["signature"]
-        }
-        return CoCNode.from_dict(node_dict)
+        return _row_to_node(row, recipients_list, children_hashes)
+
+    async def get_subtree(
+        self, root_hash: str, max_depth: Optional[int] = None
+    ) -> List[CoCNode]:
+        """Fetch ``root_hash`` and its descendants (with recipients and children) in one query.
+
+        Nodes are returned breadth-first, root first. ``max_depth`` limits how
+        many levels below the root are included; children_hashes always lists
+        every child so edges past the cut-off are still visible.
+        """
+        depth_limit = DEFAULT_SUBTREE_MAX_DEPTH if max_depth is None else max(0, int(max_depth))
+        try:
+            async with db._pool.acquire() as conn:
+                rows = await conn.fetch(_SUBTREE_SQL, root_hash, depth_limit)
+        except Exception as e:
+            logger.error(f"get_subtree failed for {root_hash}: {e}")
+            return []
+        return [
+            _row_to_node(row, row["recipient_ids"] or [], row["children_hashes"] or [])
+            for row in rows
+        ]
 
     async def get_all_nodes(self) -> List[CoCNode]:
         try:
             async with db._pool.acquire() as conn:
-                rows = await conn.fetch("SELECT node_hash FROM coc_nodes ORDER BY created_at")
+                rows = await conn.fetch(_ALL_NODES_SQL)
         except Exception as e:
             logger.error(f"get_all_nodes failed: {e}")
             return []
-        nodes = []
-        for row in rows:
-            node = await self.get_node(row["node_hash"])
-            if node:
-                nodes.append(node)
-        return nodes
+        return [
+            _row_to_node(row, row["recipient_ids"] or [], row["children_hashes"] or [])
+            for row in rows
+        ]
+
+    async def iter_all_nodes(
+        self, batch_size: int = DEFAULT_NODE_BATCH_SIZE
+    ) -> AsyncIterator[CoCNode]:
+        """Stream every node through a server-side cursor, ``batch_size`` rows at a time.
+
+        Holds one pooled connection for the duration of the iteration.
+        """
+        async with db._pool.acquire() as conn:
+            async with conn.transaction():
+                async for row in conn.cursor(_ALL_NODES_SQL, prefetch=batch_size):
+                    yield _row_to_node(
+                        row, row["recipient_ids"] or [], row["children_hashes"] or []
+                    )
 
     async def add_content(self, content_hash: str, content: str) -> None:
         # File payload storage is fully offloaded to the filesystem by TrustDocs API.
@@ -141,3 +314,78 @@ class PostgresStorageBackend:
             row["delete_after"] = row["delete_after"].isoformat() if isinstance(row["delete_after"], datetime) else row["delete_after"]
             return ContentTombstone.from_dict(row)
         return None
+
+
+def _status_count(status: str) -> int:
+    """Row count from an asyncpg command tag such as ``DELETE 3``."""
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except (AttributeError, ValueError):
+        return 0
+
+
+class PostgresTimeLockKeyBackend(TimeLockKeyBackend):
+    """Time-lock key backend on the TrustDocs asyncpg pool (``timelock_keys`` table).
+
+    Wiped keys stay as tombstones; only live keys are in the partial expiry index.
+    """
+
+    async def put(self, lock_id: str, wrapped_key: bytes, expires_at: datetime, metadata: Dict) -> None:
+        async with db._pool.acquire() as conn:
+            await conn.execute("""
+                INSERT INTO timelock_keys (lock_id, wrapped_key, expires_at, metadata, status)
+                VALUES ($1, $2, $3, $4::jsonb, $5)
+                ON CONFLICT (lock_id) DO UPDATE
+                SET wrapped_key = EXCLUDED.wrapped_key,
+                    expires_at = EXCLUDED.expires_at,
+                    metadata = EXCLUDED.metadata,
+                    status = EXCLUDED.status
+            """, lock_id, wrapped_key, expires_at, json.dumps(metadata), STATUS_ACTIVE)
+
+    async def get(self, lock_id: str) -> Optional[StoredKey]:
+        async with db._pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT wrapped_key, expires_at, metadata, status FROM timelock_keys WHERE lock_id = $1",
+                lock_id,
+            )
+        if row is None:
+            return None
+        metadata = row["metadata"]
+        if isinstance(metadata, str):
+            metadata = json.loads(metadata)
+        wrapped_key = bytes(row["wrapped_key"]) if row["wrapped_key"] is not None else None
+        return StoredKey(wrapped_key, _parse_ts(row["expires_at"]), metadata, row["status"])
+
+    async def update_expiry(self, lock_id: str, expires_at: datetime, metadata: Dict) -> bool:
+        async with db._pool.acquire() as conn:
+            status = await conn.execute(
+                "UPDATE timelock_keys SET expires_at = $2, metadata = $3::jsonb "
+                "WHERE lock_id = $1 AND wrapped_key IS NOT NULL",
+                lock_id, expires_at, json.dumps(metadata),
+            )
+        return _status_count(status) > 0
+
+    async def destroy(self, lock_id: str) -> bool:
+        async with db._pool.acquire() as conn:
+            status = await conn.execute(
+                "UPDATE timelock_keys SET wrapped_key = NULL, status = $2 "
+                "WHERE lock_id = $1 AND wrapped_key IS NOT NULL",
+                lock_id, STATUS_DESTROYED,
+            )
+        return _status_count(status) > 0
+
+    async def purge_expired(self, now: datetime) -> int:
+        async with db._pool.acquire() as conn:
+            status = await conn.execute(
+                "UPDATE timelock_keys SET wrapped_key = NULL, status = $2 "
+                "WHERE wrapped_key IS NOT NULL AND expires_at < $1",
+                now, STATUS_EXPIRED,
+            )
+        return _status_count(status)
+
+    async def next_expiry(self) -> Optional[datetime]:
+        async with db._pool.acquire() as conn:
+            value = await conn.fetchval(
+                "SELECT MIN(expires_at) FROM timelock_keys WHERE wrapped_key IS NOT NULL"
+            )
+        return None if value is None else _parse_ts(value)
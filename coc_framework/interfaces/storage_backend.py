@@ -1,13 +1,17 @@
 """Storage Backend interfaces and implementations."""
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from typing import Dict, Optional, List, Set
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
+from functools import lru_cache
 import json
 import sqlite3
+import struct
+import time
 
-from coc_framework.core.coc_node import CoCNode
+from coc_framework.core.coc_node import CoCNode, PackedHash, pack_hash, unpack_hash
 
 
 # Default tombstone grace period: content stays tombstoned for this long
@@ -105,42 +109,50 @@ class StorageBackend(ABC):
 
 
 class InMemoryStorage(StorageBackend):
-    """In-memory storage with O(1) content reference lookups via reverse index."""
+    """In-memory storage with O(1) content reference lookups via reverse index.
+
+    Node indexes are keyed by packed hashes (see ``coc_node.pack_hash``).
+    """
 
     def __init__(self):
-        self._nodes: Dict[str, CoCNode] = {}
+        self._nodes: Dict[PackedHash, CoCNode] = {}
         self._content: Dict[str, str] = {}
-        self._content_refs: Dict[str, Set[str]] = {}  # content_hash -> node_hashes
+        self._content_refs: Dict[PackedHash, Set[PackedHash]] = {}  # content_hash -> node_hashes
         self._tombstones: Dict[str, ContentTombstone] = {}  # content_hash -> tombstone
 
     def add_node(self, node: CoCNode) -> None:
-        if node.node_hash in self._nodes:
-            old_node = self._nodes[node.node_hash]
-            if old_node.content_hash in self._content_refs:
-                self._content_refs[old_node.content_hash].discard(node.node_hash)
-                if not self._content_refs[old_node.content_hash]:
-                    del self._content_refs[old_node.content_hash]
+        node_key = node.packed_node_hash
+        if node_key in self._nodes:
+            old_node = self._nodes[node_key]
+            refs = self._content_refs.get(old_node.packed_content_hash)
+            if refs is not None:
+                refs.discard(node_key)
+                if not refs:
+                    del self._content_refs[old_node.packed_content_hash]
         
-        self._nodes[node.node_hash] = node
+        self._nodes[node_key] = node
         
-        if node.content_hash not in self._content_refs:
-            self._content_refs[node.content_hash] = set()
-        self._content_refs[node.content_hash].add(node.node_hash)
+        content_key = node.packed_content_hash
+        if content_key not in self._content_refs:
+            self._content_refs[content_key] = set()
+        self._content_refs[content_key].add(node_key)
 
     def store_node(self, node: CoCNode) -> None:
         self.add_node(node)
 
     def get_node(self, node_hash: str) -> Optional[CoCNode]:
-        return self._nodes.get(node_hash)
+        return self._nodes.get(pack_hash(node_hash))
 
     def remove_node(self, node_hash: str) -> None:
-        if node_hash in self._nodes:
-            node = self._nodes[node_hash]
-            if node.content_hash in self._content_refs:
-                self._content_refs[node.content_hash].discard(node_hash)
-                if not self._content_refs[node.content_hash]:
-                    del self._content_refs[node.content_hash]
-            del self._nodes[node_hash]
+        node_key = pack_hash(node_hash)
+        if node_key in self._nodes:
+            node = self._nodes[node_key]
+            refs = self._content_refs.get(node.packed_content_hash)
+            if refs is not None:
+                refs.discard(node_key)
+                if not refs:
+                    del self._content_refs[node.packed_content_hash]
+            del self._nodes[node_key]
 
     def get_all_nodes(self) -> List[CoCNode]:
         return list(self._nodes.values())
@@ -159,12 +171,13 @@ class InMemoryStorage(StorageBackend):
             del self._content[content_hash]
 
     def is_content_referenced(self, content_hash: str) -> bool:
-        return content_hash in self._content_refs and len(self._content_refs[content_hash]) > 0
+        return bool(self._content_refs.get(pack_hash(content_hash)))
 
     def get_nodes_by_content(self, content_hash: str) -> List[CoCNode]:
-        if content_hash not in self._content_refs:
+        refs = self._content_refs.get(pack_hash(content_hash))
+        if not refs:
             return []
-        return [self._nodes[nh] for nh in self._content_refs[content_hash] if nh in self._nodes]
+        return [self._nodes[nh] for nh in refs if nh in self._nodes]
 
     def add_tombstone(self, tombstone: ContentTombstone) -> None:
         self._tombstones[tombstone.content_hash] = tombstone
@@ -190,20 +203,268 @@ class InMemoryStorage(StorageBackend):
         return list(self._tombstones.values())
 
 
-SQLITE_SCHEMA_VERSION = 2
+_NO_PARENT = -1
+
+
+class GraphStorage(InMemoryStorage):
+    """In-memory storage with integer-indexed parent/child adjacency for linear-time traversals.
+
+    Every node hash seen (stored or merely referenced as a parent/child) is
+    interned to a dense integer id. Edges are taken from both ``parent_hash``
+    and ``children_hashes``, so nodes may arrive in any order. Traversals are
+    iterative and stop at hashes that are not currently stored.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._ids: Dict[PackedHash, int] = {}
+        self._hashes: List[PackedHash] = []
+        self._present: List[bool] = []
+        self._parent: List[int] = []
+        self._children: List[List[int]] = []
+
+    def _intern(self, node_key: PackedHash) -> int:
+        node_id = self._ids.get(node_key)
+        if node_id is None:
+            node_id = len(self._hashes)
+            self._ids[node_key] = node_id
+            self._hashes.append(node_key)
+            self._present.append(False)
+            self._parent.append(_NO_PARENT)
+            self._children.append([])
+        return node_id
+
+    def _link(self, parent_id: int, child_id: int) -> None:
+        old_parent = self._parent[child_id]
+        if old_parent == parent_id:
+            return
+        if old_parent != _NO_PARENT:
+            self._children[old_parent].remove(child_id)
+        self._parent[child_id] = parent_id
+        self._children[parent_id].append(child_id)
+
+    def add_node(self, node: CoCNode) -> None:
+        super().add_node(node)
+        node_id = self._intern(node.packed_node_hash)
+        self._present[node_id] = True
+        if node.packed_parent_hash:
+            self._link(self._intern(node.packed_parent_hash), node_id)
+        for child_key in node.packed_children:
+            self._link(node_id, self._intern(child_key))
+
+    def remove_node(self, node_hash: str) -> None:
+        super().remove_node(node_hash)
+        node_id = self._ids.get(pack_hash(node_hash))
+        if node_id is not None:
+            self._present[node_id] = False
+
+    def node_id(self, node_hash: str) -> Optional[int]:
+        """Integer id of a stored node, or None."""
+        node_id = self._ids.get(pack_hash(node_hash))
+        if node_id is None or not self._present[node_id]:
+            return None
+        return node_id
+
+    def children_of(self, node_hash: str) -> List[str]:
+        node_id = self.node_id(node_hash)
+        if node_id is None:
+            return []
+        return [unpack_hash(self._hashes[c]) for c in self._children[node_id] if self._present[c]]
+
+    def _descendant_ids(self, root_id: int) -> List[int]:
+        result = []
+        # A hash chain cannot loop, but corrupt parent links could: visit each id once.
+        visited = bytearray(len(self._hashes))
+        visited[root_id] = 1
+        stack = list(reversed(self._children[root_id]))
+        while stack:
+            current = stack.pop()
+            if visited[current] or not self._present[current]:
+                continue
+            visited[current] = 1
+            result.append(current)
+            stack.extend(reversed(self._children[current]))
+        return result
+
+    def descendants(self, node_hash: str) -> List[CoCNode]:
+        """All stored nodes below ``node_hash`` in depth-first pre-order."""
+        node_id = self.node_id(node_hash)
+        if node_id is None:
+            return []
+        return [self._nodes[self._hashes[i]] for i in self._descendant_ids(node_id)]
+
+    def ancestors(self, node_hash: str) -> List[CoCNode]:
+        """Stored ancestors of ``node_hash``, nearest first."""
+        node_id = self.node_id(node_hash)
+        if node_id is None:
+            return []
+        result = []
+        current = self._parent[node_id]
+        # A hash chain cannot loop, but bound the walk in case of corrupt input.
+        for _ in range(len(self._hashes)):
+            if current == _NO_PARENT or not self._present[current]:
+                break
+            result.append(self._nodes[self._hashes[current]])
+            current = self._parent[current]
+        return result
+
+    def root_of(self, node_hash: str) -> Optional[CoCNode]:
+        """Topmost stored ancestor of ``node_hash`` (the node itself if it has none)."""
+        if self.node_id(node_hash) is None:
+            return None
+        chain = self.ancestors(node_hash)
+        return chain[-1] if chain else self._nodes[pack_hash(node_hash)]
+
+    def subtree_size(self, node_hash: str) -> int:
+        """Number of stored nodes in the subtree rooted at ``node_hash``, including it."""
+        node_id = self.node_id(node_hash)
+        if node_id is None:
+            return 0
+        return 1 + len(self._descendant_ids(node_id))
+
+
+# v3: binary node rows (see _encode_node_record), interned peers, edge table.
+SQLITE_SCHEMA_VERSION = 3
+SQLITE_STATEMENT_CACHE_SIZE = 256
+SQLITE_JOURNAL_MODES = frozenset({"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"})
+SQLITE_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
+# Binary node record layout (little-endian), version 1:
+#   header   B record version, B flags, H schema_version, i depth, H recipient count
+#   recipients  I interned peer id, one per recipient
+#   timestamp   q epoch microseconds if FLAG_INT_TIMESTAMP, else H length + UTF-8 ISO string
+#   signature   H length + raw bytes, present if FLAG_SIGNATURE
+NODE_RECORD_VERSION = 1
+_RECORD_HEADER = struct.Struct("<BBHiH")
+_U16 = struct.Struct("<H")
+_I64 = struct.Struct("<q")
+_FLAG_SIGNATURE = 0x01
+_FLAG_INT_TIMESTAMP = 0x02
+
+
+def _hash_key(value: Optional[str]):
+    """Raw 32 bytes for canonical SHA-256 hex, else the original string.
+
+    SQLite never compares BLOB equal to TEXT, so non-canonical hashes stored
+    as TEXT cannot collide with packed ones.
+    """
+    return pack_hash(value)
+
+
+@lru_cache(maxsize=64)
+def _recipient_struct(count: int) -> struct.Struct:
+    return struct.Struct(f"<{count}I")
+
+
+# Children come back in the same row as one separator-joined string of hex
+# hashes (or raw TEXT for non-canonical ids), saving a query per node.
+_CHILD_SEPARATOR = "\x1f"
+_SELECT_NODE_SQL = f"""
+    SELECT n.node_hash, n.content_hash, n.parent_hash, n.owner_ref, n.record,
+           (SELECT group_concat(
+                CASE typeof(e.child_hash) WHEN 'blob' THEN lower(hex(e.child_hash))
+                ELSE e.child_hash END, '{_CHILD_SEPARATOR}')
+            FROM edges e WHERE e.parent_hash = n.node_hash) AS children
+    FROM nodes n"""
 
 
 class SQLiteStorage(StorageBackend):
-    """SQLite-based persistent storage with indexed content_hash for O(log N) lookups."""
+    """SQLite-based persistent storage with indexed content_hash for O(log N) lookups.
+
+    By default every write is committed immediately. Passing ``batch_size``
+    and/or ``flush_interval`` groups writes into larger transactions that are
+    committed when either limit is reached, on ``flush()``, at the end of a
+    ``batch()`` block, or on ``close()``. There is no timer thread: the
+    interval is checked on the next read or write after it elapses, so an
+    idle connection keeps its pending writes until it is used again,
+    flushed or closed. File databases use WAL journaling with
+    ``synchronous=NORMAL`` unless overridden.
+    """
 
-    def __init__(self, db_path: str = ":memory:"):
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+    ):
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("flush_interval must be > 0")
         self._db_path = db_path
         self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
-            db_path, check_same_thread=False
+            db_path, check_same_thread=False, cached_statements=SQLITE_STATEMENT_CACHE_SIZE
         )
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._batch_depth = 0
+        self._pending_writes = 0
+        self._last_flush = time.monotonic()
+        self._peer_refs: Dict[str, int] = {}
+        self._peer_names: Dict[int, str] = {}
+        self._configure_connection(journal_mode, synchronous)
         self._create_tables()
         self._migrate_schema()
 
+    def _configure_connection(self, journal_mode: str, synchronous: str) -> None:
+        if journal_mode.upper() not in SQLITE_JOURNAL_MODES:
+            raise ValueError(f"Unsupported journal_mode: {journal_mode}")
+        if synchronous.upper() not in SQLITE_SYNCHRONOUS_MODES:
+            raise ValueError(f"Unsupported synchronous mode: {synchronous}")
+        if self._db_path != ":memory:":
+            self._conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+
+    @property
+    def batching(self) -> bool:
+        return self._batch_depth > 0 or self._batch_size is not None or self._flush_interval is not None
+
+    @property
+    def pending_writes(self) -> int:
+        """Writes applied but not yet committed."""
+        return self._pending_writes
+
+    def _commit(self) -> None:
+        """Commit now, or count the write towards the current batch."""
+        if not self.batching:
+            self._conn.commit()
+            return
+        self._pending_writes += 1
+        if self._batch_size is not None and self._pending_writes >= self._batch_size:
+            self.flush()
+        else:
+            self._flush_if_due()
+
+    def _flush_if_due(self) -> None:
+        """Commit pending writes once ``flush_interval`` has elapsed since the last commit."""
+        if (
+            self._pending_writes
+            and self._flush_interval is not None
+            and time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit all pending batched writes."""
+        if self._conn is None:
+            return
+        self._conn.commit()
+        self._pending_writes = 0
+        self._last_flush = time.monotonic()
+
+    @contextmanager
+    def batch(self):
+        """Group every write inside the block into one transaction (nestable)."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
     def _create_tables(self) -> None:
         cursor = self._conn.cursor()
         
@@ -214,24 +475,46 @@ class SQLiteStorage(StorageBackend):
             )
         """)
         
+        # Pre-v3 databases keep nodes as JSON blobs; set that table aside so
+        # _migrate_schema can re-encode it into the binary layout.
+        if "data" in self._table_columns("nodes"):
+            cursor.execute("DROP INDEX IF EXISTS idx_nodes_content_hash")
+            cursor.execute("DROP INDEX IF EXISTS idx_nodes_owner_id")
+            cursor.execute("ALTER TABLE nodes RENAME TO nodes_json_legacy")
+
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS nodes (
-                node_hash TEXT PRIMARY KEY,
-                content_hash TEXT NOT NULL,
-                owner_id TEXT NOT NULL,
-                data TEXT NOT NULL,
-                created_at TEXT NOT NULL
+            CREATE TABLE IF NOT EXISTS peers (
+                id INTEGER PRIMARY KEY,
+                peer_id TEXT NOT NULL UNIQUE
             )
         """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS nodes (
+                node_hash BLOB PRIMARY KEY,
+                content_hash BLOB NOT NULL,
+                parent_hash BLOB,
+                owner_ref INTEGER NOT NULL,
+                record BLOB NOT NULL
+            ) WITHOUT ROWID
+        """)
         
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_nodes_content_hash 
+            CREATE INDEX IF NOT EXISTS idx_nodes_content
             ON nodes(content_hash)
         """)
         
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_nodes_owner_id 
-            ON nodes(owner_id)
+            CREATE INDEX IF NOT EXISTS idx_nodes_owner_ref
+            ON nodes(owner_ref)
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS edges (
+                parent_hash BLOB NOT NULL,
+                child_hash BLOB NOT NULL,
+                PRIMARY KEY (parent_hash, child_hash)
+            ) WITHOUT ROWID
         """)
         
         cursor.execute("""
@@ -257,6 +540,10 @@ class SQLiteStorage(StorageBackend):
         
         self._conn.commit()
 
+    def _table_columns(self, table: str) -> Set[str]:
+        cursor = self._conn.execute(f"PRAGMA table_info({table})")
+        return {col[1] for col in cursor.fetchall()}
+
     def _migrate_schema(self) -> None:
         cursor = self._conn.cursor()
         
@@ -265,31 +552,13 @@ class SQLiteStorage(StorageBackend):
         current_version = int(row[0]) if row else 1
         
         if current_version < SQLITE_SCHEMA_VERSION:
-            cursor.execute("PRAGMA table_info(nodes)")
-            columns = {col[1] for col in cursor.fetchall()}
-            
-            if "content_hash" not in columns:
-                cursor.execute("ALTER TABLE nodes ADD COLUMN content_hash TEXT")
-                cursor.execute("ALTER TABLE nodes ADD COLUMN owner_id TEXT")
-                
-                cursor.execute("SELECT node_hash, data FROM nodes")
-                for node_hash, data in cursor.fetchall():
-                    node_data = json.loads(data)
-                    content_hash = node_data.get("content_hash", "")
-                    owner_id = node_data.get("owner_id", "")
-                    cursor.execute(
-                        "UPDATE nodes SET content_hash = ?, owner_id = ? WHERE node_hash = ?",
-                        (content_hash, owner_id, node_hash)
-                    )
-                
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_nodes_content_hash 
-                    ON nodes(content_hash)
-                """)
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_nodes_owner_id 
-                    ON nodes(owner_id)
-                """)
+            if self._table_columns("nodes_json_legacy"):
+                # v1/v2 rows: the JSON blob holds the full node, so both
+                # versions re-encode the same way.
+                legacy = self._conn.execute("SELECT data FROM nodes_json_legacy")
+                for (data,) in legacy:
+                    self._write_node(CoCNode.from_dict(json.loads(data)))
+                cursor.execute("DROP TABLE nodes_json_legacy")
             
             cursor.execute(
                 "INSERT OR REPLACE INTO schema_meta (key, value) VALUES ('version', ?)",
@@ -297,43 +566,135 @@ class SQLiteStorage(StorageBackend):
             )
             self._conn.commit()
 
-    def add_node(self, node: CoCNode) -> None:
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """INSERT OR REPLACE INTO nodes 
-               (node_hash, content_hash, owner_id, data, created_at) 
+    def _peer_ref(self, peer_id: str) -> int:
+        ref = self._peer_refs.get(peer_id)
+        if ref is None:
+            row = self._conn.execute("SELECT id FROM peers WHERE peer_id = ?", (peer_id,)).fetchone()
+            if row:
+                ref = row[0]
+            else:
+                ref = self._conn.execute("INSERT INTO peers (peer_id) VALUES (?)", (peer_id,)).lastrowid
+            self._peer_refs[peer_id] = ref
+            self._peer_names[ref] = peer_id
+        return ref
+
+    def _peer_name(self, ref: int) -> str:
+        name = self._peer_names.get(ref)
+        if name is None:
+            name = self._conn.execute("SELECT peer_id FROM peers WHERE id = ?", (ref,)).fetchone()[0]
+            self._peer_names[ref] = name
+            self._peer_refs[name] = ref
+        return name
+
+    def _encode_node_record(self, node: CoCNode) -> bytes:
+        flags = 0
+        recipients = [self._peer_ref(pid) for pid in node.recipient_ids]
+        micros = node.timestamp_micros
+        if micros is not None:
+            flags |= _FLAG_INT_TIMESTAMP
+            timestamp_part = _I64.pack(micros)
+        else:
+            raw_ts = (node.timestamp or "").encode("utf-8")
+            timestamp_part = _U16.pack(len(raw_ts)) + raw_ts
+        signature_part = b""
+        if node.signature:
+            flags |= _FLAG_SIGNATURE
+            signature_part = _U16.pack(len(node.signature)) + bytes(node.signature)
+        return b"".join((
+            _RECORD_HEADER.pack(
+                NODE_RECORD_VERSION, flags, node.schema_version, node.depth, len(recipients)
+            ),
+            _recipient_struct(len(recipients)).pack(*recipients),
+            timestamp_part,
+            signature_part,
+        ))
+
+    def _decode_node(self, row) -> CoCNode:
+        node_key, content_key, parent_key, owner_ref, record, children = row
+        version, flags, schema_version, depth, recipient_count = _RECORD_HEADER.unpack_from(record)
+        if version != NODE_RECORD_VERSION:
+            raise ValueError(f"Unsupported node record version: {version}")
+        offset = _RECORD_HEADER.size
+        recipient_refs = _recipient_struct(recipient_count).unpack_from(record, offset)
+        offset += 4 * recipient_count
+        if flags & _FLAG_INT_TIMESTAMP:
+            (timestamp,) = _I64.unpack_from(record, offset)
+            offset += _I64.size
+        else:
+            (length,) = _U16.unpack_from(record, offset)
+            offset += _U16.size
+            timestamp = record[offset:offset + length].decode("utf-8")
+            offset += length
+        signature = None
+        if flags & _FLAG_SIGNATURE:
+            (length,) = _U16.unpack_from(record, offset)
+            offset += _U16.size
+            signature = bytes(record[offset:offset + length])
+
+        names = self._peer_names
+        # Recipients were stored already sorted; hashes and timestamp stay packed.
+        return CoCNode.from_packed(
+            node_hash=node_key,
+            content_hash=content_key,
+            parent_hash=parent_key,
+            owner_id=names.get(owner_ref) or self._peer_name(owner_ref),
+            recipient_ids=[names.get(ref) or self._peer_name(ref) for ref in recipient_refs],
+            timestamp=timestamp,
+            children=tuple(pack_hash(c) for c in children.split(_CHILD_SEPARATOR)) if children else (),
+            depth=depth,
+            signature=signature,
+            schema_version=schema_version,
+        )
+
+    def _write_node(self, node: CoCNode) -> None:
+        node_key = node.packed_node_hash
+        self._conn.execute(
+            """INSERT OR REPLACE INTO nodes
+               (node_hash, content_hash, parent_hash, owner_ref, record)
                VALUES (?, ?, ?, ?, ?)""",
             (
-                node.node_hash,
-                node.content_hash,
-                node.owner_id,
-                json.dumps(node.to_dict()),
-                datetime.now(timezone.utc).isoformat(),
+                node_key,
+                node.packed_content_hash,
+                node.packed_parent_hash,
+                self._peer_ref(node.owner_id),
+                self._encode_node_record(node),
             ),
         )
-        self._conn.commit()
+        # children_hashes belong to this node's snapshot, so replace them wholesale
+        self._conn.execute("DELETE FROM edges WHERE parent_hash = ?", (node_key,))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO edges (parent_hash, child_hash) VALUES (?, ?)",
+            [(node_key, child_key) for child_key in node.packed_children],
+        )
+
+    def add_node(self, node: CoCNode) -> None:
+        self._write_node(node)
+        self._commit()
 
     def store_node(self, node: CoCNode) -> None:
         self.add_node(node)
 
     def get_node(self, node_hash: str) -> Optional[CoCNode]:
+        self._flush_if_due()
         cursor = self._conn.cursor()
-        cursor.execute("SELECT data FROM nodes WHERE node_hash = ?", (node_hash,))
+        cursor.execute(_SELECT_NODE_SQL + " WHERE n.node_hash = ?", (_hash_key(node_hash),))
         row = cursor.fetchone()
         if row:
-            return CoCNode.from_dict(json.loads(row[0]))
+            return self._decode_node(row)
         return None
 
     def remove_node(self, node_hash: str) -> None:
+        node_key = _hash_key(node_hash)
         cursor = self._conn.cursor()
-        cursor.execute("DELETE FROM nodes WHERE node_hash = ?", (node_hash,))
-        self._conn.commit()
+        cursor.execute("DELETE FROM nodes WHERE node_hash = ?", (node_key,))
+        cursor.execute("DELETE FROM edges WHERE parent_hash = ?", (node_key,))
+        self._commit()
 
     def get_all_nodes(self) -> List[CoCNode]:
+        self._flush_if_due()
         cursor = self._conn.cursor()
-        cursor.execute("SELECT data FROM nodes")
-        rows = cursor.fetchall()
-        return [CoCNode.from_dict(json.loads(row[0])) for row in rows]
+        cursor.execute(_SELECT_NODE_SQL)
+        return [self._decode_node(row) for row in cursor.fetchall()]
 
     def add_content(self, content_hash: str, content: str) -> None:
         cursor = self._conn.cursor()
@@ -341,12 +702,13 @@ class SQLiteStorage(StorageBackend):
             "INSERT OR REPLACE INTO content (content_hash, content, created_at) VALUES (?, ?, ?)",
             (content_hash, content, datetime.now(timezone.utc).isoformat()),
         )
-        self._conn.commit()
+        self._commit()
 
     def store_content(self, content_hash: str, content: str) -> None:
         self.add_content(content_hash, content)
 
     def get_content(self, content_hash: str) -> Optional[str]:
+        self._flush_if_due()
         cursor = self._conn.cursor()
         cursor.execute(
             "SELECT content FROM content WHERE content_hash = ?", (content_hash,)
@@ -359,31 +721,34 @@ class SQLiteStorage(StorageBackend):
     def remove_content(self, content_hash: str) -> None:
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM content WHERE content_hash = ?", (content_hash,))
-        self._conn.commit()
+        self._commit()
 
     def is_content_referenced(self, content_hash: str) -> bool:
+        self._flush_if_due()
         cursor = self._conn.cursor()
         cursor.execute(
             "SELECT 1 FROM nodes WHERE content_hash = ? LIMIT 1",
-            (content_hash,)
+            (_hash_key(content_hash),)
         )
         return cursor.fetchone() is not None
 
     def get_nodes_by_content(self, content_hash: str) -> List[CoCNode]:
+        self._flush_if_due()
         cursor = self._conn.cursor()
         cursor.execute(
-            "SELECT data FROM nodes WHERE content_hash = ?",
-            (content_hash,)
+            _SELECT_NODE_SQL + " WHERE n.content_hash = ?",
+            (_hash_key(content_hash),)
         )
-        return [CoCNode.from_dict(json.loads(row[0])) for row in cursor.fetchall()]
+        return [self._decode_node(row) for row in cursor.fetchall()]
 
     def get_nodes_by_owner(self, owner_id: str) -> List[CoCNode]:
+        self._flush_if_due()
         cursor = self._conn.cursor()
         cursor.execute(
-            "SELECT data FROM nodes WHERE owner_id = ?",
+            _SELECT_NODE_SQL + " WHERE n.owner_ref = (SELECT id FROM peers WHERE peer_id = ?)",
             (owner_id,)
         )
-        return [CoCNode.from_dict(json.loads(row[0])) for row in cursor.fetchall()]
+        return [self._decode_node(row) for row in cursor.fetchall()]
 
     def add_tombstone(self, tombstone: ContentTombstone) -> None:
         cursor = self._conn.cursor()
@@ -391,9 +756,10 @@ class SQLiteStorage(StorageBackend):
             "INSERT OR REPLACE INTO tombstones (content_hash, data, delete_after) VALUES (?, ?, ?)",
             (tombstone.content_hash, json.dumps(tombstone.to_dict()), tombstone.delete_after),
         )
-        self._conn.commit()
+        self._commit()
 
     def get_tombstone(self, content_hash: str) -> Optional[ContentTombstone]:
+        self._flush_if_due()
         cursor = self._conn.cursor()
         cursor.execute(
             "SELECT data FROM tombstones WHERE content_hash = ?", (content_hash,)
@@ -403,7 +769,7 @@ class SQLiteStorage(StorageBackend):
             ts = ContentTombstone.from_dict(json.loads(row[0]))
             if ts.is_expired():
                 cursor.execute("DELETE FROM tombstones WHERE content_hash = ?", (content_hash,))
-                self._conn.commit()
+                self._commit()
                 return None
             return ts
         return None
@@ -417,7 +783,7 @@ class SQLiteStorage(StorageBackend):
         cursor.execute("SELECT COUNT(*) FROM tombstones WHERE delete_after < ?", (now,))
         count = cursor.fetchone()[0]
         cursor.execute("DELETE FROM tombstones WHERE delete_after < ?", (now,))
-        self._conn.commit()
+        self._commit()
         return count
 
     def get_all_tombstones(self) -> List[ContentTombstone]:
@@ -428,6 +794,7 @@ class SQLiteStorage(StorageBackend):
 
     def close(self) -> None:
         if self._conn:
+            self.flush()
             self._conn.close()
             self._conn = None
 
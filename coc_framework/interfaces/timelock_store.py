@@ -0,0 +1,228 @@
+"""Persistent storage for time-lock keys.
+
+``AsyncTimeLockEngine`` keeps live keys in memory; a ``TimeLockKeyBackend``
+lets them survive a restart. Backends only ever see keys wrapped under a
+master key (``coc_framework.core.timelock.wrap_key``). Nothing is read at
+startup: the engine loads a lock the first time it is used.
+
+Expired and destroyed keys are wiped, not deleted: the row stays behind as
+a tombstone with no key and its final status, so after a restart an
+expired lock still reads as EXPIRED rather than unknown. Expiry of live
+keys is a partial index, so the purge is a single range update that never
+touches tombstones.
+"""
+
+import asyncio
+import json
+import os
+import secrets
+import sqlite3
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+MASTER_KEY_BYTES = 32
+
+
+def load_or_create_master_key(path: str) -> bytes:
+    """Read the master key from ``path``, creating it (mode 0600) on first use."""
+    try:
+        with open(path, "rb") as f:
+            master_key = f.read()
+    except FileNotFoundError:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        master_key = secrets.token_bytes(MASTER_KEY_BYTES)
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            return load_or_create_master_key(path)  # another process won the race
+        with os.fdopen(fd, "wb") as f:
+            f.write(master_key)
+            f.flush()
+            os.fsync(f.fileno())
+    if len(master_key) != MASTER_KEY_BYTES:
+        raise ValueError(f"Master key in {path} must be {MASTER_KEY_BYTES} bytes")
+    return master_key
+
+
+STATUS_ACTIVE = "ACTIVE"
+STATUS_EXPIRED = "EXPIRED"
+STATUS_DESTROYED = "DESTROYED"
+
+
+class StoredKey(NamedTuple):
+    wrapped_key: Optional[bytes]  # None for a tombstone
+    expires_at: datetime
+    metadata: Dict
+    status: str = STATUS_ACTIVE
+
+
+class TimeLockKeyBackend(ABC):
+    """Durable map of lock_id -> (wrapped key, expiry, metadata, status).
+
+    All methods are coroutines so backends can sit on an asyncio pool;
+    a write has reached stable storage when its coroutine returns.
+    """
+
+    @abstractmethod
+    async def put(self, lock_id: str, wrapped_key: bytes, expires_at: datetime, metadata: Dict) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, lock_id: str) -> Optional[StoredKey]:
+        pass
+
+    @abstractmethod
+    async def update_expiry(self, lock_id: str, expires_at: datetime, metadata: Dict) -> bool:
+        """Move a live key's expiry; False if there is no live key."""
+        pass
+
+    @abstractmethod
+    async def destroy(self, lock_id: str) -> bool:
+        """Wipe a live key, leaving a DESTROYED tombstone; False if there is no live key."""
+        pass
+
+    @abstractmethod
+    async def purge_expired(self, now: datetime) -> int:
+        """Wipe every live key with ``expires_at < now`` to an EXPIRED tombstone; returns how many."""
+        pass
+
+    @abstractmethod
+    async def next_expiry(self) -> Optional[datetime]:
+        """Earliest expiry of a live key, or None."""
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+def _to_epoch(dt: datetime) -> float:
+    return dt.timestamp()
+
+
+def _from_epoch(value: float) -> datetime:
+    return datetime.fromtimestamp(value, timezone.utc)
+
+
+class SQLiteTimeLockKeyBackend(TimeLockKeyBackend):
+    """Key backend on a local SQLite file.
+
+    Queries run on one dedicated thread, off the event loop. The database
+    uses WAL with ``synchronous=FULL``: a lock is only handed out once its
+    key is on disk. ``secure_delete`` zeroes wiped keys in the file. Expiry
+    is stored as epoch seconds.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="timelock-keys")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            if self.db_path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.execute("PRAGMA secure_delete=ON")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS timelock_keys (
+                    lock_id TEXT PRIMARY KEY,
+                    wrapped_key BLOB,
+                    expires_at REAL NOT NULL,
+                    metadata TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'ACTIVE'
+                );
+                CREATE INDEX IF NOT EXISTS idx_timelock_keys_live_expiry
+                    ON timelock_keys(expires_at) WHERE wrapped_key IS NOT NULL;
+            """)
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _put(self, lock_id, wrapped_key, expires_at, metadata):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO timelock_keys (lock_id, wrapped_key, expires_at, metadata, status) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (lock_id, wrapped_key, _to_epoch(expires_at), json.dumps(metadata), STATUS_ACTIVE),
+            )
+
+    def _get(self, lock_id):
+        row = self._connect().execute(
+            "SELECT wrapped_key, expires_at, metadata, status FROM timelock_keys WHERE lock_id = ?",
+            (lock_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        wrapped_key = bytes(row[0]) if row[0] is not None else None
+        return StoredKey(wrapped_key, _from_epoch(row[1]), json.loads(row[2]), row[3])
+
+    def _update_expiry(self, lock_id, expires_at, metadata):
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE timelock_keys SET expires_at = ?, metadata = ? "
+                "WHERE lock_id = ? AND wrapped_key IS NOT NULL",
+                (_to_epoch(expires_at), json.dumps(metadata), lock_id),
+            )
+        return cursor.rowcount > 0
+
+    def _destroy(self, lock_id):
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE timelock_keys SET wrapped_key = NULL, status = ? "
+                "WHERE lock_id = ? AND wrapped_key IS NOT NULL",
+                (STATUS_DESTROYED, lock_id),
+            )
+        return cursor.rowcount > 0
+
+    def _purge_expired(self, now):
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE timelock_keys SET wrapped_key = NULL, status = ? "
+                "WHERE wrapped_key IS NOT NULL AND expires_at < ?",
+                (STATUS_EXPIRED, _to_epoch(now)),
+            )
+        return cursor.rowcount
+
+    def _next_expiry(self):
+        value = self._connect().execute(
+            "SELECT MIN(expires_at) FROM timelock_keys WHERE wrapped_key IS NOT NULL"
+        ).fetchone()[0]
+        return None if value is None else _from_epoch(value)
+
+    async def put(self, lock_id: str, wrapped_key: bytes, expires_at: datetime, metadata: Dict) -> None:
+        await self._run(self._put, lock_id, wrapped_key, expires_at, metadata)
+
+    async def get(self, lock_id: str) -> Optional[StoredKey]:
+        return await self._run(self._get, lock_id)
+
+    async def update_expiry(self, lock_id: str, expires_at: datetime, metadata: Dict) -> bool:
+        return await self._run(self._update_expiry, lock_id, expires_at, metadata)
+
+    async def destroy(self, lock_id: str) -> bool:
+        return await self._run(self._destroy, lock_id)
+
+    async def purge_expired(self, now: datetime) -> int:
+        return await self._run(self._purge_expired, now)
+
+    async def next_expiry(self) -> Optional[datetime]:
+        return await self._run(self._next_expiry)
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def close(self) -> None:
+        await self._run(self._close)
@@ -34,7 +34,7 @@ from .protocol import (
     MESSAGE_MAX_AGE_SECONDS,
     MESSAGE_MAX_FUTURE_SECONDS,
 )
-from ..core.crypto_core import CryptoCore
+from ..core.crypto_core import CryptoCore, VerificationItem
 from ..core.logging import gossip_logger
 
 
@@ -104,6 +104,14 @@ class GossipEnvelope:
         except Exception:
             return False
     
+    def verification_item(self, verify_key: VerifyKey) -> Optional[VerificationItem]:
+        if not self.signature:
+            return None
+        try:
+            return verify_key, self._get_signing_data(), bytes.fromhex(self.signature)
+        except ValueError:
+            return None
+    
     def validate_timestamp(
         self,
         max_age: int = MESSAGE_MAX_AGE_SECONDS,
@@ -17,6 +17,7 @@ from time import time as time_time
 from typing import Any, ClassVar, Dict, Final, List, Optional, Tuple, Type, Union
 
 from ..core.crypto_core import CryptoCore
+from ..core.signature_cache import get_signature_cache
 
 
 MESSAGE_MAX_AGE_SECONDS: Final[int] = 300
@@ -511,7 +512,13 @@ def unwrap_and_verify(
     if verify_key is None:
         raise SignatureVerificationError(f"Unknown sender: {envelope.sender_id}")
     
-    if not envelope.verify(verify_key):
+    try:
+        signature = bytes.fromhex(envelope.signature)
+    except ValueError:
+        signature = b""
+    if not signature or not get_signature_cache().verify(
+        envelope.signature, verify_key, envelope._get_signing_data(), signature
+    ):
         raise SignatureVerificationError(f"Invalid signature from {envelope.sender_id}")
     
     if validate_time:
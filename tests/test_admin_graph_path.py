@@ -234,3 +234,32 @@ class TestAdminGraphPathRoute:
         body = resp.json()
         assert body["path_count"] == 2
         assert len(body["paths"]) == 2
+
+
+class TestDocumentTraceService:
+    """Document traces should come from a single subtree fetch."""
+
+    @pytest.mark.asyncio
+    async def test_document_paths_use_subtree(self):
+        from coc_framework.core.coc_node import CoCNode
+        from trustdocs.trustflow_service import trustflow
+
+        def node(node_hash, parent=None, children=()):
+            n = CoCNode("c" * 64, "owner", None, [], parent_hash=parent)
+            n.node_hash = node_hash
+            n.children_hashes = set(children)
+            return n
+
+        subtree = [node("A", children=["B"]), node("B", "A", ["C"]), node("C", "B")]
+
+        with patch.object(trustflow, "storage") as mock_storage:
+            mock_storage.get_subtree = AsyncMock(return_value=subtree)
+            mock_storage.get_node = AsyncMock()
+
+            result = await trustflow.get_graph_paths_for_document(
+                root_hash="A", source="A", target="C"
+            )
+
+        mock_storage.get_subtree.assert_awaited_once_with("A")
+        mock_storage.get_node.assert_not_called()
+        assert result["paths"][0]["nodes"] == ["A", "B", "C"]
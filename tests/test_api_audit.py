@@ -0,0 +1,49 @@
+"""Tests for paging through the audit log via GET /api/audit."""
+
+from types import SimpleNamespace
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from coc_framework.api import server
+from coc_framework.core.audit_log import AuditLog
+
+
+@pytest.fixture
+def audit_log(tmp_path, monkeypatch):
+    log = AuditLog(str(tmp_path))
+    for i in range(5):
+        log.log_event("EVENT", "alice", f"target-{i}")
+    monkeypatch.setattr(server, "_engine", SimpleNamespace(audit_log=log))
+    yield log
+    log.close()
+
+
+async def _get(**params):
+    async with AsyncClient(transport=ASGITransport(app=server.app), base_url="http://test") as client:
+        resp = await client.get("/api/audit", params=params)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+class TestAuditPaging:
+    """has_more and next_cursor on /api/audit pages."""
+
+    @pytest.mark.asyncio
+    async def test_exactly_full_last_page_has_no_more(self, audit_log):
+        # GENESIS plus 5 events: pages of 3 end exactly at the log's end.
+        first = await _get(limit=3)
+        assert first["has_more"] is True
+        assert first["next_cursor"] == 3
+
+        last = await _get(cursor=3, limit=3)
+        assert [e["target"] for e in last["entries"]] == ["target-2", "target-3", "target-4"]
+        assert last["has_more"] is False
+        assert last["next_cursor"] == 6
+
+    @pytest.mark.asyncio
+    async def test_filtered_page_resumes_after_last_match(self, audit_log):
+        page = await _get(event_type="EVENT", limit=2)
+        assert [e["target"] for e in page["entries"]] == ["target-0", "target-1"]
+        assert page["has_more"] is True
+        assert page["next_cursor"] == 3
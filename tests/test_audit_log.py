@@ -1,14 +1,21 @@
 """
 Tests for the expanded audit logging system.
 """
+import hashlib
 import json
+import os
 import pytest
 from datetime import datetime, timezone, timedelta
 
+from nacl.signing import SigningKey
+
 from coc_framework.core.audit_log import (
     AuditEventType,
     AuditEvent,
+    AuditLog,
     AuditLogger,
+    Checkpoint,
+    MerkleLog,
     TamperEvidentLog,
     LogEntry,
 )
@@ -484,6 +491,68 @@ class TestAuditLogger:
         assert len(all_events) == 3
 
 
+class TestAuditLoggerQueries:
+    """Tests for indexed, combinable AuditLogger queries."""
+
+    @pytest.fixture
+    def logger(self):
+        logger = AuditLogger()
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        actors = ["alice", "bob", "carol"]
+        types = [AuditEventType.CONTENT_CREATED, AuditEventType.MESSAGE_SENT]
+        # Appended out of timestamp order on purpose
+        for i in [5, 0, 3, 1, 4, 2, 8, 6, 7, 9, 11, 10]:
+            logger.log_event(AuditEvent(
+                event_type=types[i % 2],
+                timestamp=(base + timedelta(minutes=i)).isoformat(),
+                actor_id=actors[i % 3],
+                target_id=f"doc-{i % 4}",
+                details={"i": i},
+            ))
+        return logger
+
+    def _ids(self, events):
+        return [e.details["i"] for e in events]
+
+    def test_combined_predicates(self, logger):
+        events = logger.query(event_type=AuditEventType.CONTENT_CREATED, actor_id="alice")
+        assert self._ids(events) == [0, 6]
+        assert self._ids(logger.query(actor_id="bob", target_id="doc-1")) == [1]
+        assert logger.query(actor_id="nobody") == []
+
+    def test_range_in_log_order(self, logger):
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        events = logger.query(
+            start=(base + timedelta(minutes=2)).isoformat(),
+            end=(base + timedelta(minutes=5)).isoformat(),
+        )
+        assert self._ids(events) == [5, 3, 4, 2]
+
+    def test_range_with_other_predicates(self, logger):
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        events = logger.query(
+            actor_id="alice",
+            start=(base + timedelta(minutes=3)).isoformat(),
+        )
+        assert self._ids(events) == [3, 6, 9]
+
+    def test_pagination(self, logger):
+        everything = self._ids(logger.query(event_type=AuditEventType.MESSAGE_SENT))
+        page1 = self._ids(logger.query(event_type=AuditEventType.MESSAGE_SENT, limit=4))
+        page2 = self._ids(logger.query(event_type=AuditEventType.MESSAGE_SENT, offset=4, limit=4))
+        assert page1 + page2 == everything
+        assert logger.count(event_type=AuditEventType.MESSAGE_SENT) == len(everything) == 6
+
+    def test_matches_linear_scan(self, logger):
+        for actor in ("alice", "bob", "carol"):
+            for target in ("doc-0", "doc-1", "doc-2", "doc-3"):
+                expected = [
+                    e.details["i"] for e in logger.get_all_events()
+                    if e.actor_id == actor and e.target_id == target
+                ]
+                assert self._ids(logger.query(actor_id=actor, target_id=target)) == expected
+
+
 class TestAuditLoggerIntegration:
     """Integration tests for AuditLogger with various event types."""
 
@@ -555,5 +624,443 @@ class TestAuditLoggerIntegration:
         assert len(alice_events) == 3  # joined, sent, left
 
 
+class TestTamperEvidentLogCheckpoints:
+    """Tests for checkpointed verification of TamperEvidentLog."""
+
+    def _log(self, count, interval=4, **kwargs):
+        log = TamperEvidentLog(checkpoint_interval=interval, **kwargs)
+        for i in range(count):
+            log.append({"event": i})
+        return log
+
+    def test_periodic_checkpoints(self):
+        log = self._log(10)
+        assert [cp.index for cp in log.get_checkpoints()] == [3, 7]
+        assert log.get_checkpoints()[-1].entry_hash == log.get_entries()[7].entry_hash
+
+    def test_incremental_verify_only_checks_tail(self):
+        """Tampering before the last checkpoint is only caught by a full verify."""
+        log = self._log(10)
+        log._entries[1].data["event"] = "tampered"
+
+        assert log.verify() is True
+        assert log.verify(full=True) is False
+
+    def test_incremental_verify_detects_tail_tampering(self):
+        log = self._log(10)
+        log._entries[9].data["event"] = "tampered"
+        assert log.verify() is False
+
+    def test_rewritten_checkpoint_entry_detected(self):
+        log = self._log(10)
+        log._entries[7].entry_hash = "0" * 64
+        assert log.verify() is False
+
+    def test_full_verify_parallel_segments(self):
+        log = self._log(40, interval=8)
+        assert log.verify(full=True, max_workers=2, parallel_threshold=1) is True
+        log._entries[20].timestamp = "tampered"
+        assert log.verify(full=True, max_workers=2, parallel_threshold=1) is False
+
+    def test_signed_checkpoints(self):
+        signing_key = SigningKey.generate()
+        log = self._log(4, signing_key=signing_key)
+        checkpoint = log.get_checkpoints()[0]
+
+        assert checkpoint.verify(signing_key.verify_key)
+        restored = Checkpoint.from_dict(json.loads(json.dumps(checkpoint.to_dict())))
+        restored.index = 2
+        assert not restored.verify(signing_key.verify_key)
+
+
+class TestAuditLogCheckpoints:
+    """Tests for checkpointed verification of the file-based AuditLog."""
+
+    def _tamper(self, path, index, old, new):
+        with open(path) as f:
+            lines = f.readlines()
+        entries = [i for i, line in enumerate(lines) if not line.startswith("#")]
+        lines[entries[index]] = lines[entries[index]].replace(old, new)
+        with open(path, "w") as f:
+            f.writelines(lines)
+
+    def test_checkpoints_every_interval(self, tmp_path):
+        log = AuditLog(str(tmp_path), checkpoint_interval=5)
+        for i in range(11):
+            log.log_event("EVENT", "alice", f"t{i}")
+
+        # GENESIS plus 11 events
+        assert log.entry_count == 12
+        assert [cp.index for cp in log.get_checkpoints()] == [4, 9]
+        assert log.verify_log_integrity() is True
+        assert log.get_checkpoints()[-1].index == 11
+
+    def test_incremental_and_full_verification(self, tmp_path):
+        log = AuditLog(str(tmp_path), checkpoint_interval=5)
+        for i in range(11):
+            log.log_event("EVENT", "alice", f"target-{i}")
+
+        self._tamper(log.log_file, 2, "alice", "malic")
+
+        assert log.verify_log_integrity() is True
+        assert log.verify_log_integrity(full=True) is False
+
+    def test_tail_tampering_detected(self, tmp_path):
+        log = AuditLog(str(tmp_path), checkpoint_interval=5)
+        for i in range(8):
+            log.log_event("EVENT", "alice", f"target-{i}")
+
+        self._tamper(log.log_file, 7, "alice", "malic")
+
+        assert log.verify_log_integrity() is False
+        # Scanning stops at the broken entry, not at a stale entry count.
+        assert log.verify_chain() == (False, 8)
+
+    def test_full_verify_parallel(self, tmp_path):
+        log = AuditLog(str(tmp_path), checkpoint_interval=3)
+        for i in range(20):
+            log.log_event("EVENT", "alice", f"target-{i}")
+        assert log.verify_log_integrity(full=True, max_workers=2) is True
+        assert log.verify_chain(full=True) == (True, 21)
+
+    def test_signed_checkpoints_survive_restart(self, tmp_path):
+        signing_key = SigningKey.generate()
+        log = AuditLog(str(tmp_path), checkpoint_interval=5, signing_key=signing_key)
+        for i in range(11):
+            log.log_event("EVENT", "alice", f"target-{i}")
+
+        reopened = AuditLog(str(tmp_path), verify_key=signing_key.verify_key)
+        assert [cp.index for cp in reopened.get_checkpoints()] == [4, 9]
+        assert reopened.entry_count is None
+        assert reopened.verify_log_integrity() is True
+        assert reopened.entry_count == 12
+
+    def test_unsigned_or_foreign_checkpoints_not_trusted(self, tmp_path):
+        signing_key = SigningKey.generate()
+        log = AuditLog(str(tmp_path), checkpoint_interval=5, signing_key=signing_key)
+        for i in range(11):
+            log.log_event("EVENT", "alice", f"target-{i}")
+        self._tamper(log.log_file, 2, "alice", "malic")
+
+        assert AuditLog(str(tmp_path)).get_checkpoints() == []
+        other = AuditLog(str(tmp_path), verify_key=SigningKey.generate().verify_key)
+        assert other.get_checkpoints() == []
+        assert other.verify_log_integrity() is False
+
+    def test_truncated_log_fails_checkpoint(self, tmp_path):
+        log = AuditLog(str(tmp_path), checkpoint_interval=5)
+        for i in range(11):
+            log.log_event("EVENT", "alice", f"target-{i}")
+        with open(log.log_file, "r+") as f:
+            f.truncate(f.seek(0, 2) // 2)
+
+        assert log.verify_log_integrity() is False
+
+
+class TestAuditLogSegments:
+    """Tests for the segmented, indexed on-disk format of AuditLog."""
+
+    def _log(self, tmp_path, events, **kwargs):
+        log = AuditLog(str(tmp_path), **kwargs)
+        for i in range(events):
+            log.log_event("EVENT", "alice", f"target-{i:03d}")
+        return log
+
+    def test_rotates_into_segments(self, tmp_path):
+        log = self._log(tmp_path, 30, segment_max_bytes=1024)
+        segments = log.segment_files()
+
+        assert segments[0] == log.log_file
+        assert segments[1] == log.log_file + ".000001"
+        assert len(segments) > 2
+        assert all(os.path.getsize(path) <= 1024 for path in segments)
+        assert all(os.path.exists(path + ".idx") for path in segments)
+        assert log.total_entries == 31
+        assert log.verify_log_integrity(full=True) is True
+
+    def test_read_entries_pages_across_segments(self, tmp_path):
+        log = self._log(tmp_path, 30, segment_max_bytes=1024)
+
+        page = log.read_entries(10, 5)
+        assert [e["target"] for e in page] == [f"target-{i:03d}" for i in range(9, 14)]
+        assert log.read_entries(0, 1)[0]["event_type"] == "GENESIS"
+        assert len(log.read_entries()) == 31
+        assert log.read_entries(31) == []
+        # Each entry chains onto the previous one.
+        assert all(a["entry_hash"] == b["prev_hash"] for a, b in zip(page, page[1:]))
+        with pytest.raises(ValueError):
+            log.read_entries(-1)
+
+    def test_reopen_continues_chain(self, tmp_path):
+        log = self._log(tmp_path, 30, segment_max_bytes=1024)
+        segments = log.segment_files()
+        last_hash = log.last_hash
+        log.close()
+
+        reopened = AuditLog(str(tmp_path), segment_max_bytes=1024)
+        assert reopened.segment_files() == segments
+        assert reopened.last_hash == last_hash
+        assert reopened.total_entries == 31
+        reopened.log_event("EVENT", "bob", "after-restart")
+        assert reopened.read_entries(31)[0]["prev_hash"] == last_hash
+        assert reopened.verify_log_integrity() is True
+
+    def test_missing_or_stale_index_rebuilt(self, tmp_path):
+        log = self._log(tmp_path, 30, segment_max_bytes=1024)
+        expected = log.read_entries()
+        segments = log.segment_files()
+        log.close()
+        os.remove(segments[0] + ".idx")
+        with open(segments[-1] + ".idx", "r+b") as f:
+            f.truncate(8)
+
+        reopened = AuditLog(str(tmp_path), segment_max_bytes=1024)
+        assert reopened.read_entries() == expected
+
+    def test_delimiter_in_fields_survives_reopen(self, tmp_path):
+        log = self._log(tmp_path, 5)
+        target = "Proposal p1 | Watermarked copy issued"
+        details = "line one\nline two \\ | end"
+        log.log_event("PROPOSAL_UNLOCKED", "bob", target, details)
+        log.close()
+
+        reopened = AuditLog(str(tmp_path))
+        assert reopened.total_entries == 7
+        entry = reopened.read_entries(6)[0]
+        assert (entry["target"], entry["details"]) == (target, details)
+        assert reopened.last_hash == entry["entry_hash"]
+        assert reopened.verify_log_integrity() is True
+
+    def test_unparseable_tail_never_reinitializes(self, tmp_path):
+        """A last entry that does not parse must not wipe the log on reopen."""
+        log = self._log(tmp_path, 5, segment_max_bytes=1024)
+        last_hash = log.last_hash
+        log.close()
+        # An unescaped delimiter, as written before fields were escaped, plus a stale index entry.
+        with open(log.log_file, "ab") as f:
+            offset = f.tell()
+            f.write(b"EVENT | a | b | c | d | e | f | g\n")
+        with open(log.log_file + ".idx", "ab") as f:
+            f.write(offset.to_bytes(8, "little"))
+
+        reopened = AuditLog(str(tmp_path), segment_max_bytes=1024)
+        assert reopened.last_hash == last_hash
+        assert [e["target"] for e in reopened.read_entries(1, 5)] == [f"target-{i:03d}" for i in range(5)]
+        reopened.log_event("EVENT", "bob", "after-restart")
+        assert reopened.verify_log_integrity(full=True) is True
+
+    def test_legacy_log_gets_indexed(self, tmp_path):
+        log = self._log(tmp_path, 5)
+        log.close()
+        os.remove(log.log_file + ".idx")
+
+        reopened = AuditLog(str(tmp_path))
+        assert reopened.total_entries == 6
+        assert reopened.read_entries(5)[0]["target"] == "target-004"
+
+    def test_checkpoints_span_segments(self, tmp_path):
+        signing_key = SigningKey.generate()
+        log = self._log(
+            tmp_path, 30, segment_max_bytes=1024, checkpoint_interval=4, signing_key=signing_key
+        )
+        assert log.verify_log_integrity() is True
+
+        reopened = AuditLog(str(tmp_path), verify_key=signing_key.verify_key)
+        assert reopened.verify_log_integrity() is True
+        assert reopened.entry_count == 31
+        assert reopened.verify_log_integrity(full=True, max_workers=2) is True
+
+    def test_tampering_in_sealed_segment_detected(self, tmp_path):
+        log = self._log(tmp_path, 30, segment_max_bytes=1024, checkpoint_interval=4)
+        sealed = log.segment_files()[1]
+        with open(sealed) as f:
+            data = f.read()
+        with open(sealed, "w") as f:
+            f.write(data.replace("alice", "malic", 1))
+
+        assert log.verify_log_integrity(full=True) is False
+
+    def test_group_commit_fsync(self, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd))
+        log = self._log(tmp_path, 9, fsync_batch_size=4)
+
+        # GENESIS plus 9 events: two full groups of four.
+        assert len(synced) == 2
+        log.flush()
+        assert len(synced) == 3
+        log.close()
+        assert len(synced) == 4
+
+    def test_log_events_batch(self, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd))
+        log = self._log(tmp_path, 0, segment_max_bytes=1024, fsync_batch_size=10)
+
+        hashes = log.log_events([("EVENT", "bob", f"t{i}", "") for i in range(12)])
+
+        assert hashes[-1] == log.last_hash
+        assert [e["entry_hash"] for e in log.read_entries(1)] == hashes
+        assert len(log.segment_files()) > 1
+        assert len(synced) == 3  # one group commit plus one per rotation
+        assert log.verify_log_integrity(full=True) is True
+
+    def test_events_visible_before_fsync(self, tmp_path):
+        log = self._log(tmp_path, 3, fsync_batch_size=100)
+        with open(log.log_file) as f:
+            assert f.read().count("target-") == 3
+
+    def test_invalid_parameters(self, tmp_path):
+        with pytest.raises(ValueError):
+            AuditLog(str(tmp_path), segment_max_bytes=0)
+        with pytest.raises(ValueError):
+            AuditLog(str(tmp_path), fsync_batch_size=0)
+        with pytest.raises(ValueError):
+            AuditLog(str(tmp_path), fsync_interval=0)
+
+
+class TestAuditLogPaging:
+    """Tests for cursor scans, filters and the cached integrity watermark of AuditLog."""
+
+    @pytest.fixture
+    def log(self, tmp_path):
+        log = AuditLog(str(tmp_path), segment_max_bytes=1024)
+        for i in range(30):
+            log.log_event("ACCESS" if i % 3 else "SHARE", f"user-{i % 2}", f"doc-{i:02d}")
+        return log
+
+    def test_query_filters(self, log):
+        shares = list(log.query_entries(event_type="SHARE"))
+        assert [index for index, _ in shares] == list(range(1, 31, 3))
+        assert {entry["event_type"] for _, entry in shares} == {"SHARE"}
+
+        both = list(log.query_entries(event_type="ACCESS", actor="user-1"))
+        assert all(e["event_type"] == "ACCESS" and e["actor"] == "user-1" for _, e in both)
+        assert len(both) == 10
+
+    def test_query_window(self, log):
+        entries = log.read_entries()
+        assert [i for i, _ in log.query_entries(5, 9)] == [5, 6, 7, 8]
+        assert list(log.query_entries(31)) == []
+        assert [i for i, _ in log.query_entries(20, event_type="SHARE")] == [22, 25, 28]
+        assert entries[22]["event_type"] == "SHARE"
+
+    def test_seek_time_and_time_filters(self, log):
+        entries = log.read_entries()
+        since = datetime.fromisoformat(entries[12]["timestamp"])
+        until = datetime.fromisoformat(entries[18]["timestamp"])
+
+        assert log.seek_time(since) <= 12
+        assert log.seek_time(datetime.now(timezone.utc) + timedelta(days=1)) == 31
+        assert log.seek_time(datetime(2000, 1, 1)) == 0
+        window = [e["target"] for _, e in log.query_entries(since=since, until=until)]
+        assert f"doc-{11:02d}" in window and f"doc-{17:02d}" in window
+        assert all(since <= datetime.fromisoformat(e["timestamp"]) <= until
+                   for _, e in log.query_entries(since=since, until=until))
+
+    def test_integrity_status_is_cached(self, log, monkeypatch):
+        calls = []
+        verify = log.verify_log_integrity
+        monkeypatch.setattr(log, "verify_log_integrity", lambda: calls.append(1) or verify())
+
+        assert log.integrity_status() == (True, 31)
+        assert log.integrity_status() == (True, 31)
+        assert len(calls) == 1
+        log.log_event("ACCESS", "user-0", "doc-new")
+        assert log.integrity_status() == (True, 32)
+        assert len(calls) == 2
+
+    def test_integrity_status_reports_failure(self, log):
+        with open(log.log_file) as f:
+            data = f.read()
+        with open(log.log_file, "w") as f:
+            f.write(data.replace("user-1", "user-7", 1))
+
+        assert log.verify_log_integrity(full=True) is False
+        assert log.integrity_status() == (False, 31)
+
+
+class TestMerkleLog:
+    """Tests for the Merkle accumulator and its proofs."""
+
+    def _tree(self, count):
+        merkle = MerkleLog()
+        hashes = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(count)]
+        for h in hashes:
+            merkle.append(h)
+        return merkle, hashes
+
+    def test_known_roots(self):
+        """Roots should follow RFC 6962 leaf/node domain separation."""
+        merkle, hashes = self._tree(3)
+        leaf = [hashlib.sha256(b"\x00" + bytes.fromhex(h)).digest() for h in hashes]
+        node = lambda a, b: hashlib.sha256(b"\x01" + a + b).digest()
+
+        assert merkle.root(1) == leaf[0].hex()
+        assert merkle.root(2) == node(leaf[0], leaf[1]).hex()
+        assert merkle.root() == node(node(leaf[0], leaf[1]), leaf[2]).hex()
+        assert MerkleLog().root() == hashlib.sha256(b"").hexdigest()
+
+    def test_inclusion_proofs(self):
+        merkle, hashes = self._tree(21)
+        for size in (1, 2, 7, 8, 21):
+            root = merkle.root(size)
+            for index in range(size):
+                proof = merkle.inclusion_proof(index, size)
+                assert len(proof) <= size.bit_length()
+                assert MerkleLog.verify_inclusion(hashes[index], index, size, proof, root)
+
+    def test_inclusion_proof_rejects_wrong_leaf(self):
+        merkle, hashes = self._tree(10)
+        proof = merkle.inclusion_proof(3)
+        assert not MerkleLog.verify_inclusion(hashes[4], 3, 10, proof, merkle.root())
+        assert not MerkleLog.verify_inclusion(hashes[3], 4, 10, proof, merkle.root())
+        assert not MerkleLog.verify_inclusion(hashes[3], 3, 10, proof[:-1], merkle.root())
+
+    def test_consistency_proofs(self):
+        merkle, _ = self._tree(21)
+        for new_size in (1, 5, 8, 21):
+            for old_size in range(1, new_size + 1):
+                proof = merkle.consistency_proof(old_size, new_size)
+                assert MerkleLog.verify_consistency(
+                    old_size, new_size, merkle.root(old_size), merkle.root(new_size), proof
+                )
+
+    def test_consistency_proof_rejects_forked_history(self):
+        merkle, hashes = self._tree(12)
+        forked = MerkleLog()
+        for h in hashes[:5] + ["ff" * 32] + hashes[6:]:
+            forked.append(h)
+        proof = forked.consistency_proof(7, 12)
+        assert not MerkleLog.verify_consistency(7, 12, merkle.root(7), forked.root(12), proof)
+
+    def test_out_of_range(self):
+        merkle, _ = self._tree(4)
+        with pytest.raises(ValueError):
+            merkle.inclusion_proof(4)
+        with pytest.raises(ValueError):
+            merkle.consistency_proof(5)
+
+    def test_tamper_evident_log_accumulates(self):
+        log = TamperEvidentLog()
+        hashes = [log.append({"event": i}) for i in range(6)]
+        proof = log.merkle.inclusion_proof(2)
+        assert MerkleLog.verify_inclusion(hashes[2], 2, 6, proof, log.merkle.root())
+
+    def test_audit_log_builds_from_file(self, tmp_path):
+        log = AuditLog(str(tmp_path))
+        for i in range(5):
+            log.log_event("EVENT", "alice", f"target-{i}")
+        reopened = AuditLog(str(tmp_path))
+        root = reopened.merkle.root()
+        reopened.log_event("EVENT", "bob", "target-5")
+
+        assert len(reopened.merkle) == 7
+        assert reopened.merkle.root(6) == root
+        assert MerkleLog.verify_inclusion(
+            reopened.last_hash, 6, 7, reopened.merkle.inclusion_proof(6), reopened.merkle.root()
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,138 @@
+"""
+Tests for the TrustDocs asynchronous audit sink (trustdocs.audit_sink).
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from coc_framework.core.audit_log import AuditLog
+from trustdocs.audit_sink import AuditQueueFull, AuditSink, Backpressure, Durability
+
+
+class _GatedLog:
+    """AuditLog stand-in whose writes block until released."""
+
+    def __init__(self, log):
+        self.log = log
+        self.gate = threading.Event()
+        self.batches = []
+
+    def log_events(self, events):
+        self.gate.wait(5)
+        self.batches.append(len(events))
+        return self.log.log_events(events)
+
+    def flush(self):
+        self.log.flush()
+
+
+@pytest.fixture
+def audit_log(tmp_path):
+    log = AuditLog(str(tmp_path))
+    yield log
+    log.close()
+
+
+class TestAuditSink:
+    """Tests for queueing, durability and backpressure in AuditSink."""
+
+    @pytest.mark.asyncio
+    async def test_fire_and_forget_written_in_order(self, audit_log):
+        sink = AuditSink(audit_log)
+        for i in range(20):
+            assert await sink.log_event("ACCESS", "alice", f"doc-{i}") is None
+        await sink.flush()
+
+        targets = [e["target"] for e in audit_log.read_entries(1)]
+        assert targets == [f"doc-{i}" for i in range(20)]
+        assert audit_log.verify_log_integrity() is True
+        await sink.close()
+
+    @pytest.mark.asyncio
+    async def test_commit_returns_entry_hash(self, audit_log, monkeypatch):
+        synced = []
+        monkeypatch.setattr(audit_log, "flush", lambda: synced.append(True))
+        sink = AuditSink(audit_log)
+
+        entry_hash = await sink.log_event("UNLOCK", "bob", "proposal-1", durability=Durability.COMMIT)
+
+        assert entry_hash == audit_log.last_hash
+        assert audit_log.read_entries(1)[0]["entry_hash"] == entry_hash
+        assert synced
+        await sink.close()
+
+    @pytest.mark.asyncio
+    async def test_events_batched(self, audit_log):
+        gated = _GatedLog(audit_log)
+        sink = AuditSink(gated, batch_size=8)
+        await sink.log_event("ACCESS", "alice", "first")
+        await asyncio.sleep(0.01)  # writer takes "first" and blocks on the gate
+        for i in range(10):
+            await sink.log_event("ACCESS", "alice", f"doc-{i}")
+        gated.gate.set()
+        await sink.flush()
+
+        assert gated.batches == [1, 8, 2]
+        await sink.close()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_drop(self, audit_log):
+        gated = _GatedLog(audit_log)
+        sink = AuditSink(gated, max_queue=2, backpressure=Backpressure.DROP)
+        await sink.log_event("ACCESS", "alice", "first")
+        await asyncio.sleep(0.01)
+        for i in range(5):
+            await sink.log_event("ACCESS", "alice", f"doc-{i}")
+
+        assert sink.pending == 2
+        assert sink.dropped == 3
+        gated.gate.set()
+        await sink.close()
+        assert audit_log.total_entries == 4
+
+    @pytest.mark.asyncio
+    async def test_backpressure_raise(self, audit_log):
+        gated = _GatedLog(audit_log)
+        sink = AuditSink(gated, max_queue=1, backpressure=Backpressure.RAISE)
+        await sink.log_event("ACCESS", "alice", "first")
+        await asyncio.sleep(0.01)
+        await sink.log_event("ACCESS", "alice", "queued")
+
+        with pytest.raises(AuditQueueFull):
+            await sink.log_event("ACCESS", "alice", "overflow")
+        gated.gate.set()
+        await sink.close()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_block_waits_for_room(self, audit_log):
+        gated = _GatedLog(audit_log)
+        sink = AuditSink(gated, max_queue=1)
+        await sink.log_event("ACCESS", "alice", "first")
+        await asyncio.sleep(0.01)
+        await sink.log_event("ACCESS", "alice", "queued")
+
+        blocked = asyncio.ensure_future(sink.log_event("ACCESS", "alice", "blocked"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        gated.gate.set()
+        await asyncio.wait_for(blocked, 5)
+        await sink.close()
+        assert audit_log.total_entries == 4
+
+    @pytest.mark.asyncio
+    async def test_writer_failure_reaches_committed_waiters(self):
+        class BrokenLog:
+            def log_events(self, events):
+                raise OSError("disk full")
+
+        sink = AuditSink(BrokenLog())
+        with pytest.raises(OSError):
+            await sink.log_event("ACCESS", "alice", "doc", durability=Durability.COMMIT)
+
+    def test_invalid_parameters(self, audit_log):
+        with pytest.raises(ValueError):
+            AuditSink(audit_log, max_queue=0)
+        with pytest.raises(ValueError):
+            AuditSink(audit_log, batch_size=0)
@@ -7,6 +7,8 @@ All database calls are mocked so no PostgreSQL or in-memory state is required.
 
 import asyncio
 import json
+import sys
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -16,9 +18,12 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
+from trustdocs.boardroom import routes as boardroom_routes
+from trustdocs.boardroom.cache import UnlockCache
 from trustdocs.boardroom.routes import router
 from trustdocs.auth.dependencies import get_current_user
 from coc_framework.core.secret_sharing import Share
+from coc_framework.core.timelock import TimeLockEngine
 
 # ── Test fixtures ─────────────────────────────────────────────────────────────
 
@@ -49,6 +54,14 @@ BOARDROOM_ID = str(uuid.uuid4())
 PROPOSAL_ID = str(uuid.uuid4())
 
 
+@pytest.fixture(autouse=True)
+def _clear_unlock_cache():
+    """Tests reuse PROPOSAL_ID with different content."""
+    boardroom_routes.unlock_cache.clear()
+    yield
+    boardroom_routes.unlock_cache.clear()
+
+
 def _make_app(current_user: dict = ALICE) -> FastAPI:
     """Build a minimal FastAPI app with boardroom router and auth overridden."""
     app = FastAPI()
@@ -84,6 +97,7 @@ class TestCreateBoardroom:
             mock_db.find_one = AsyncMock(side_effect=[ALICE, BOB])
             mock_db.insert = AsyncMock(side_effect=[mock_boardroom, {}, {}])
             mock_tf.audit_log = MagicMock()
+            mock_tf.audit_sink.log_event = AsyncMock()
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -185,6 +199,7 @@ class TestCreateBoardroom:
             mock_db.find_one = AsyncMock(side_effect=[BOB, ALICE])
             mock_db.insert = AsyncMock(side_effect=[mock_boardroom, {}, {}])
             mock_tf.audit_log = MagicMock()
+            mock_tf.audit_sink.log_event = AsyncMock()
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -286,6 +301,7 @@ class TestCreateProposal:
                 side_effect=[proposal, {}, {}, {}]  # proposal + 3 shares
             )
             mock_tf.audit_log = MagicMock()
+            mock_tf.audit_sink.log_event = AsyncMock()
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -364,8 +380,9 @@ class TestCreateProposal:
             mock_db.insert = AsyncMock(
                 side_effect=[proposal, {}, {}]  # proposal + 2 shares
             )
-            mock_tf.timelock_engine.encrypt.return_value = mock_encrypted
+            mock_tf.timelock_engine.encrypt = AsyncMock(return_value=mock_encrypted)
             mock_tf.audit_log = MagicMock()
+            mock_tf.audit_sink.log_event = AsyncMock()
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -382,7 +399,46 @@ class TestCreateProposal:
             assert resp.status_code == 200
             body = resp.json()
             assert "expires_at" in body
-            mock_tf.timelock_engine.encrypt.assert_called_once_with("Secret", 300)
+            mock_tf.timelock_engine.encrypt.assert_awaited_once_with("Secret", 300)
+
+    @pytest.mark.asyncio
+    async def test_create_large_proposal_stores_ciphertext_once(self, tmp_path):
+        """Large content is streamed into the ciphertext store; share rows only reference it."""
+        from coc_framework.core.secret_sharing import CiphertextStore
+
+        app = _make_app()
+
+        boardroom = {"id": BOARDROOM_ID, "threshold_m": 2}
+        membership = {"boardroom_id": BOARDROOM_ID, "user_id": ALICE_ID}
+        members = [{"user_id": ALICE_ID}, {"user_id": BOB_ID}, {"user_id": CAROL_ID}]
+        proposal = {"id": PROPOSAL_ID, "title": "Annual report", "status": "pending"}
+        content = "Quarterly figures. " * 1000
+
+        with (
+            patch("trustdocs.boardroom.routes.db") as mock_db,
+            patch("trustdocs.boardroom.routes.trustflow") as mock_tf,
+        ):
+            mock_db.find_one = AsyncMock(side_effect=[boardroom, membership])
+            mock_db.find_many = AsyncMock(return_value=members)
+            mock_db.insert = AsyncMock(side_effect=[proposal, {}, {}, {}])
+            mock_tf.ciphertext_store = CiphertextStore(str(tmp_path))
+            mock_tf.audit_sink.log_event = AsyncMock()
+
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                resp = await client.post(
+                    f"/boardrooms/{BOARDROOM_ID}/proposals",
+                    json={"title": "Annual report", "content": content},
+                )
+
+            assert resp.status_code == 200
+            blobs = [c.args[1]["share_blob"] for c in mock_db.insert.call_args_list[1:]]
+            rows = [Share.from_bytes(blob) for blob in blobs]
+            assert all(row.ciphertext == "" for row in rows)
+            assert len({row.ciphertext_ref for row in rows}) == 1
+            assert len(blobs[0]) < len(content)
+            assert rows[0].ciphertext_ref in mock_tf.ciphertext_store
 
 
 # ── Approve proposal ─────────────────────────────────────────────────────────
@@ -420,6 +476,7 @@ class TestApproveProposal:
                 return_value=[{**share_record, "submitted": True}]
             )
             mock_tf.audit_log = MagicMock()
+            mock_tf.audit_sink.log_event = AsyncMock()
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -469,6 +526,7 @@ class TestApproveProposal:
             mock_db.update_one = AsyncMock(return_value=share_record)
             mock_db.find_many = AsyncMock(return_value=submitted_shares)
             mock_tf.audit_log = MagicMock()
+            mock_tf.audit_sink.log_event = AsyncMock()
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -564,6 +622,7 @@ class TestUnlockProposal:
                 "Confidential data [watermarked]"
             )
             mock_tf.audit_log = MagicMock()
+            mock_tf.audit_sink.log_event = AsyncMock()
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -685,6 +744,7 @@ class TestUnlockProposal:
 
             from coc_framework.core.timelock import TimeLockStatus
 
+            mock_tf.timelock_engine.load = AsyncMock(return_value=True)
             mock_tf.timelock_engine.get_status.return_value = TimeLockStatus.EXPIRED
 
             async with AsyncClient(
@@ -720,6 +780,7 @@ class TestUnlockProposal:
 
             from coc_framework.core.timelock import TimeLockStatus
 
+            mock_tf.timelock_engine.load = AsyncMock(return_value=True)
             mock_tf.timelock_engine.get_status.return_value = TimeLockStatus.DESTROYED
 
             async with AsyncClient(
@@ -755,6 +816,7 @@ class TestUnlockProposal:
                 "Engine error"
             )
             mock_tf.audit_log = MagicMock()
+            mock_tf.audit_sink.log_event = AsyncMock()
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -766,6 +828,149 @@ class TestUnlockProposal:
             assert body["content"] == "Plain text"
             assert body["watermarked"] is True  # flag is still set in route
 
+    def _binary_records(self, content: str):
+        from coc_framework.core.secret_sharing import split_secret
+
+        shares, mac_key = split_secret(content, 2, 3)
+        records = [
+            {
+                "id": str(uuid.uuid4()),
+                "proposal_id": PROPOSAL_ID,
+                "user_id": user_id,
+                "share_blob": share.to_bytes(),
+                "submitted": True,
+            }
+            for user_id, share in zip([ALICE_ID, BOB_ID, CAROL_ID], shares)
+        ]
+        return records, mac_key
+
+    @pytest.mark.asyncio
+    async def test_unlock_binary_shares_reconstructed_once(self):
+        """Repeated unlocks by different members reuse the cached plaintext."""
+        proposal = {
+            "id": PROPOSAL_ID,
+            "boardroom_id": BOARDROOM_ID,
+            "title": "Budget Q1",
+            "status": "executed",
+        }
+        boardroom = {"id": BOARDROOM_ID, "threshold_m": 2}
+        records, mac_key = self._binary_records("Binary shares")
+        proposal["share_mac_key"] = mac_key
+
+        with (
+            patch("trustdocs.boardroom.routes.db") as mock_db,
+            patch("trustdocs.boardroom.routes.trustflow") as mock_tf,
+            patch(
+                "trustdocs.boardroom.routes.reconstruct_secret",
+                wraps=boardroom_routes.reconstruct_secret,
+            ) as reconstruct,
+        ):
+            mock_db.find_many = AsyncMock(return_value=records)
+            mock_tf.stegano_engine.embed_watermark.side_effect = (
+                lambda content, peer_id, depth: f"{content} [{peer_id}]"
+            )
+            mock_tf.audit_sink.log_event = AsyncMock()
+
+            contents = []
+            for reader in (ALICE, BOB):
+                membership = {"boardroom_id": BOARDROOM_ID, "user_id": reader["id"]}
+                mock_db.find_one = AsyncMock(side_effect=[proposal, boardroom, membership])
+                async with AsyncClient(
+                    transport=ASGITransport(app=_make_app(reader)), base_url="http://test"
+                ) as client:
+                    resp = await client.get(f"/boardrooms/proposals/{PROPOSAL_ID}/unlock")
+                assert resp.status_code == 200
+                contents.append(resp.json()["content"])
+
+            assert contents == ["Binary shares [peer-alice]", "Binary shares [peer-bob]"]
+            reconstruct.assert_called_once()
+            assert mock_db.find_many.await_count == 1  # share rows loaded once
+
+    @pytest.mark.asyncio
+    async def test_unlock_rejects_tampered_binary_share(self):
+        proposal = {
+            "id": PROPOSAL_ID,
+            "boardroom_id": BOARDROOM_ID,
+            "title": "Budget Q1",
+            "status": "executed",
+        }
+        boardroom = {"id": BOARDROOM_ID, "threshold_m": 2}
+        membership = {"boardroom_id": BOARDROOM_ID, "user_id": ALICE_ID}
+        records, mac_key = self._binary_records("Binary shares")
+        proposal["share_mac_key"] = mac_key
+        tampered = Share.from_bytes(records[0]["share_blob"])
+        tampered.value = tampered.value[:-1] + ("1" if tampered.value[-1] == "0" else "0")
+        records[0]["share_blob"] = tampered.to_bytes()
+
+        with (
+            patch("trustdocs.boardroom.routes.db") as mock_db,
+            patch("trustdocs.boardroom.routes.trustflow") as mock_tf,
+        ):
+            mock_db.find_one = AsyncMock(side_effect=[proposal, boardroom, membership])
+            mock_db.find_many = AsyncMock(return_value=records)
+            mock_tf.audit_sink.log_event = AsyncMock()
+
+            async with AsyncClient(
+                transport=ASGITransport(app=_make_app()), base_url="http://test"
+            ) as client:
+                resp = await client.get(f"/boardrooms/proposals/{PROPOSAL_ID}/unlock")
+
+            assert resp.status_code == 500
+            assert PROPOSAL_ID not in boardroom_routes.unlock_cache
+
+
+# ── Unlock cache ─────────────────────────────────────────────────────────────
+
+
+class TestUnlockCache:
+    """trustdocs.boardroom.cache.UnlockCache"""
+
+    def test_ttl_expiry(self):
+        cache = UnlockCache()
+        cache.put("p1", "plaintext", ttl=0.01)
+        assert cache.get("p1") == "plaintext"
+        time.sleep(0.02)
+        assert cache.get("p1") is None
+        assert cache.size_bytes == 0
+        assert cache.put("p2", "plaintext", ttl=0) is False
+
+    def test_size_bound_evicts_least_recently_used(self):
+        entry = sys.getsizeof("a" * 100)
+        cache = UnlockCache(max_bytes=2 * entry)
+        cache.put("p1", "a" * 100)
+        cache.put("p2", "b" * 100)
+        cache.get("p1")
+        cache.put("p3", "c" * 100)
+
+        assert "p1" in cache and "p3" in cache
+        assert "p2" not in cache
+        assert cache.size_bytes == 2 * entry
+        assert cache.put("huge", "d" * 1000) is False
+
+    def test_invalidated_when_timelock_destroyed(self):
+        engine = TimeLockEngine(cleanup_interval=60)
+        try:
+            cache = UnlockCache()
+            engine.add_destroy_listener(cache.invalidate_lock)
+            encrypted = engine.encrypt("minutes", ttl_seconds=300)
+            lock_id = encrypted.metadata.lock_id
+            cache.put("p1", "minutes", ttl=engine.get_remaining_time(lock_id), lock_id=lock_id)
+            cache.put("p2", "other")
+
+            assert engine.destroy(lock_id)
+            assert "p1" not in cache
+            assert cache.get("p2") == "other"
+        finally:
+            engine.shutdown()
+
+    def test_replacing_entry_keeps_size_consistent(self):
+        cache = UnlockCache()
+        cache.put("p1", "first", lock_id="lock-a")
+        cache.put("p1", "second")
+        assert len(cache) == 1
+        assert cache.size_bytes == sys.getsizeof("second")
+        assert cache.invalidate_lock("lock-a") is False
+
 
 # ── List proposals ───────────────────────────────────────────────────────────
 
@@ -784,6 +989,7 @@ class TestListProposals:
             "initiator_id": uuid.UUID(ALICE_ID),
             "title": "Budget Q1",
             "status": "pending",
+            "share_mac_key": b"\xff" * 32,
         }
         shares = [
             {
@@ -817,6 +1023,7 @@ class TestListProposals:
             assert p["approvals"] == 1
             assert p["user_has_approved"] is True
             assert p["has_timelock"] is False
+            assert "share_mac_key" not in p
 
     @pytest.mark.asyncio
     async def test_list_proposals_access_denied(self):
@@ -880,6 +1087,7 @@ class TestShamirReconstruction:
                 content
             )
             mock_tf.audit_log = MagicMock()
+            mock_tf.audit_sink.log_event = AsyncMock()
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
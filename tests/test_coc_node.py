@@ -0,0 +1,112 @@
+"""
+Tests for coc_framework.core.coc_node module.
+"""
+
+import pytest
+from nacl.signing import SigningKey
+
+from coc_framework.core.coc_node import CoCNode, pack_hash, unpack_hash
+from coc_framework.core.crypto_core import CryptoCore
+
+
+@pytest.fixture
+def signing_key():
+    return SigningKey.generate()
+
+
+@pytest.fixture
+def node(signing_key):
+    return CoCNode(
+        content_hash=CryptoCore.hash_content("payload"),
+        owner_id="owner",
+        signing_key=signing_key,
+        recipient_ids=["r2", "r1"],
+    )
+
+
+class TestCoCNodeRepresentation:
+    """Test suite for the packed in-memory layout of CoCNode."""
+
+    def test_slotted(self, node):
+        """Nodes should not carry a per-instance __dict__."""
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.extra = 1
+
+    def test_hashes_packed_as_bytes(self, node):
+        """Canonical hex hashes should be held as 32 raw bytes."""
+        assert node._node_hash == bytes.fromhex(node.node_hash)
+        assert node._content_hash == bytes.fromhex(node.content_hash)
+        assert node.parent_hash is None
+
+    def test_non_canonical_hash_kept_verbatim(self):
+        """Identifiers that are not SHA-256 hex should pass through unchanged."""
+        assert pack_hash("node-1") == "node-1"
+        assert pack_hash("A" * 64) == "A" * 64
+        assert unpack_hash(pack_hash("ab" * 32)) == "ab" * 32
+
+    def test_timestamp_packed_as_micros(self, node):
+        """Generated timestamps should be stored as epoch micros and round-trip."""
+        assert isinstance(node.timestamp_micros, int)
+        node.timestamp = "2024-01-01T00:00:00.000001+00:00"
+        assert node.timestamp_micros == 1704067200000001
+        assert node.timestamp == "2024-01-01T00:00:00.000001+00:00"
+
+    def test_non_utc_timestamp_kept_verbatim(self, node):
+        """Timestamps that would not round-trip exactly should stay strings."""
+        for value in (
+            "2024-01-01T00:00:00+02:00",
+            "2024-01-01T00:00:00Z",
+            "2024-01-01 00:00:00+00:00",
+            "2024-01-01T00:00:00.000000+00:00",
+            "2024-02-30T00:00:00+00:00",
+            "not-a-date",
+        ):
+            node.timestamp = value
+            assert node.timestamp_micros is None
+            assert node.timestamp == value
+
+    def test_children_set_semantics(self, node):
+        """children_hashes should behave like a set over hex strings."""
+        child = "cd" * 32
+        node.children_hashes.add(child)
+        node.children_hashes.add(child)
+        node.children_hashes.add("legacy-child")
+        assert len(node.children_hashes) == 2
+        assert child in node.children_hashes
+        assert set(node.children_hashes) == {child, "legacy-child"}
+        assert node._children[0] == bytes.fromhex(child)
+
+        node.children_hashes.discard(child)
+        assert set(node.children_hashes) == {"legacy-child"}
+        node.children_hashes = {"ef" * 32}
+        assert list(node.children_hashes) == ["ef" * 32]
+
+    def test_dict_round_trip(self, node, signing_key):
+        """to_dict/from_dict should keep the schema v2 form and signature validity."""
+        node.children_hashes.add("cd" * 32)
+        data = node.to_dict()
+        copy = CoCNode.from_dict(data)
+
+        assert copy.to_dict() == data
+        assert data["schema_version"] == 2
+        assert data["recipient_ids"] == ["r1", "r2"]
+        assert isinstance(data["timestamp"], str)
+        assert copy.verify_signature(signing_key.verify_key)
+
+    def test_from_dict_legacy_fields(self):
+        """Test identifiers and verbatim timestamps should survive from_dict."""
+        data = {
+            "node_hash": "node-1",
+            "content_hash": "content-1",
+            "owner_id": "owner",
+            "timestamp": "2024-01-01T00:00:00Z",
+            "children_hashes": ["node-2"],
+        }
+        node = CoCNode.from_dict(data)
+
+        assert node.schema_version == 1
+        assert node.node_hash == "node-1"
+        assert node.timestamp == "2024-01-01T00:00:00Z"
+        assert set(node.children_hashes) == {"node-2"}
+        assert node.signature is None
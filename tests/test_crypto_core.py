@@ -4,7 +4,10 @@ Tests for coc_framework.core.crypto_core module.
 
 import pytest
 from nacl.signing import SigningKey
-from coc_framework.core.crypto_core import CryptoCore
+from coc_framework.core.crypto_core import CryptoCore, BatchVerifier
+from coc_framework.core.coc_node import CoCNode
+from coc_framework.core.deletion_engine import DeletionReceipt
+from coc_framework.network.gossip import GossipEnvelope
 
 
 class TestCryptoCore:
@@ -129,5 +132,71 @@ class TestCryptoCore:
         assert len(content_hash) == 64
 
 
+class TestBatchVerification:
+    """Test suite for CryptoCore.verify_batch and BatchVerifier."""
+
+    def _items(self, count):
+        signing_key, verify_key = CryptoCore.generate_keypair()
+        items = []
+        for i in range(count):
+            message = f"message-{i}"
+            items.append((verify_key, message, CryptoCore.sign_message(signing_key, message)))
+        return items
+
+    def test_verify_batch_all_valid(self):
+        """Every valid triple should verify."""
+        assert CryptoCore.verify_batch(self._items(10)) == [True] * 10
+
+    def test_verify_batch_per_item_results(self):
+        """Invalid and missing items should fail without affecting the others."""
+        items = self._items(4)
+        vk, message, signature = items[1]
+        items[1] = (vk, message + "x", signature)
+        items[2] = None
+        assert CryptoCore.verify_batch(items) == [True, False, False, True]
+
+    def test_verify_batch_empty(self):
+        """An empty batch should return an empty list."""
+        assert CryptoCore.verify_batch([]) == []
+
+    def test_verify_batch_process_pool(self):
+        """The process-pool path should match inline results and keep ordering."""
+        items = self._items(40)
+        vk, message, signature = items[7]
+        items[7] = (vk, message, signature[:-1] + bytes([signature[-1] ^ 0x01]))
+        expected = CryptoCore.verify_batch(items)
+        results = CryptoCore.verify_batch(items, max_workers=2, parallel_threshold=1)
+        assert results == expected
+        assert results.count(False) == 1 and results[7] is False
+
+    def test_batch_verifier_accepts_signed_objects(self):
+        """CoCNode, DeletionReceipt and GossipEnvelope should all submit to one batch."""
+        signing_key, verify_key = CryptoCore.generate_keypair()
+        _, other_key = CryptoCore.generate_keypair()
+
+        node = CoCNode("a" * 64, "owner", signing_key, ["r1"])
+        unsigned = CoCNode("b" * 64, "owner", None, [])
+        receipt = DeletionReceipt(
+            token_hash="t", peer_id="p", timestamp="2024-01-01T00:00:00+00:00",
+            success=True, node_hash="n",
+        )
+        receipt.sign(signing_key)
+        envelope = GossipEnvelope(msg_id="m", payload={"k": "v"}, origin_id="o")
+        envelope.sign(signing_key)
+
+        verifier = BatchVerifier()
+        indices = [
+            verifier.submit(node, verify_key),
+            verifier.submit(unsigned, verify_key),
+            verifier.submit(receipt, verify_key),
+            verifier.submit(envelope, other_key),
+            verifier.add(verify_key, "raw", CryptoCore.sign_message(signing_key, "raw")),
+        ]
+        results = verifier.verify()
+
+        assert len(verifier) == 5
+        assert [results[i] for i in indices] == [True, False, True, False, True]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
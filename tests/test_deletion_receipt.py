@@ -445,10 +445,11 @@ class TestDeletionTokenGetHash:
 class TestDeletionEngineWithTracker:
     """Integration tests for DeletionEngine with DeletionTracker."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
         """Set up test fixtures."""
         self.peer_discovery = RegistryPeerDiscovery()
-        self.audit_log = AuditLog()
+        self.audit_log = AuditLog(str(tmp_path))
         self.notification_handler = SilentNotificationHandler()
         self.tracker = DeletionTracker()
 
@@ -0,0 +1,194 @@
+"""
+Tests for the columnar graph snapshot export (coc_framework.interfaces.graph_snapshot).
+"""
+
+import os
+from array import array
+import pytest
+from nacl.signing import SigningKey
+
+from coc_framework.core.coc_node import CoCNode
+from coc_framework.core.crypto_core import CryptoCore
+from coc_framework.interfaces.storage_backend import (
+    StorageBackend,
+    InMemoryStorage,
+    GraphStorage,
+    SQLiteStorage,
+)
+from coc_framework.interfaces.graph_snapshot import GraphSnapshot, write_snapshot
+
+
+@pytest.fixture
+def signing_key():
+    return SigningKey.generate()
+
+
+def _node(signing_key, tag, parent=None, recipients=()):
+    node = CoCNode(
+        content_hash=CryptoCore.hash_content(tag),
+        owner_id=f"owner-{tag}",
+        signing_key=signing_key,
+        recipient_ids=list(recipients),
+        parent_hash=parent.node_hash if parent else None,
+        depth=parent.depth + 1 if parent else 0,
+    )
+    if parent:
+        parent.add_child(node)
+    return node
+
+
+@pytest.fixture
+def tree(signing_key):
+    # root -> a -> (a1, a2), root -> b
+    root = _node(signing_key, "root", recipients=["r1", "r2"])
+    a = _node(signing_key, "a", root, ["r3"])
+    b = _node(signing_key, "b", root)
+    a1 = _node(signing_key, "a1", a)
+    a2 = _node(signing_key, "a2", a, ["r1"])
+    return {"root": root, "a": a, "b": b, "a1": a1, "a2": a2}
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return str(tmp_path / "graph.snap")
+
+
+def _storage(tree):
+    storage = InMemoryStorage()
+    for node in tree.values():
+        storage.add_node(node)
+    return storage
+
+
+class TestGraphSnapshot:
+    """Tests for write_snapshot and GraphSnapshot."""
+
+    def test_round_trip_preserves_nodes(self, tree, snapshot_path):
+        assert write_snapshot(_storage(tree), snapshot_path) == 5
+        assert sorted(os.listdir(snapshot_path)) == [
+            "edges.col", "keys.col", "nodes.col", "recipients.col", "strings.col",
+        ]
+
+        with GraphSnapshot(snapshot_path) as graph:
+            assert isinstance(graph, StorageBackend)
+            assert len(graph) == 5
+            for node in tree.values():
+                loaded = graph.get_node(node.node_hash)
+                assert loaded.to_dict() == node.to_dict()
+            assert graph.get_node("missing") is None
+            assert {n.node_hash for n in graph.get_all_nodes()} == {
+                n.node_hash for n in tree.values()
+            }
+
+    def test_signatures_survive(self, tree, signing_key, snapshot_path):
+        write_snapshot(tree.values(), snapshot_path)
+        with GraphSnapshot(snapshot_path) as graph:
+            assert graph.get_node(tree["a2"].node_hash).verify_signature(signing_key.verify_key)
+
+    def test_traversals_match_graph_storage(self, tree, snapshot_path):
+        reference = GraphStorage()
+        for node in tree.values():
+            reference.add_node(node)
+        write_snapshot(reference, snapshot_path)
+
+        with GraphSnapshot(snapshot_path) as graph:
+            root, a1 = tree["root"].node_hash, tree["a1"].node_hash
+            assert [n.node_hash for n in graph.descendants(root)] == [
+                n.node_hash for n in reference.descendants(root)
+            ]
+            assert [n.node_hash for n in graph.ancestors(a1)] == [
+                tree["a"].node_hash, root,
+            ]
+            assert graph.root_of(a1).node_hash == root
+            assert graph.subtree_size(root) == 5
+            assert graph.subtree_size("missing") == 0
+            assert graph.children_of(root) == reference.children_of(root)
+            assert len(tree["root"].get_all_descendants(graph)) == 4
+
+    def test_missing_nodes_are_referenced_but_absent(self, tree, snapshot_path):
+        """Parents/children outside the export stop traversals like removed nodes."""
+        partial = {k: v for k, v in tree.items() if k != "a"}
+        write_snapshot(partial.values(), snapshot_path)
+
+        with GraphSnapshot(snapshot_path) as graph:
+            assert graph.subtree_size(tree["root"].node_hash) == 2
+            assert graph.root_of(tree["a1"].node_hash).node_hash == tree["a1"].node_hash
+            assert tree["a"].node_hash in graph.get_node(tree["root"].node_hash).children_hashes
+            assert graph.get_node(tree["a"].node_hash) is None
+
+    def test_corrupt_cycle_terminates(self, tree, snapshot_path):
+        """An edge column pointing back up the tree must not hang traversal."""
+        write_snapshot(tree.values(), snapshot_path)
+        with GraphSnapshot(snapshot_path) as graph:
+            root_id = graph.node_id(tree["root"].node_hash)
+            a1_id = graph.node_id(tree["a1"].node_hash)
+            edges = graph._edge_child.tolist()
+            edges[edges.index(a1_id)] = root_id  # a -> root instead of a -> a1
+            graph._edge_child = array(graph._edge_child.format, edges)
+
+            hashes = {n.node_hash for n in graph.descendants(tree["root"].node_hash)}
+            assert hashes == {tree[k].node_hash for k in ("a", "b", "a2")}
+            assert graph.subtree_size(tree["root"].node_hash) == 4
+
+    def test_columns_are_zero_copy_views(self, tree, snapshot_path):
+        write_snapshot(tree.values(), snapshot_path)
+        graph = GraphSnapshot(snapshot_path)
+        depth = graph.column("nodes", "depth")
+        assert isinstance(depth, memoryview) and depth.readonly
+        assert sorted(depth.tolist()) == [0, 1, 1, 2, 2]
+        assert len(graph.column("edges", "child")) == 4
+        depth.release()
+        graph.close()
+
+    def test_read_only(self, tree, snapshot_path):
+        write_snapshot(tree.values(), snapshot_path)
+        with GraphSnapshot(snapshot_path) as graph:
+            with pytest.raises(PermissionError):
+                graph.add_node(tree["root"])
+            with pytest.raises(PermissionError):
+                graph.remove_node(tree["root"].node_hash)
+            assert graph.get_content(tree["root"].content_hash) is None
+
+    def test_content_lookup(self, tree, snapshot_path):
+        write_snapshot(tree.values(), snapshot_path)
+        with GraphSnapshot(snapshot_path) as graph:
+            content_hash = tree["b"].content_hash
+            assert graph.is_content_referenced(content_hash)
+            assert [n.node_hash for n in graph.get_nodes_by_content(content_hash)] == [
+                tree["b"].node_hash
+            ]
+            assert not graph.is_content_referenced("0" * 64)
+
+    def test_non_canonical_fields(self, snapshot_path):
+        """Test ids and verbatim timestamps should be kept through the string table."""
+        node = CoCNode.from_dict({
+            "node_hash": "node-1",
+            "content_hash": "content-1",
+            "parent_hash": "node-0",
+            "owner_id": "owner",
+            "timestamp": "2024-01-01T00:00:00Z",
+            "children_hashes": ["node-2"],
+            "schema_version": 2,
+        })
+        write_snapshot([node], snapshot_path)
+
+        with GraphSnapshot(snapshot_path) as graph:
+            assert graph.get_node("node-1").to_dict() == node.to_dict()
+            assert graph.subtree_size("node-1") == 1
+
+    def test_export_from_sqlite(self, tree, tmp_path, snapshot_path):
+        with SQLiteStorage(str(tmp_path / "graph.db")) as storage:
+            for node in tree.values():
+                storage.add_node(node)
+            write_snapshot(storage, snapshot_path)
+
+        with GraphSnapshot(snapshot_path) as graph:
+            assert graph.subtree_size(tree["root"].node_hash) == 5
+
+    def test_rejects_foreign_files(self, tmp_path):
+        path = tmp_path / "bad.snap"
+        path.mkdir()
+        for table in ("keys", "nodes", "edges", "recipients", "strings"):
+            (path / f"{table}.col").write_bytes(b"\x00" * 32)
+        with pytest.raises(ValueError):
+            GraphSnapshot(str(path))
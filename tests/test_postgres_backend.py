@@ -0,0 +1,290 @@
+"""Tests for PostgresStorageBackend query shapes, using a fake asyncpg pool."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from coc_framework.core.coc_node import CoCNode
+from coc_framework.core.crypto_core import CryptoCore
+from coc_framework.interfaces.postgres_backend import (
+    BULK_COPY_THRESHOLD,
+    PostgresStorageBackend,
+    PostgresTimeLockKeyBackend,
+)
+
+
+class FakeConnection:
+    """Records every query and answers fetch() with queued results."""
+
+    def __init__(self, results=None):
+        self.results = list(results or [])
+        self.queries = []
+
+    async def fetch(self, sql, *args):
+        self.queries.append((sql, args))
+        return self.results.pop(0) if self.results else []
+
+    async def execute(self, sql, *args):
+        self.queries.append((sql, args))
+        return "OK"
+
+    async def executemany(self, sql, records):
+        self.queries.append((sql, list(records)))
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.queries.append((f"COPY {table}", list(records)))
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions = getattr(self, "transactions", 0) + 1
+        yield
+
+    async def cursor(self, sql, *args, prefetch=None):
+        self.queries.append((sql, args))
+        self.prefetch = prefetch
+        for row in (self.results.pop(0) if self.results else []):
+            yield row
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+def _row(node_hash, parent_hash=None, depth=0, level=0, recipients=(), children=()):
+    return {
+        "node_hash": node_hash,
+        "content_hash": CryptoCore.hash_content(node_hash),
+        "parent_hash": parent_hash,
+        "owner_peer_id": "owner",
+        "signature": None,
+        "depth": depth,
+        "schema_version": 2,
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "level": level,
+        "recipient_ids": list(recipients),
+        "children_hashes": list(children),
+    }
+
+
+class TestGetSubtree:
+    """get_subtree should fetch a whole trace in one recursive query."""
+
+    @pytest.mark.asyncio
+    async def test_single_query_builds_nodes(self):
+        conn = FakeConnection([[
+            _row("root", children=["a", "b"], recipients=["p2", "p1"]),
+            _row("a", parent_hash="root", depth=1, level=1, children=["a1"]),
+            _row("b", parent_hash="root", depth=1, level=1),
+            _row("a1", parent_hash="a", depth=2, level=2),
+        ]])
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            nodes = await PostgresStorageBackend().get_subtree("root")
+
+        assert len(conn.queries) == 1
+        sql, args = conn.queries[0]
+        assert "WITH RECURSIVE" in sql
+        assert args[0] == "root"
+        assert [n.node_hash for n in nodes] == ["root", "a", "b", "a1"]
+        assert all(isinstance(n, CoCNode) for n in nodes)
+        assert nodes[0].recipient_ids == ["p1", "p2"]
+        assert nodes[0].children_hashes == {"a", "b"}
+        assert nodes[3].parent_hash == "a"
+
+    @pytest.mark.asyncio
+    async def test_max_depth_is_passed_to_query(self):
+        conn = FakeConnection([[_row("root")]])
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            await PostgresStorageBackend().get_subtree("root", max_depth=3)
+
+        assert conn.queries[0][1] == ("root", 3)
+
+    @pytest.mark.asyncio
+    async def test_missing_root_returns_empty(self):
+        conn = FakeConnection([[]])
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            assert await PostgresStorageBackend().get_subtree("missing") == []
+
+
+class TestGetAllNodes:
+    """get_all_nodes should hydrate the whole graph without per-node queries."""
+
+    def _rows(self, count):
+        rows = [_row("n0", children=["n1"], recipients=["p1"])]
+        for i in range(1, count):
+            children = [f"n{i + 1}"] if i + 1 < count else []
+            rows.append(_row(f"n{i}", parent_hash=f"n{i - 1}", depth=i, children=children))
+        return rows
+
+    @pytest.mark.asyncio
+    async def test_constant_query_count(self):
+        conn = FakeConnection([self._rows(50)])
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            nodes = await PostgresStorageBackend().get_all_nodes()
+
+        assert len(conn.queries) == 1
+        assert len(nodes) == 50
+        assert nodes[0].recipient_ids == ["p1"]
+        assert nodes[0].children_hashes == {"n1"}
+        assert nodes[49].parent_hash == "n48"
+
+    @pytest.mark.asyncio
+    async def test_iter_all_nodes_streams(self):
+        conn = FakeConnection([self._rows(5)])
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            hashes = [n.node_hash async for n in PostgresStorageBackend().iter_all_nodes(batch_size=2)]
+
+        assert hashes == ["n0", "n1", "n2", "n3", "n4"]
+        assert len(conn.queries) == 1
+        assert conn.prefetch == 2
+
+
+def _signed_nodes(count, recipients=("p1", "p2")):
+    signing_key, _ = CryptoCore.generate_keypair()
+    return [
+        CoCNode(CryptoCore.hash_content(f"c{i}"), "owner", signing_key, list(recipients))
+        for i in range(count)
+    ]
+
+
+class TestAddNodesBulk:
+    """add_nodes_bulk should batch node and recipient inserts in one transaction."""
+
+    @pytest.mark.asyncio
+    async def test_small_batch_uses_executemany(self):
+        conn = FakeConnection()
+        nodes = _signed_nodes(3)
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            await PostgresStorageBackend().add_nodes_bulk(
+                nodes, recipient_links=[("parent", "p9")]
+            )
+
+        assert conn.transactions == 1
+        assert len(conn.queries) == 2
+        node_sql, node_records = conn.queries[0]
+        recipient_sql, recipient_records = conn.queries[1]
+        assert "ON CONFLICT (node_hash) DO NOTHING" in node_sql
+        assert [r[0] for r in node_records] == [n.node_hash for n in nodes]
+        assert len(recipient_records) == 3 * 2 + 1
+        assert ("parent", "p9") in recipient_records
+
+    @pytest.mark.asyncio
+    async def test_large_batch_uses_copy(self):
+        conn = FakeConnection()
+        nodes = _signed_nodes(BULK_COPY_THRESHOLD, recipients=())
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            await PostgresStorageBackend().add_nodes_bulk(nodes)
+
+        statements = [q[0] for q in conn.queries]
+        assert "COPY _stage_coc_nodes" in statements
+        merge = next(sql for sql in statements if sql.startswith("INSERT INTO coc_nodes"))
+        assert "ON CONFLICT (node_hash) DO NOTHING" in merge
+        assert not any(sql.startswith("INSERT INTO coc_recipients") for sql in statements)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_nodes_collapsed(self):
+        conn = FakeConnection()
+        node = _signed_nodes(1)[0]
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            await PostgresStorageBackend().add_nodes_bulk([node, node])
+
+        assert len(conn.queries[0][1]) == 1
+        assert len(conn.queries[1][1]) == 2
+
+    @pytest.mark.asyncio
+    async def test_add_node_goes_through_bulk_path(self):
+        conn = FakeConnection()
+        node = _signed_nodes(1)[0]
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            await PostgresStorageBackend().add_node(node)
+
+        assert conn.transactions == 1
+        assert conn.queries[0][1][0][0] == node.node_hash
+
+
+class TestTimeLockKeyBackend:
+    """PostgresTimeLockKeyBackend should hit the indexed timelock_keys table."""
+
+    class KeyConnection(FakeConnection):
+        def __init__(self, row=None, status="DELETE 0", value=None):
+            super().__init__()
+            self.row, self.status, self.value = row, status, value
+
+        async def execute(self, sql, *args):
+            self.queries.append((sql, args))
+            return self.status
+
+        async def fetchrow(self, sql, *args):
+            self.queries.append((sql, args))
+            return self.row
+
+        async def fetchval(self, sql, *args):
+            self.queries.append((sql, args))
+            return self.value
+
+    @pytest.mark.asyncio
+    async def test_put_and_get(self):
+        expires = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        conn = self.KeyConnection(row={
+            "wrapped_key": b"wrapped", "expires_at": expires, "metadata": '{"lock_id": "l1"}',
+            "status": "ACTIVE",
+        })
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            backend = PostgresTimeLockKeyBackend()
+            await backend.put("l1", b"wrapped", expires, {"lock_id": "l1"})
+            stored = await backend.get("l1")
+
+        assert "ON CONFLICT (lock_id)" in conn.queries[0][0]
+        assert conn.queries[0][1] == ("l1", b"wrapped", expires, '{"lock_id": "l1"}', "ACTIVE")
+        assert stored == (b"wrapped", expires, {"lock_id": "l1"}, "ACTIVE")
+
+    @pytest.mark.asyncio
+    async def test_get_tombstone(self):
+        expires = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        conn = self.KeyConnection(row={
+            "wrapped_key": None, "expires_at": expires, "metadata": {}, "status": "EXPIRED",
+        })
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            stored = await PostgresTimeLockKeyBackend().get("l1")
+
+        assert stored == (None, expires, {}, "EXPIRED")
+
+    @pytest.mark.asyncio
+    async def test_purge_is_one_range_update(self):
+        now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        conn = self.KeyConnection(status="UPDATE 3")
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            assert await PostgresTimeLockKeyBackend().purge_expired(now) == 3
+
+        assert len(conn.queries) == 1
+        sql, args = conn.queries[0]
+        assert sql.startswith("UPDATE timelock_keys SET wrapped_key = NULL")
+        assert "wrapped_key IS NOT NULL AND expires_at < $1" in sql
+        assert args == (now, "EXPIRED")
+
+    @pytest.mark.asyncio
+    async def test_destroy_and_next_expiry(self):
+        conn = self.KeyConnection(status="UPDATE 1", value=None)
+
+        with patch("coc_framework.interfaces.postgres_backend.db._pool", FakePool(conn)):
+            backend = PostgresTimeLockKeyBackend()
+            assert await backend.destroy("l1") is True
+            assert await backend.next_expiry() is None
@@ -1,15 +1,30 @@
 """
 Tests for coc_framework.core.secret_sharing module.
 """
+import io
+import os
+
 import pytest
 from coc_framework.core.secret_sharing import (
     split_secret,
+    split_stream,
     reconstruct_secret,
+    reconstruct_stream,
+    CiphertextStore,
     verify_share,
     verify_share_mac,
     Share,
     SecretSharingEngine,
     ShareIntegrityError,
+    PRIME,
+    SCHEME_GF256,
+    authenticate_shares,
+    _batch_inverse,
+    _gf256_inverse,
+    _gf256_mul,
+    _evaluate_polynomial,
+    _lagrange_basis,
+    _lagrange_interpolation,
 )
 
 
@@ -463,3 +478,231 @@ class TestSecretSharingEngineAuthorization:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestLagrangeArithmetic:
+    """Tests for the shared Lagrange basis used by reconstruct_secret."""
+
+    def test_batch_inverse(self):
+        values = [3, 7, PRIME - 1, 2**200 + 5]
+        for value, inverse in zip(values, _batch_inverse(values, PRIME)):
+            assert value * inverse % PRIME == 1
+
+    def test_batch_inverse_rejects_zero(self):
+        with pytest.raises(ValueError):
+            _batch_inverse([3, 0, 5], PRIME)
+
+    def test_basis_interpolates_constant_term(self):
+        # f(x) = 42 + 5x + 9x^2
+        points = [(x, (42 + 5 * x + 9 * x * x) % PRIME) for x in (2, 5, 11)]
+        basis = _lagrange_basis([x for x, _ in points], PRIME)
+        assert sum(y * c for (_, y), c in zip(points, basis)) % PRIME == 42
+        assert _lagrange_interpolation(points, PRIME) == 42
+
+    def test_reconstruct_any_share_subset(self):
+        secret = "x" * 200  # several chunks on the direct path
+        shares, hmac_key = split_secret(secret, threshold=4, num_shares=9)
+        for subset in (shares[:4], shares[5:], shares[::2]):
+            assert reconstruct_secret(subset, hmac_key=hmac_key) == secret
+
+    def test_reconstruct_rejects_duplicate_indices(self):
+        shares, _ = split_secret("duplicate", threshold=2, num_shares=3)
+        with pytest.raises(ValueError):
+            reconstruct_secret([shares[0], shares[0]])
+
+    def test_reconstruct_skips_duplicates_when_enough_distinct(self):
+        shares, hmac_key = split_secret("duplicate", threshold=3, num_shares=5)
+        for subset in ([shares[0], shares[0], shares[1], shares[1], shares[2]],
+                       [shares[4], shares[4], shares[4], shares[3], shares[0]]):
+            assert reconstruct_secret(subset, hmac_key=hmac_key) == "duplicate"
+
+
+class TestSplitEvaluation:
+    """Tests for Horner evaluation and the pooled split path."""
+
+    def test_horner_matches_power_sum(self):
+        coefficients = [PRIME - 3, 2**255, 17, 2**100]
+        for x in (1, 2, 99):
+            expected = sum(c * pow(x, i, PRIME) for i, c in enumerate(coefficients)) % PRIME
+            assert _evaluate_polynomial(coefficients, x, PRIME) == expected
+
+    def test_wire_format_unchanged(self):
+        secret = "y" * 100
+        shares, hmac_key = split_secret(secret, threshold=3, num_shares=4)
+        for share in shares:
+            parts = share.value.split("|")
+            assert len(parts) == 1 + 4  # length header + ceil(100 / 31) chunks
+            assert all(part.startswith("0x") and int(part, 16) < PRIME for part in parts)
+            assert verify_share_mac(share, hmac_key)
+
+    def test_pooled_split(self):
+        secret = "pooled secret"
+        shares, hmac_key = split_secret(
+            secret, threshold=3, num_shares=6, max_workers=2, parallel_threshold=1
+        )
+        assert [s.index for s in shares] == list(range(1, 7))
+        assert reconstruct_secret(shares[3:], hmac_key=hmac_key) == secret
+
+
+class TestGF256Scheme:
+    """Tests for byte-wise Shamir sharing over GF(256)."""
+
+    def test_field_arithmetic(self):
+        assert _gf256_mul(0x57, 0x83) == 0xC1  # FIPS-197 worked example
+        assert all(_gf256_mul(a, _gf256_inverse(a)) == 1 for a in range(1, 256))
+        with pytest.raises(ValueError):
+            _gf256_inverse(0)
+
+    @pytest.mark.parametrize("secret", ["", "short", "ü" * 100, "z" * 1000])
+    def test_round_trip(self, secret):
+        shares, hmac_key = split_secret(secret, threshold=3, num_shares=6, scheme=SCHEME_GF256)
+        assert reconstruct_secret(shares[1:4], hmac_key=hmac_key) == secret
+        assert reconstruct_secret(shares[::2], hmac_key=hmac_key) == secret
+
+    def test_shares_are_raw_bytes(self):
+        secret = "b" * 200
+        shares, hmac_key = split_secret(secret, threshold=2, num_shares=3, scheme=SCHEME_GF256)
+        for share in shares:
+            assert share.scheme == SCHEME_GF256
+            assert isinstance(share.value, bytes) and len(share.value) == 200
+            assert verify_share_mac(share, hmac_key)
+
+    def test_dict_round_trip(self):
+        shares, hmac_key = split_secret("wire", threshold=2, num_shares=3, scheme=SCHEME_GF256)
+        data = shares[0].to_dict()
+        assert isinstance(data["value"], str)
+        restored = [Share.from_dict(s.to_dict()) for s in shares[:2]]
+        assert restored[0].value == shares[0].value
+        assert reconstruct_secret(restored, hmac_key=hmac_key) == "wire"
+
+    def test_tampering_detected(self):
+        shares, hmac_key = split_secret("tamper", threshold=2, num_shares=3, scheme=SCHEME_GF256)
+        shares[0].value = bytes([shares[0].value[0] ^ 1]) + shares[0].value[1:]
+        with pytest.raises(ShareIntegrityError):
+            reconstruct_secret(shares[:2], hmac_key=hmac_key)
+
+    def test_limits_and_mixing(self):
+        with pytest.raises(ValueError):
+            split_secret("too many", threshold=2, num_shares=256, scheme=SCHEME_GF256)
+        with pytest.raises(ValueError):
+            split_secret("unknown", threshold=2, num_shares=3, scheme="rot13")
+        gf_shares, _ = split_secret("mix", threshold=2, num_shares=3, scheme=SCHEME_GF256)
+        prime_shares, _ = split_secret("mix", threshold=2, num_shares=3)
+        with pytest.raises(ValueError):
+            reconstruct_secret([gf_shares[0], prime_shares[1]])
+
+    def test_engine_scheme_selection(self):
+        engine = SecretSharingEngine(default_scheme=SCHEME_GF256)
+        share_map = engine.split_content("engine", ["a", "b", "c"], threshold=2)
+        assert all(share.scheme == SCHEME_GF256 for share in share_map.values())
+        assert engine.reconstruct_content([share_map["a"], share_map["c"]]) == "engine"
+
+        prime_map = engine.split_content("engine", ["a", "b"], scheme="prime")
+        assert prime_map["a"].scheme == "prime"
+
+
+class TestStreamingSplit:
+    """Tests for split_stream / reconstruct_stream over a CiphertextStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return CiphertextStore(str(tmp_path / "ciphertexts"))
+
+    def test_roundtrip_from_iterator(self, store):
+        data = os.urandom(10_000)
+        pieces = (data[i:i + 777] for i in range(0, len(data), 777))
+        shares, hmac_key = split_stream(pieces, 3, 5, store, chunk_size=1024)
+
+        blocks = list(reconstruct_stream(shares[1:4], store, hmac_key=hmac_key))
+        assert b"".join(blocks) == data
+        assert [len(b) for b in blocks] == [1024] * 9 + [784]
+
+    def test_ciphertext_stored_once(self, store):
+        text = "board minutes " * 500
+        shares, _ = split_stream(io.BytesIO(text.encode()), 2, 4, store)
+
+        assert len({s.ciphertext_ref for s in shares}) == 1
+        assert shares[0].ciphertext_ref in store
+        assert all(s.is_hybrid and s.ciphertext == "" for s in shares)
+        assert len(os.listdir(os.path.dirname(store.path(shares[0].ciphertext_ref)))) == 1
+        restored = [Share.from_dict(s.to_dict()) for s in shares[2:]]
+        assert reconstruct_secret(restored, store=store) == text
+
+    def test_empty_stream(self, store):
+        shares, _ = split_stream(iter([]), 2, 3, store)
+        assert b"".join(reconstruct_stream(shares[:2], store)) == b""
+
+    def test_gf256_scheme(self, store):
+        shares, hmac_key = split_stream([b"abc", b"def"], 2, 3, store, scheme=SCHEME_GF256)
+        assert b"".join(reconstruct_stream(shares[:2], store, hmac_key)) == b"abcdef"
+
+    def test_tampered_ciphertext(self, store):
+        shares, _ = split_stream(io.BytesIO(b"x" * 5000), 2, 3, store, chunk_size=1024)
+        path = store.path(shares[0].ciphertext_ref)
+        with open(path, "r+b") as f:
+            f.seek(2000)
+            byte = f.read(1)
+            f.seek(2000)
+            f.write(bytes([byte[0] ^ 1]))
+
+        stream = reconstruct_stream(shares[:2], store)
+        assert next(stream) == b"x" * 1024
+        with pytest.raises(ShareIntegrityError):
+            next(stream)
+        assert reconstruct_secret(shares[:2], store=store) is None
+
+    def test_truncated_ciphertext(self, store):
+        shares, _ = split_stream(io.BytesIO(b"y" * 4096), 2, 3, store, chunk_size=1024)
+        path = store.path(shares[0].ciphertext_ref)
+        with open(path, "r+b") as f:
+            f.truncate(2 * (1024 + 16))  # drop the last two whole chunks
+
+        with pytest.raises(ShareIntegrityError):
+            b"".join(reconstruct_stream(shares[:2], store))
+
+    def test_requires_store(self, store):
+        shares, _ = split_stream([b"data"], 2, 3, store)
+        with pytest.raises(ValueError):
+            reconstruct_secret(shares[:2])
+        inline, _ = split_secret("inline", 2, 3)
+        with pytest.raises(ValueError):
+            reconstruct_stream(inline[:2], store)
+
+    def test_invalid_reference(self, store):
+        with pytest.raises(ValueError):
+            store.path("../../etc/passwd")
+
+
+class TestBinaryShares:
+    """Tests for Share.to_bytes / from_bytes and batched MAC checks."""
+
+    @pytest.mark.parametrize("scheme", ["prime", SCHEME_GF256])
+    @pytest.mark.parametrize("content", ["short", "long " * 100])
+    def test_roundtrip(self, scheme, content):
+        shares, hmac_key = split_secret(content, threshold=2, num_shares=3, scheme=scheme)
+        restored = [Share.from_bytes(s.to_bytes()) for s in shares]
+        assert restored == shares
+        assert len(shares[0].to_bytes()) < len(str(shares[0].to_dict()))
+        assert reconstruct_secret(restored[1:], hmac_key=hmac_key) == content
+
+    def test_streamed_share_roundtrip(self, tmp_path):
+        shares, _ = split_stream([b"stream"], 2, 3, CiphertextStore(str(tmp_path)))
+        assert Share.from_bytes(shares[0].to_bytes()) == shares[0]
+
+    def test_malformed(self):
+        shares, _ = split_secret("malformed", threshold=2, num_shares=3)
+        data = shares[0].to_bytes()
+        for bad in (data[:10], data[:-1], data + b"\0", b"\x09" + data[1:]):
+            with pytest.raises(ValueError):
+                Share.from_bytes(bad)
+
+    def test_authenticate_shares(self):
+        shares, hmac_key = split_secret("batch", threshold=3, num_shares=6)
+        authenticate_shares(shares, hmac_key)
+
+        shares[4].mac = shares[3].mac
+        with pytest.raises(ShareIntegrityError, match=shares[4].share_id):
+            authenticate_shares(shares, hmac_key)
+        shares[4].mac = ""
+        with pytest.raises(ShareIntegrityError):
+            authenticate_shares(shares, hmac_key)
@@ -0,0 +1,138 @@
+"""
+Tests for coc_framework.core.signature_cache module.
+"""
+
+import time
+
+import pytest
+
+from coc_framework.core.crypto_core import CryptoCore
+from coc_framework.core.coc_node import CoCNode
+from coc_framework.core.signature_cache import SignatureCache, get_signature_cache
+from coc_framework.network.protocol import (
+    HeartbeatMessage,
+    SignedEnvelope,
+    SignatureVerificationError,
+    unwrap_and_verify,
+)
+
+
+@pytest.fixture
+def keypair():
+    return CryptoCore.generate_keypair()
+
+
+@pytest.fixture
+def shared_cache():
+    cache = get_signature_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+class TestSignatureCache:
+    """Test suite for SignatureCache."""
+
+    def test_second_verify_is_a_hit(self, keypair):
+        """Repeated verification of the same data should hit the cache."""
+        sk, vk = keypair
+        signature = CryptoCore.sign_message(sk, "payload")
+        cache = SignatureCache()
+
+        assert cache.verify("id-1", vk, "payload", signature) is True
+        assert cache.verify("id-1", vk, "payload", signature) is True
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_keyed_by_verify_key(self, keypair):
+        """A different key must not reuse another key's result."""
+        sk, vk = keypair
+        _, other_vk = CryptoCore.generate_keypair()
+        signature = CryptoCore.sign_message(sk, "payload")
+        cache = SignatureCache()
+
+        assert cache.verify("id-1", vk, "payload", signature) is True
+        assert cache.verify("id-1", other_vk, "payload", signature) is False
+
+    def test_altered_message_is_reverified(self, keypair):
+        """Changing signed data under the same id should miss and fail."""
+        sk, vk = keypair
+        signature = CryptoCore.sign_message(sk, "payload")
+        cache = SignatureCache()
+
+        assert cache.verify("id-1", vk, "payload", signature) is True
+        assert cache.verify("id-1", vk, "tampered", signature) is False
+        assert cache.stats()["hits"] == 0
+
+    def test_lru_eviction(self, keypair):
+        """The least recently used entry should be evicted at capacity."""
+        sk, vk = keypair
+        cache = SignatureCache(max_size=2)
+        sigs = {i: CryptoCore.sign_message(sk, f"m{i}") for i in range(3)}
+
+        cache.verify("a", vk, "m0", sigs[0])
+        cache.verify("b", vk, "m1", sigs[1])
+        cache.verify("a", vk, "m0", sigs[0])
+        cache.verify("c", vk, "m2", sigs[2])
+
+        assert len(cache) == 2
+        assert cache.stats()["evictions"] == 1
+        assert cache.get("b", vk, "m1", sigs[1]) is None
+        assert cache.get("a", vk, "m0", sigs[0]) is True
+
+    def test_ttl_expiry(self, keypair):
+        """Entries older than the TTL should be treated as misses."""
+        sk, vk = keypair
+        signature = CryptoCore.sign_message(sk, "payload")
+        cache = SignatureCache(ttl_seconds=0.01)
+
+        cache.verify("id-1", vk, "payload", signature)
+        time.sleep(0.02)
+
+        assert cache.get("id-1", vk, "payload", signature) is None
+        assert len(cache) == 0
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            SignatureCache(max_size=0)
+
+
+class TestSignatureCacheIntegration:
+    """The shared cache should back node and envelope verification."""
+
+    def test_coc_node_verified_once(self, keypair, shared_cache):
+        sk, vk = keypair
+        node = CoCNode("a" * 64, "owner", sk, ["r1"])
+        copy = CoCNode.from_dict(node.to_dict())
+
+        assert node.verify_signature(vk) is True
+        assert copy.verify_signature(vk) is True
+        assert shared_cache.stats()["hits"] == 1
+
+    def test_tampered_node_not_served_from_cache(self, keypair, shared_cache):
+        sk, vk = keypair
+        node = CoCNode("a" * 64, "owner", sk, ["r1"])
+        assert node.verify_signature(vk) is True
+
+        node.recipient_ids = ["attacker"]
+        assert node.verify_signature(vk) is False
+
+    def test_unwrap_and_verify_uses_cache(self, keypair, shared_cache):
+        sk, vk = keypair
+        data = SignedEnvelope.wrap(HeartbeatMessage(sender_id="p1"), "p1", sk).to_bytes()
+
+        unwrap_and_verify(data, lambda _: vk)
+        unwrap_and_verify(data, lambda _: vk)
+
+        assert shared_cache.stats()["hits"] == 1
+
+        _, other_vk = CryptoCore.generate_keypair()
+        with pytest.raises(SignatureVerificationError):
+            unwrap_and_verify(data, lambda _: other_vk)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,7 +2,9 @@
 Tests for StorageBackend implementations (InMemoryStorage and SQLiteStorage).
 """
 
+import json
 import os
+import sqlite3
 import tempfile
 import pytest
 from nacl.signing import SigningKey
@@ -12,7 +14,9 @@ from coc_framework.core.crypto_core import CryptoCore
 from coc_framework.interfaces.storage_backend import (
     StorageBackend,
     InMemoryStorage,
+    GraphStorage,
     SQLiteStorage,
+    SQLITE_SCHEMA_VERSION,
 )
 
 
@@ -179,6 +183,120 @@ class TestInMemoryStorage:
         
         assert in_memory_storage.is_content_referenced(sample_node.content_hash) is False
 
+    def test_get_all_descendants_corrupt_cycle_terminates(self, in_memory_storage, sample_node, another_node):
+        """Nodes listing each other as children must not make traversal loop forever."""
+        sample_node.children_hashes.add(another_node.node_hash)
+        another_node.children_hashes.add(sample_node.node_hash)
+        in_memory_storage.add_node(sample_node)
+        in_memory_storage.add_node(another_node)
+
+        descendants = sample_node.get_all_descendants(in_memory_storage)
+        assert [n.node_hash for n in descendants] == [another_node.node_hash]
+
+
+def _child_of(parent, signing_key, tag):
+    child = CoCNode(
+        content_hash=CryptoCore.hash_content(tag),
+        owner_id=f"owner-{tag}",
+        signing_key=signing_key,
+        recipient_ids=[],
+        parent_hash=parent.node_hash,
+        depth=parent.depth + 1,
+    )
+    parent.add_child(child)
+    return child
+
+
+class TestGraphStorage:
+    """Tests for the adjacency-indexed GraphStorage."""
+
+    @pytest.fixture
+    def tree(self, signing_key, sample_node):
+        # sample_node -> a -> (a1, a2), sample_node -> b
+        a = _child_of(sample_node, signing_key, "a")
+        b = _child_of(sample_node, signing_key, "b")
+        a1 = _child_of(a, signing_key, "a1")
+        a2 = _child_of(a, signing_key, "a2")
+        return {"root": sample_node, "a": a, "b": b, "a1": a1, "a2": a2}
+
+    def test_is_storage_backend(self):
+        assert isinstance(GraphStorage(), StorageBackend)
+
+    def test_descendants_and_subtree_size(self, tree):
+        storage = GraphStorage()
+        for node in tree.values():
+            storage.add_node(node)
+
+        hashes = {n.node_hash for n in storage.descendants(tree["root"].node_hash)}
+        assert hashes == {tree[k].node_hash for k in ("a", "b", "a1", "a2")}
+        assert storage.subtree_size(tree["root"].node_hash) == 5
+        assert storage.subtree_size(tree["a"].node_hash) == 3
+        assert storage.subtree_size("missing") == 0
+
+    def test_out_of_order_insertion(self, tree):
+        """Children stored before their parent should still be linked."""
+        storage = GraphStorage()
+        for key in ("a2", "a1", "b", "a", "root"):
+            storage.add_node(tree[key])
+
+        assert storage.subtree_size(tree["root"].node_hash) == 5
+
+    def test_ancestors_and_root_of(self, tree):
+        storage = GraphStorage()
+        for node in tree.values():
+            storage.add_node(node)
+
+        chain = storage.ancestors(tree["a1"].node_hash)
+        assert [n.node_hash for n in chain] == [tree["a"].node_hash, tree["root"].node_hash]
+        assert storage.root_of(tree["a1"].node_hash) is tree["root"]
+        assert storage.root_of(tree["root"].node_hash) is tree["root"]
+        assert storage.root_of("missing") is None
+
+    def test_removed_node_cuts_traversal(self, tree):
+        storage = GraphStorage()
+        for node in tree.values():
+            storage.add_node(node)
+
+        storage.remove_node(tree["a"].node_hash)
+
+        assert storage.subtree_size(tree["root"].node_hash) == 2
+        assert storage.root_of(tree["a1"].node_hash) is tree["a1"]
+        assert storage.get_node(tree["a"].node_hash) is None
+
+    def test_deep_chain_has_no_recursion_limit(self, signing_key, sample_node):
+        storage = GraphStorage()
+        storage.add_node(sample_node)
+        current = sample_node
+        for i in range(3000):
+            current = _child_of(current, signing_key, f"n{i}")
+            storage.add_node(current)
+
+        assert storage.subtree_size(sample_node.node_hash) == 3001
+        assert storage.root_of(current.node_hash) is sample_node
+        assert len(sample_node.get_all_descendants(storage)) == 3000
+
+    def test_corrupt_cycle_terminates(self, tree):
+        """Parent links forming a cycle must not make traversal loop forever."""
+        storage = GraphStorage()
+        for node in tree.values():
+            storage.add_node(node)
+        root_id = storage.node_id(tree["root"].node_hash)
+        storage._link(storage.node_id(tree["a1"].node_hash), root_id)  # root -> a -> a1 -> root
+
+        hashes = {n.node_hash for n in storage.descendants(tree["a"].node_hash)}
+        assert hashes == {tree[k].node_hash for k in ("root", "b", "a1", "a2")}
+        assert storage.subtree_size(tree["root"].node_hash) == 5
+
+    def test_get_all_descendants_matches_in_memory(self, tree):
+        graph, plain = GraphStorage(), InMemoryStorage()
+        for node in tree.values():
+            graph.add_node(node)
+            plain.add_node(node)
+
+        expected = {n.node_hash for n in tree["root"].get_all_descendants(plain)}
+        actual = {n.node_hash for n in tree["root"].get_all_descendants(graph)}
+        assert actual == expected
+
 
 class TestSQLiteStorage:
     """Tests for SQLiteStorage implementation."""
@@ -397,6 +515,85 @@ class TestSQLiteStorageContextManager:
         assert storage._conn is None
 
 
+class TestSQLiteStorageBatching:
+    """Tests for SQLiteStorage write batching and journal settings."""
+
+    def _committed_node_count(self, path):
+        import sqlite3
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_default_commits_every_write(self, temp_db_path, sample_node):
+        with SQLiteStorage(temp_db_path) as storage:
+            storage.add_node(sample_node)
+            assert storage.pending_writes == 0
+            assert self._committed_node_count(temp_db_path) == 1
+
+    def test_batch_size_flushes_by_count(self, temp_db_path, sample_node, another_node):
+        with SQLiteStorage(temp_db_path, batch_size=2) as storage:
+            storage.add_node(sample_node)
+            assert storage.pending_writes == 1
+            assert self._committed_node_count(temp_db_path) == 0
+            # Reads on the same connection see uncommitted writes
+            assert storage.get_node(sample_node.node_hash) is not None
+
+            storage.add_node(another_node)
+            assert storage.pending_writes == 0
+            assert self._committed_node_count(temp_db_path) == 2
+
+    def test_flush_interval(self, temp_db_path, sample_node, another_node):
+        import time as _time
+        with SQLiteStorage(temp_db_path, flush_interval=0.01) as storage:
+            storage.add_node(sample_node)
+            _time.sleep(0.02)
+            storage.add_node(another_node)
+            assert storage.pending_writes == 0
+            assert self._committed_node_count(temp_db_path) == 2
+
+    def test_flush_interval_checked_on_read(self, temp_db_path, sample_node):
+        import time as _time
+        with SQLiteStorage(temp_db_path, flush_interval=0.05) as storage:
+            storage.flush()  # restart the interval
+            storage.add_node(sample_node)
+            assert storage.pending_writes == 1
+            _time.sleep(0.06)
+            assert storage.get_content("missing") is None
+            assert storage.pending_writes == 0
+            assert self._committed_node_count(temp_db_path) == 1
+
+    def test_batch_context_manager(self, temp_db_path, sample_node, another_node):
+        with SQLiteStorage(temp_db_path) as storage:
+            with storage.batch():
+                storage.add_node(sample_node)
+                storage.add_node(another_node)
+                assert storage.pending_writes == 2
+                assert self._committed_node_count(temp_db_path) == 0
+            assert storage.pending_writes == 0
+            assert self._committed_node_count(temp_db_path) == 2
+
+    def test_close_flushes_pending(self, temp_db_path, sample_node):
+        storage = SQLiteStorage(temp_db_path, batch_size=100)
+        storage.add_node(sample_node)
+        storage.close()
+        assert self._committed_node_count(temp_db_path) == 1
+
+    def test_file_database_uses_wal(self, temp_db_path):
+        with SQLiteStorage(temp_db_path) as storage:
+            mode = storage._conn.execute("PRAGMA journal_mode").fetchone()[0]
+            assert mode.lower() == "wal"
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            SQLiteStorage(batch_size=0)
+        with pytest.raises(ValueError):
+            SQLiteStorage(flush_interval=0)
+        with pytest.raises(ValueError):
+            SQLiteStorage(journal_mode="bogus")
+
+
 class TestSQLiteStorageNodeSerialization:
     """Tests for proper CoCNode serialization/deserialization."""
 
@@ -449,3 +646,114 @@ class TestSQLiteStorageNodeSerialization:
         retrieved = sqlite_storage.get_node(sample_node.node_hash)
         
         assert retrieved.timestamp == sample_node.timestamp
+
+
+def _write_v2_database(path, nodes):
+    """Create a database in the pre-binary (schema v2) JSON layout."""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE nodes (
+            node_hash TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            owner_id TEXT NOT NULL,
+            data TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+        CREATE INDEX idx_nodes_content_hash ON nodes(content_hash);
+        CREATE INDEX idx_nodes_owner_id ON nodes(owner_id);
+        CREATE TABLE schema_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+        INSERT INTO schema_meta VALUES ('version', '2');
+    """)
+    for node in nodes:
+        conn.execute(
+            "INSERT INTO nodes VALUES (?, ?, ?, ?, ?)",
+            (node.node_hash, node.content_hash, node.owner_id,
+             json.dumps(node.to_dict()), node.timestamp),
+        )
+    conn.commit()
+    conn.close()
+
+
+class TestSQLiteStorageBinaryEncoding:
+    """Tests for the binary (schema v3) node layout."""
+
+    def test_hashes_stored_as_raw_bytes(self, sqlite_storage, sample_node):
+        sqlite_storage.add_node(sample_node)
+        node_key, content_key, record = sqlite_storage._conn.execute(
+            "SELECT node_hash, content_hash, record FROM nodes"
+        ).fetchone()
+
+        assert node_key == bytes.fromhex(sample_node.node_hash)
+        assert content_key == bytes.fromhex(sample_node.content_hash)
+        # header + 2 recipient refs + int timestamp + 64-byte signature
+        assert len(record) == 10 + 2 * 4 + 8 + 2 + 64
+
+    def test_recipients_interned(self, sqlite_storage, sample_node, another_node, signing_key):
+        third = CoCNode(
+            content_hash=CryptoCore.hash_content("third"),
+            owner_id="test-owner-123",
+            signing_key=signing_key,
+            recipient_ids=["recipient-1"],
+        )
+        for node in (sample_node, another_node, third):
+            sqlite_storage.add_node(node)
+
+        peers = sqlite_storage._conn.execute("SELECT COUNT(*) FROM peers").fetchone()[0]
+        assert peers == 5
+        assert sqlite_storage.get_node(third.node_hash).recipient_ids == ["recipient-1"]
+
+    def test_round_trip_matches_dict(self, sqlite_storage, sample_node, signing_key):
+        child = _child_of(sample_node, signing_key, "child")
+        sqlite_storage.add_node(sample_node)
+        sqlite_storage.add_node(child)
+
+        assert sqlite_storage.get_node(sample_node.node_hash).to_dict() == sample_node.to_dict()
+        assert sqlite_storage.get_node(child.node_hash).to_dict() == child.to_dict()
+
+    def test_non_canonical_values_round_trip(self, sqlite_storage):
+        node = CoCNode("not-a-hash", "owner", None, [])
+        node.node_hash = "legacy-node-id"
+        node.timestamp = "2024-01-01T00:00:00"
+        node.children_hashes = {"legacy-child"}
+        sqlite_storage.add_node(node)
+
+        retrieved = sqlite_storage.get_node("legacy-node-id")
+        assert retrieved.to_dict() == node.to_dict()
+        assert retrieved.signature is None
+        assert sqlite_storage.get_nodes_by_content("not-a-hash")[0].node_hash == "legacy-node-id"
+
+    def test_children_stored_as_edges(self, sqlite_storage, sample_node, signing_key):
+        children = [_child_of(sample_node, signing_key, f"c{i}") for i in range(3)]
+        sqlite_storage.add_node(sample_node)
+
+        edges = sqlite_storage._conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+        assert edges == 3
+        assert len(sqlite_storage.get_all_nodes()[0].children_hashes) == 3
+
+        sample_node.children_hashes.discard(children[0].node_hash)
+        sqlite_storage.add_node(sample_node)
+        retrieved = sqlite_storage.get_node(sample_node.node_hash)
+        assert children[0].node_hash not in retrieved.children_hashes
+
+        sqlite_storage.remove_node(sample_node.node_hash)
+        assert sqlite_storage._conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0] == 0
+
+    def test_migrates_v2_database(self, temp_db_path, sample_node, another_node, signing_key):
+        child = _child_of(sample_node, signing_key, "child")
+        _write_v2_database(temp_db_path, [sample_node, another_node, child])
+
+        with SQLiteStorage(temp_db_path) as storage:
+            version = storage._conn.execute(
+                "SELECT value FROM schema_meta WHERE key = 'version'"
+            ).fetchone()[0]
+            assert int(version) == SQLITE_SCHEMA_VERSION
+            assert storage.get_node(sample_node.node_hash).to_dict() == sample_node.to_dict()
+            assert storage.get_node(child.node_hash).parent_hash == sample_node.node_hash
+            assert len(storage.get_nodes_by_owner("test-owner-456")) == 1
+            tables = {row[0] for row in storage._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )}
+            assert "nodes_json_legacy" not in tables
+
+        with SQLiteStorage(temp_db_path) as storage:
+            assert len(storage.get_all_nodes()) == 3
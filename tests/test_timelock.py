@@ -1,10 +1,14 @@
 """
 Tests for coc_framework.core.timelock module.
 """
+import asyncio
 import pytest
 import time
 from datetime import datetime, timedelta, timezone
+from coc_framework.core import timelock
 from coc_framework.core.timelock import (
+    AsyncExpiryScheduler,
+    AsyncTimeLockEngine,
     TimeLockEngine,
     TimeLockStatus,
     TimeLockMetadata,
@@ -84,6 +88,78 @@ class TestKeyStore:
         assert abs((retrieved_expiry - expiry).total_seconds()) < 1
 
 
+class TestKeyStoreExpiryScheduler:
+    """Tests for the heap-driven expiry daemon in KeyStore."""
+
+    @staticmethod
+    def _wait_for(predicate, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return predicate()
+
+    def test_daemon_wipes_at_deadline_not_interval(self):
+        """A key is wiped at its expiry even when the interval is much longer."""
+        expired = []
+        store = KeyStore(on_expire=expired.append)
+        store.start_cleanup_daemon(interval=30.0)
+        try:
+            store.store_key("later", b"k" * 32, datetime.now(timezone.utc) + timedelta(hours=1))
+            store.store_key("soon", b"k" * 32, datetime.now(timezone.utc) + timedelta(seconds=0.1))
+
+            assert self._wait_for(lambda: expired == ["soon"])
+            assert "soon" not in store._keys
+            assert store.get_key("later") is not None
+        finally:
+            store.stop_cleanup_daemon()
+
+    def test_extend_expiry_reschedules(self):
+        expired = []
+        store = KeyStore(on_expire=expired.append)
+        store.start_cleanup_daemon(interval=30.0)
+        try:
+            store.store_key("lock", b"k" * 32, datetime.now(timezone.utc) + timedelta(seconds=0.1))
+            assert store.extend_expiry("lock", timedelta(seconds=0.3)) is not None
+
+            time.sleep(0.2)
+            assert expired == []
+            assert self._wait_for(lambda: expired == ["lock"])
+        finally:
+            store.stop_cleanup_daemon()
+
+    def test_extend_expiry_unknown_or_expired(self):
+        store = KeyStore()
+        store.store_key("old", b"k" * 32, datetime.now(timezone.utc) - timedelta(seconds=1))
+        assert store.extend_expiry("old", timedelta(seconds=60)) is None
+        assert store.extend_expiry("missing", timedelta(seconds=60)) is None
+
+    def test_destroyed_key_does_not_fire(self):
+        expired = []
+        store = KeyStore(on_expire=expired.append)
+        store.store_key("lock", b"k" * 32, datetime.now(timezone.utc) - timedelta(seconds=1))
+        store.destroy_key("lock")
+
+        assert store._cleanup_expired() == []
+        assert expired == []
+
+    def test_lazy_expiry_fires_once(self):
+        expired = []
+        store = KeyStore(on_expire=expired.append)
+        store.store_key("lock", b"k" * 32, datetime.now(timezone.utc) - timedelta(seconds=1))
+
+        assert store.get_key("lock") is None
+        assert store._cleanup_expired() == []
+        assert expired == ["lock"]
+
+    def test_stale_heap_entries_bounded(self):
+        store = KeyStore()
+        expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+        store.store_key("lock", b"k" * 32, expiry)
+        for i in range(1000):
+            store.extend_expiry("lock", timedelta(seconds=1))
+        assert len(store._heap) <= 2 * len(store._keys) + 64
+
+
 class TestTimeLockMetadata:
     """Tests for TimeLockMetadata dataclass."""
 
@@ -205,6 +281,16 @@ class TestTimeLockEngine:
         # Should fail after destroy
         assert engine.decrypt(encrypted) is None
 
+    def test_destroy_notifies_listeners(self, engine):
+        """Destroy listeners receive the lock_id, only for locks actually destroyed."""
+        destroyed = []
+        engine.add_destroy_listener(destroyed.append)
+        encrypted = engine.encrypt("content", ttl_seconds=60)
+
+        assert engine.destroy(encrypted.metadata.lock_id)
+        assert not engine.destroy(encrypted.metadata.lock_id)
+        assert destroyed == [encrypted.metadata.lock_id]
+
     def test_get_status_active(self, engine):
         """Should return ACTIVE for valid lock."""
         encrypted = engine.encrypt("test", ttl_seconds=60)
@@ -244,11 +330,131 @@ class TestTimeLockEngine:
         new_remaining = engine.get_remaining_time(lock_id)
         assert new_remaining > original_remaining
 
+    def test_on_expire_callback_fired(self):
+        """on_expire runs once when the key expires, and marks the lock EXPIRED."""
+        fired = []
+        engine = TimeLockEngine(cleanup_interval=30.0)
+        try:
+            encrypted = engine.encrypt("test", ttl_seconds=0, on_expire=fired.append)
+            lock_id = encrypted.metadata.lock_id
+
+            deadline = time.monotonic() + 2.0
+            while not fired and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert fired == [lock_id]
+            assert engine.get_status(lock_id) == TimeLockStatus.EXPIRED
+            assert engine._metadata_store[lock_id].status == "EXPIRED"
+        finally:
+            engine.shutdown()
+
+    def test_on_expire_not_fired_after_destroy(self, engine):
+        fired = []
+        encrypted = engine.encrypt("test", ttl_seconds=60, on_expire=fired.append)
+        engine.destroy(encrypted.metadata.lock_id)
+        engine.key_store._cleanup_expired()
+        assert fired == []
+
     def test_extend_ttl_nonexistent_lock(self, engine):
         """extend_ttl should return False for nonexistent lock."""
         assert engine.extend_ttl("nonexistent", 30) is False
 
 
+class TestAsyncTimeLockEngine:
+    """Tests for AsyncTimeLockEngine and the shared AsyncExpiryScheduler."""
+
+    @staticmethod
+    async def _wait_for(predicate, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        return predicate()
+
+    @pytest.mark.asyncio
+    async def test_encrypt_decrypt(self):
+        engine = AsyncTimeLockEngine()
+        encrypted = await engine.encrypt("async secret", ttl_seconds=60)
+
+        assert await engine.decrypt(encrypted) == "async secret"
+        assert engine.key_store._cleanup_thread is None
+        await engine.scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_offload_above_threshold(self, monkeypatch):
+        offloaded = []
+        to_thread = asyncio.to_thread
+
+        async def counting_to_thread(func, *args):
+            offloaded.append(func.__name__)
+            return await to_thread(func, *args)
+
+        monkeypatch.setattr(timelock.asyncio, "to_thread", counting_to_thread)
+        engine = AsyncTimeLockEngine(offload_threshold=100)
+
+        small = await engine.encrypt("x" * 100, ttl_seconds=60)
+        assert await engine.decrypt(small) == "x" * 100
+        assert offloaded == []
+
+        large = await engine.encrypt("y" * 101, ttl_seconds=60)
+        assert await engine.decrypt(large) == "y" * 101
+        assert offloaded == ["_seal", "_open"]
+        await engine.scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_engines_share_one_scheduler(self):
+        scheduler = AsyncExpiryScheduler()
+        engines = [AsyncTimeLockEngine(scheduler) for _ in range(3)]
+        fired = []
+
+        locks = [
+            (await engine.encrypt("short", ttl_seconds=0.05 * (i + 1), on_expire=fired.append)).metadata.lock_id
+            for i, engine in enumerate(engines)
+        ]
+        kept = await engines[0].encrypt("long", ttl_seconds=60)
+
+        assert await self._wait_for(lambda: len(fired) == 3)
+        assert fired == locks
+        assert all(e.get_status(lock) == TimeLockStatus.EXPIRED for e, lock in zip(engines, locks))
+        assert engines[0].get_status(kept.metadata.lock_id) == TimeLockStatus.ACTIVE
+        await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_extend_ttl_reschedules(self):
+        engine = AsyncTimeLockEngine()
+        fired = []
+        encrypted = await engine.encrypt("extend", ttl_seconds=0.1, on_expire=fired.append)
+        assert engine.extend_ttl(encrypted.metadata.lock_id, 0.3)
+
+        await asyncio.sleep(0.2)
+        assert fired == []
+        assert await engine.decrypt(encrypted) == "extend"
+        assert await self._wait_for(lambda: fired == [encrypted.metadata.lock_id])
+        await engine.scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_deadline_from_worker_thread(self):
+        engine = AsyncTimeLockEngine()
+        await engine.encrypt("warm-up", ttl_seconds=60)  # starts the scheduler task
+        fired = []
+        engine.key_store.on_expire = fired.append
+        expiry = datetime.now(timezone.utc) + timedelta(seconds=0.05)
+        await asyncio.to_thread(engine.key_store.store_key, "threaded", b"k" * 32, expiry)
+
+        assert await self._wait_for(lambda: fired == ["threaded"])
+        await engine.scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_detaches(self):
+        scheduler = AsyncExpiryScheduler()
+        engine = AsyncTimeLockEngine(scheduler)
+        await engine.encrypt("detached", ttl_seconds=60)
+        engine.shutdown()
+
+        assert scheduler._stores == {}
+        assert engine.key_store._deadline_listener is None
+        await scheduler.close()
+
+
 class TestSimulatedTimeLockService:
     """Tests for the SimulatedTimeLockService class."""
 
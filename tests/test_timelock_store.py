@@ -0,0 +1,322 @@
+"""
+Tests for persistent time-lock key storage (coc_framework.interfaces.timelock_store).
+"""
+import asyncio
+import os
+import secrets
+import stat
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from coc_framework.core.timelock import (
+    AsyncTimeLockEngine,
+    TimeLockStatus,
+    unwrap_key,
+    wrap_key,
+)
+from coc_framework.interfaces.timelock_store import (
+    SQLiteTimeLockKeyBackend,
+    load_or_create_master_key,
+)
+
+
+MASTER_KEY = b"m" * 32
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "keys.db")
+
+
+async def _open_engine(db_path, master_key=MASTER_KEY, purge_interval=60.0):
+    engine = AsyncTimeLockEngine()
+    await engine.open(SQLiteTimeLockKeyBackend(db_path), master_key, purge_interval=purge_interval)
+    return engine
+
+
+async def _close_engine(engine):
+    await engine.close()
+    engine.shutdown()
+    await engine.scheduler.close()
+
+
+class TestKeyWrapping:
+    """Tests for wrap_key / unwrap_key and the master key file."""
+
+    def test_round_trip(self):
+        key = secrets.token_bytes(32)
+        wrapped = wrap_key(MASTER_KEY, "lock-1", key)
+
+        assert key not in wrapped
+        assert unwrap_key(MASTER_KEY, "lock-1", wrapped) == key
+
+    def test_bound_to_lock_and_master_key(self):
+        wrapped = wrap_key(MASTER_KEY, "lock-1", b"k" * 32)
+
+        with pytest.raises(ValueError):
+            unwrap_key(MASTER_KEY, "lock-2", wrapped)
+        with pytest.raises(ValueError):
+            unwrap_key(b"x" * 32, "lock-1", wrapped)
+
+    def test_master_key_file_created_once(self, tmp_path):
+        path = str(tmp_path / "keys" / "master.key")
+        master_key = load_or_create_master_key(path)
+
+        assert len(master_key) == 32
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert load_or_create_master_key(path) == master_key
+
+    def test_master_key_file_wrong_size(self, tmp_path):
+        path = tmp_path / "master.key"
+        path.write_bytes(b"short")
+
+        with pytest.raises(ValueError):
+            load_or_create_master_key(str(path))
+
+
+class TestSQLiteTimeLockKeyBackend:
+    """Tests for the SQLite key backend."""
+
+    @pytest.mark.asyncio
+    async def test_put_get_update_destroy(self, db_path):
+        backend = SQLiteTimeLockKeyBackend(db_path)
+        expires = _now() + timedelta(minutes=5)
+
+        await backend.put("l1", b"wrapped", expires, {"lock_id": "l1"})
+        stored = await backend.get("l1")
+        assert stored.wrapped_key == b"wrapped"
+        assert abs((stored.expires_at - expires).total_seconds()) < 1e-3
+        assert stored.metadata == {"lock_id": "l1"}
+
+        later = expires + timedelta(minutes=5)
+        assert await backend.update_expiry("l1", later, {"lock_id": "l1", "ttl": 1})
+        assert (await backend.get("l1")).metadata == {"lock_id": "l1", "ttl": 1}
+        assert not await backend.update_expiry("missing", later, {})
+
+        assert await backend.destroy("l1")
+        assert not await backend.destroy("l1")
+        tombstone = await backend.get("l1")
+        assert tombstone.wrapped_key is None and tombstone.status == "DESTROYED"
+        assert not await backend.update_expiry("l1", later, {})
+        assert await backend.get("missing") is None
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_purge_range_and_next_expiry(self, db_path):
+        backend = SQLiteTimeLockKeyBackend(db_path)
+        now = _now()
+        for i, offset in enumerate([-30, -10, 10, 30]):
+            await backend.put(f"l{i}", b"w", now + timedelta(seconds=offset), {})
+
+        assert await backend.purge_expired(now) == 2
+        assert await backend.purge_expired(now) == 0  # tombstones are not purged again
+        for lock_id in ("l0", "l1"):
+            tombstone = await backend.get(lock_id)
+            assert tombstone.wrapped_key is None and tombstone.status == "EXPIRED"
+        assert (await backend.get("l2")).wrapped_key == b"w"
+        assert abs((await backend.next_expiry() - (now + timedelta(seconds=10))).total_seconds()) < 1e-3
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_expiry_is_indexed(self, db_path):
+        backend = SQLiteTimeLockKeyBackend(db_path)
+        await backend.next_expiry()
+        plan = backend._conn.execute(
+            "EXPLAIN QUERY PLAN UPDATE timelock_keys SET wrapped_key = NULL "
+            "WHERE wrapped_key IS NOT NULL AND expires_at < 0"
+        ).fetchall()
+
+        assert any("idx_timelock_keys_live_expiry" in row[-1] for row in plan)
+        await backend.close()
+
+
+class TestPersistentTimeLockEngine:
+    """AsyncTimeLockEngine with a backend should survive a restart."""
+
+    @pytest.mark.asyncio
+    async def test_lock_survives_restart_and_loads_lazily(self, db_path):
+        engine = await _open_engine(db_path)
+        encrypted = await engine.encrypt("board minutes", ttl_seconds=60)
+        lock_id = encrypted.metadata.lock_id
+        await _close_engine(engine)
+
+        restarted = await _open_engine(db_path)
+        assert restarted._metadata_store == {}  # nothing read at startup
+        assert await restarted.decrypt(encrypted) == "board minutes"
+        assert restarted.get_status(lock_id) == TimeLockStatus.ACTIVE
+        assert 0 < restarted.get_remaining_time(lock_id) <= 60
+        await _close_engine(restarted)
+
+    @pytest.mark.asyncio
+    async def test_load_before_sync_status(self, db_path):
+        engine = await _open_engine(db_path)
+        lock_id = (await engine.encrypt("x", ttl_seconds=60)).metadata.lock_id
+        await _close_engine(engine)
+
+        restarted = await _open_engine(db_path)
+        assert restarted.get_status(lock_id) == TimeLockStatus.DESTROYED
+        assert await restarted.load(lock_id)
+        assert restarted.get_status(lock_id) == TimeLockStatus.ACTIVE
+        assert not await restarted.load("unknown")
+        await _close_engine(restarted)
+
+    @pytest.mark.asyncio
+    async def test_destroy_and_extend_persist(self, db_path):
+        engine = await _open_engine(db_path)
+        destroyed = await engine.encrypt("gone", ttl_seconds=60)
+        extended = await engine.encrypt("longer", ttl_seconds=60)
+        assert await engine.destroy_async(destroyed.metadata.lock_id)
+        assert await engine.extend_ttl_async(extended.metadata.lock_id, 600)
+        await _close_engine(engine)
+
+        restarted = await _open_engine(db_path)
+        assert await restarted.decrypt(destroyed) is None
+        assert restarted.get_status(destroyed.metadata.lock_id) == TimeLockStatus.DESTROYED
+        assert await restarted.decrypt(extended) == "longer"
+        assert restarted.get_remaining_time(extended.metadata.lock_id) > 600
+        await _close_engine(restarted)
+
+    @pytest.mark.asyncio
+    async def test_destroy_lock_not_yet_loaded(self, db_path):
+        engine = await _open_engine(db_path)
+        encrypted = await engine.encrypt("revoke me", ttl_seconds=60)
+        await _close_engine(engine)
+
+        restarted = await _open_engine(db_path)
+        destroyed = []
+        restarted.add_destroy_listener(destroyed.append)
+        assert await restarted.destroy_async(encrypted.metadata.lock_id)
+        assert destroyed == [encrypted.metadata.lock_id]
+        assert (await restarted.backend.get(encrypted.metadata.lock_id)).wrapped_key is None
+        await _close_engine(restarted)
+
+    @pytest.mark.asyncio
+    async def test_expired_rows_purged(self, db_path):
+        engine = await _open_engine(db_path, purge_interval=30)
+        short = await engine.encrypt("short", ttl_seconds=0.05)
+        kept = await engine.encrypt("kept", ttl_seconds=60)
+
+        deadline = asyncio.get_running_loop().time() + 2
+        while (await engine.backend.get(short.metadata.lock_id)).wrapped_key is not None:
+            assert asyncio.get_running_loop().time() < deadline
+            await asyncio.sleep(0.02)
+
+        assert (await engine.backend.get(kept.metadata.lock_id)).wrapped_key is not None
+        await _close_engine(engine)
+
+    @pytest.mark.asyncio
+    async def test_purged_lock_reports_expired_after_restart(self, db_path):
+        engine = await _open_engine(db_path)
+        encrypted = await engine.encrypt("short", ttl_seconds=0.05)
+        lock_id = encrypted.metadata.lock_id
+        await _close_engine(engine)
+        await asyncio.sleep(0.1)
+
+        restarted = await _open_engine(db_path)  # purges the expired key at open
+        assert (await restarted.backend.get(lock_id)).status == "EXPIRED"
+        assert await restarted.load(lock_id)
+        assert restarted.get_status(lock_id) == TimeLockStatus.EXPIRED
+        assert await restarted.decrypt(encrypted) is None
+        await _close_engine(restarted)
+
+    @pytest.mark.asyncio
+    async def test_destroyed_lock_reports_destroyed_after_restart(self, db_path):
+        engine = await _open_engine(db_path)
+        lock_id = (await engine.encrypt("x", ttl_seconds=60)).metadata.lock_id
+        await engine.destroy_async(lock_id)
+        await _close_engine(engine)
+
+        restarted = await _open_engine(db_path)
+        assert await restarted.load(lock_id)
+        assert restarted.get_status(lock_id) == TimeLockStatus.DESTROYED
+        await _close_engine(restarted)
+
+    @pytest.mark.asyncio
+    async def test_failed_extend_rolls_back(self, db_path):
+        engine = await _open_engine(db_path)
+        encrypted = await engine.encrypt("x", ttl_seconds=60)
+        lock_id = encrypted.metadata.lock_id
+        expiry = engine.key_store.get_expiry(lock_id)
+        expires_at = engine._metadata_store[lock_id].expires_at
+
+        async def broken_update(*args):
+            raise OSError("disk full")
+
+        engine.backend.update_expiry = broken_update
+        with pytest.raises(OSError):
+            await engine.extend_ttl_async(lock_id, 600)
+
+        assert engine.key_store.get_expiry(lock_id) == expiry
+        assert engine._metadata_store[lock_id].expires_at == expires_at
+        assert engine._metadata_store[lock_id].ttl_seconds == 60
+        assert engine.get_remaining_time(lock_id) <= 60
+        await _close_engine(engine)
+
+    @pytest.mark.asyncio
+    async def test_sync_mutators_refuse_with_backend(self, db_path):
+        engine = await _open_engine(db_path)
+        lock_id = (await engine.encrypt("x", ttl_seconds=60)).metadata.lock_id
+
+        with pytest.raises(RuntimeError):
+            engine.destroy(lock_id)
+        with pytest.raises(RuntimeError):
+            engine.extend_ttl(lock_id, 60)
+        assert engine.get_status(lock_id) == TimeLockStatus.ACTIVE
+        await _close_engine(engine)
+
+    @pytest.mark.asyncio
+    async def test_expired_unpurged_row_loads_as_expired(self, db_path):
+        backend = SQLiteTimeLockKeyBackend(db_path)
+        expires = _now() - timedelta(seconds=1)
+        await backend.put("stale", wrap_key(MASTER_KEY, "stale", b"k" * 32), expires, {
+            "lock_id": "stale", "content_hash": "h", "created_at": expires.isoformat(),
+            "expires_at": expires.isoformat(), "ttl_seconds": 1, "status": "ACTIVE",
+        })
+        await backend.close()
+
+        engine = AsyncTimeLockEngine()
+        engine.backend, engine._master_key = SQLiteTimeLockKeyBackend(db_path), MASTER_KEY
+        assert await engine.load("stale")
+        assert engine.get_status("stale") == TimeLockStatus.EXPIRED
+        assert engine.key_store.get_key("stale") is None
+        await _close_engine(engine)
+
+    @pytest.mark.asyncio
+    async def test_failed_write_does_not_hand_out_lock(self, db_path):
+        engine = await _open_engine(db_path)
+
+        async def broken_put(*args):
+            raise OSError("disk full")
+
+        engine.backend.put = broken_put
+        with pytest.raises(OSError):
+            await engine.encrypt("lost", ttl_seconds=60)
+
+        assert engine._metadata_store == {}
+        assert engine.key_store._keys == {}
+        await _close_engine(engine)
+
+    @pytest.mark.asyncio
+    async def test_wrong_master_key_fails_loudly(self, db_path):
+        engine = await _open_engine(db_path)
+        encrypted = await engine.encrypt("secret", ttl_seconds=60)
+        await _close_engine(engine)
+
+        restarted = await _open_engine(db_path, master_key=b"w" * 32)
+        with pytest.raises(ValueError):
+            await restarted.decrypt(encrypted)
+        await _close_engine(restarted)
+
+    @pytest.mark.asyncio
+    async def test_invalid_parameters(self, db_path):
+        engine = AsyncTimeLockEngine()
+        with pytest.raises(ValueError):
+            await engine.open(SQLiteTimeLockKeyBackend(db_path), b"short")
+        with pytest.raises(ValueError):
+            await engine.open(SQLiteTimeLockKeyBackend(db_path), MASTER_KEY, purge_interval=0)
+        engine.shutdown()
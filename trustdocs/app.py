@@ -15,6 +15,7 @@ from pathlib import Path
 
 from trustdocs.config import config
 from trustdocs import database as db
+from trustdocs.trustflow_service import trustflow
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s | %(name)s | %(message)s")
 logger = logging.getLogger(__name__)
@@ -26,8 +27,12 @@ async def lifespan(app: FastAPI):
     # Try to connect to PostgreSQL, fall back to in-memory
     await db.init_db(config.db_dsn)
     Path(config.storage_dir).mkdir(parents=True, exist_ok=True)
+    await trustflow.open_timelock_store()
     logger.info(f"TrustDocs started on Node {config.node_id}")
     yield
+    await trustflow.audit_sink.close()
+    await trustflow.timelock_engine.close()
+    await trustflow.timelock_scheduler.close()
     await db.close_db()
     logger.info("TrustDocs shut down")
 
@@ -0,0 +1,172 @@
+"""Asynchronous audit sink for TrustDocs.
+
+Route handlers hand audit events to an ``AuditSink`` instead of calling
+``AuditLog.log_event`` inline. A single writer task drains the bounded
+queue in batches and runs each batch on a dedicated thread, where the
+entries are hashed, appended with one write and group-committed through
+``AuditLog.log_events``. The event loop never does the file I/O or SHA-256.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import List, Optional, Tuple
+
+from coc_framework.core.audit_log import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class Durability(Enum):
+    """When ``AuditSink.log_event`` returns."""
+
+    FIRE_AND_FORGET = "fire_and_forget"  # once the event is queued
+    COMMIT = "commit"  # once the event is written and fsynced
+
+
+class Backpressure(Enum):
+    """What a fire-and-forget ``log_event`` does when the queue is full."""
+
+    BLOCK = "block"  # wait for the writer to make room
+    DROP = "drop"  # discard the event, counting it in ``dropped``
+    RAISE = "raise"  # raise AuditQueueFull
+
+
+class AuditQueueFull(Exception):
+    """Raised when the audit queue is full under ``Backpressure.RAISE``."""
+
+
+_QueuedEvent = Tuple[str, str, str, str, Optional[asyncio.Future]]
+
+
+class AuditSink:
+    """Bounded queue in front of an ``AuditLog``, drained by a background writer.
+
+    The writer task starts on the running loop at the first ``log_event``.
+    ``Durability.COMMIT`` events always wait for queue space, whatever the
+    backpressure policy, and resolve to their entry hash; a batch holding
+    one is fsynced before its waiters are released.
+    """
+
+    def __init__(
+        self,
+        audit_log: AuditLog,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        durability: Durability = Durability.FIRE_AND_FORGET,
+        backpressure: Backpressure = Backpressure.BLOCK,
+    ):
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.audit_log = audit_log
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.durability = durability
+        self.backpressure = backpressure
+        self.dropped = 0
+        # One thread keeps batches in queue order.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-writer")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _ensure_writer(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or the app is now running on a different loop.
+            self._loop = loop
+            self._queue = asyncio.Queue(self.max_queue)
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def log_event(
+        self,
+        event_type: str,
+        actor: str,
+        target: str,
+        details: str = "",
+        durability: Optional[Durability] = None,
+    ) -> Optional[str]:
+        """Queue an audit event.
+
+        Returns the entry hash once committed under ``Durability.COMMIT``,
+        otherwise None as soon as the event is queued (or dropped).
+        """
+        queue = self._ensure_writer()
+        if (durability or self.durability) is Durability.COMMIT:
+            future = self._loop.create_future()
+            await queue.put((event_type, actor, target, details, future))
+            return await future
+
+        event = (event_type, actor, target, details, None)
+        if self.backpressure is Backpressure.BLOCK:
+            await queue.put(event)
+            return None
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            if self.backpressure is Backpressure.RAISE:
+                raise AuditQueueFull(f"Audit queue full ({self.max_queue} events)")
+            self.dropped += 1
+            logger.warning(f"Audit queue full, dropped {event_type} event (total dropped: {self.dropped})")
+        return None
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write(self, batch: List[_QueuedEvent]) -> None:
+        events = [item[:4] for item in batch]
+        waiters = [item[4] for item in batch]
+        durable = any(waiter is not None for waiter in waiters)
+        try:
+            hashes = await self._loop.run_in_executor(self._executor, self._append, events, durable)
+        except Exception as e:
+            logger.error(f"Audit writer failed on a batch of {len(batch)} events: {e}")
+            for waiter in waiters:
+                if waiter is not None and not waiter.done():
+                    waiter.set_exception(e)
+            return
+        for waiter, entry_hash in zip(waiters, hashes):
+            if waiter is not None and not waiter.done():
+                waiter.set_result(entry_hash)
+
+    def _append(self, events: List[Tuple[str, str, str, str]], durable: bool) -> List[str]:
+        hashes = self.audit_log.log_events(events)
+        if durable:
+            self.audit_log.flush()
+        return hashes
+
+    async def flush(self) -> None:
+        """Wait until every queued event is written, then fsync the log."""
+        loop = asyncio.get_running_loop()
+        if self._queue is not None and self._loop is loop:
+            await self._queue.join()
+        await loop.run_in_executor(self._executor, self.audit_log.flush)
+
+    async def close(self) -> None:
+        """Drain the queue and stop the writer; a later ``log_event`` restarts it."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,121 @@
+"""In-memory cache of reconstructed boardroom proposal plaintext.
+
+Unlocking a proposal means loading its share rows, authenticating and
+combining the shares and undoing the time-lock. The result is identical for
+every member, so ``UnlockCache`` keeps it per proposal and only the per-reader
+watermark remains on the hot path. Nothing is persisted.
+
+Entries are bounded three ways: by a TTL (the time-lock's remaining lifetime,
+or a default for proposals without one), by total size with LRU eviction,
+and by explicit invalidation when the time-lock is destroyed.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+
+class _Entry(NamedTuple):
+    plaintext: str
+    lock_id: Optional[str]
+    deadline: float  # time.monotonic()
+    size: int
+
+
+class UnlockCache:
+    """LRU map of proposal_id -> plaintext, bounded by ``max_bytes`` and per-entry TTL.
+
+    Thread-safe: ``invalidate_lock`` is registered as a ``TimeLockEngine``
+    destroy listener and may be called from any thread.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, default_ttl: float = 300.0):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._by_lock: Dict[str, str] = {}  # lock_id -> proposal_id
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, proposal_id: str) -> bool:
+        return self.get(proposal_id) is not None
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def get(self, proposal_id: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(proposal_id)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry.deadline:
+                self._remove(proposal_id)
+                return None
+            self._entries.move_to_end(proposal_id)
+            return entry.plaintext
+
+    def put(
+        self,
+        proposal_id: str,
+        plaintext: str,
+        ttl: Optional[float] = None,
+        lock_id: Optional[str] = None,
+    ) -> bool:
+        """Cache ``plaintext`` for ``ttl`` seconds (``default_ttl`` if None).
+
+        Returns False, caching nothing, when the TTL has already run out or
+        the entry alone exceeds ``max_bytes``.
+        """
+        if ttl is None:
+            ttl = self.default_ttl
+        size = sys.getsizeof(plaintext)
+        if ttl <= 0 or size > self.max_bytes:
+            return False
+        with self._lock:
+            self._remove(proposal_id)
+            self._entries[proposal_id] = _Entry(plaintext, lock_id, time.monotonic() + ttl, size)
+            if lock_id is not None:
+                self._by_lock[lock_id] = proposal_id
+            self._size += size
+            self._evict()
+        return True
+
+    def invalidate(self, proposal_id: str) -> bool:
+        with self._lock:
+            return self._remove(proposal_id)
+
+    def invalidate_lock(self, lock_id: str) -> bool:
+        """Drop the entry decrypted under ``lock_id``, if any."""
+        with self._lock:
+            proposal_id = self._by_lock.get(lock_id)
+            return proposal_id is not None and self._remove(proposal_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_lock.clear()
+            self._size = 0
+
+    def _remove(self, proposal_id: str) -> bool:
+        entry = self._entries.pop(proposal_id, None)
+        if entry is None:
+            return False
+        if entry.lock_id is not None:
+            self._by_lock.pop(entry.lock_id, None)
+        self._size -= entry.size
+        return True
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for proposal_id in [p for p, e in self._entries.items() if now >= e.deadline]:
+            self._remove(proposal_id)
+        while self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
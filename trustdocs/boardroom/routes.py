@@ -9,6 +9,9 @@ Features:
   - Steganographic watermarking on unlock (per-reader leak attribution)
 """
 
+import asyncio
+import io
+import json
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional
@@ -18,8 +21,18 @@ from pydantic import BaseModel, Field
 
 from trustdocs import database as db
 from trustdocs.auth.dependencies import get_current_user
-from coc_framework.core.secret_sharing import split_secret, reconstruct_secret, Share
+from coc_framework.core.secret_sharing import (
+    HYBRID_THRESHOLD_BYTES,
+    Share,
+    ShareIntegrityError,
+    reconstruct_secret,
+    split_secret,
+    split_stream,
+)
 from coc_framework.core.timelock import EncryptedContent, TimeLockStatus
+from trustdocs.audit_sink import Durability
+from trustdocs.boardroom.cache import UnlockCache
+from trustdocs.config import config
 from trustdocs.trustflow_service import trustflow
 
 logger = logging.getLogger(__name__)
@@ -46,6 +59,27 @@ class ProposalRequest(BaseModel):
     )
 
 
+# Reconstructed proposal plaintext, shared by every member's unlock. The
+# cache drops a proposal as soon as its time-lock is destroyed.
+unlock_cache = UnlockCache(
+    max_bytes=config.unlock_cache_max_bytes,
+    default_ttl=config.unlock_cache_ttl_seconds,
+)
+trustflow.timelock_engine.add_destroy_listener(unlock_cache.invalidate_lock)
+
+
+def _load_share(record: dict) -> Share:
+    """Parse a shamir_shares row: compact binary, or JSONB for older rows."""
+    blob = record.get("share_blob")
+    if blob is not None:
+        return Share.from_bytes(bytes(blob))
+    raw = record["share_data"]
+    # asyncpg may return JSONB as a JSON string rather than a dict
+    if isinstance(raw, str):
+        raw = json.loads(raw)
+    return Share.from_dict(raw)
+
+
 # ── Routes ───────────────────────────────────────────────────────────────────
 
 
@@ -95,7 +129,7 @@ async def create_boardroom(
                 },
             )
 
-        trustflow.audit_log.log_event(
+        await trustflow.audit_sink.log_event(
             "BOARDROOM_CREATED",
             user["peer_id"],
             f"Boardroom ID: {boardroom['id']} Threshold: {req.threshold_m}",
@@ -168,14 +202,12 @@ async def create_proposal(
 
         if req.ttl_seconds is not None:
             try:
-                encrypted = trustflow.timelock_engine.encrypt(
+                encrypted = await trustflow.timelock_engine.encrypt(
                     req.content, req.ttl_seconds
                 )
                 lock_id = encrypted.metadata.lock_id
                 expires_at = datetime.fromisoformat(encrypted.metadata.expires_at)
                 # Split the serialized encrypted payload instead of raw content
-                import json
-
                 content_to_split = json.dumps(encrypted.to_dict())
                 logger.info(
                     f"Time-lock applied: lock_id={lock_id}, ttl={req.ttl_seconds}s"
@@ -185,13 +217,25 @@ async def create_proposal(
                 raise HTTPException(500, "Failed to apply time-lock encryption")
 
         # ── Shamir split ─────────────────────────────────────────────────
-        shares, _ = split_secret(content_to_split, threshold, num_shares)
+        content_bytes = content_to_split.encode("utf-8")
+        if len(content_bytes) > HYBRID_THRESHOLD_BYTES:
+            # Store the ciphertext once instead of in every share row.
+            shares, mac_key = await asyncio.to_thread(
+                split_stream,
+                io.BytesIO(content_bytes),
+                threshold,
+                num_shares,
+                trustflow.ciphertext_store,
+            )
+        else:
+            shares, mac_key = split_secret(content_to_split, threshold, num_shares)
 
         proposal_data = {
             "boardroom_id": boardroom_id,
             "initiator_id": user["id"],
             "title": req.title,
             "status": "pending",
+            "share_mac_key": mac_key,
         }
         if lock_id:
             proposal_data["lock_id"] = lock_id
@@ -207,12 +251,12 @@ async def create_proposal(
                 {
                     "proposal_id": proposal["id"],
                     "user_id": member["user_id"],
-                    "share_data": share.to_dict(),
+                    "share_blob": share.to_bytes(),
                     "submitted": False,
                 },
             )
 
-        trustflow.audit_log.log_event(
+        await trustflow.audit_sink.log_event(
             "PROPOSAL_INITIATED",
             user["peer_id"],
             f"Proposal ID: {proposal['id']}"
@@ -257,6 +301,7 @@ async def list_proposals(boardroom_id: str, user: dict = Depends(get_current_use
             user_submitted = user_share["submitted"] if user_share else False
 
             initiator = await db.find_one("users", id=p["initiator_id"])
+            p.pop("share_mac_key", None)  # never sent to clients
             p["initiator_username"] = initiator["username"] if initiator else "unknown"
             p["approvals"] = submitted_count
             p["user_has_approved"] = user_submitted
@@ -272,6 +317,7 @@ async def list_proposals(boardroom_id: str, user: dict = Depends(get_current_use
                     exp = p["expires_at"]
                     if isinstance(exp, datetime):
                         p["expires_at"] = exp.isoformat()
+                    await trustflow.timelock_engine.load(p["lock_id"])
                     remaining = trustflow.timelock_engine.get_remaining_time(
                         p["lock_id"]
                     )
@@ -308,7 +354,7 @@ async def approve_proposal(proposal_id: str, user: dict = Depends(get_current_us
 
         await db.update_one("shamir_shares", share_record["id"], submitted=True)
 
-        trustflow.audit_log.log_event(
+        await trustflow.audit_sink.log_event(
             "SHARE_SUBMITTED", user["peer_id"], f"Proposal ID: {proposal_id}"
         )
 
@@ -327,7 +373,7 @@ async def approve_proposal(proposal_id: str, user: dict = Depends(get_current_us
         response_msg = "Cryptographic share yielded to pool."
         if len(submitted_shares) >= threshold and proposal["status"] != "executed":
             await db.update_one("boardroom_proposals", proposal_id, status="executed")
-            trustflow.audit_log.log_event(
+            await trustflow.audit_sink.log_event(
                 "PROPOSAL_EXECUTED",
                 user["peer_id"],
                 f"Threshold {threshold} met for Proposal {proposal_id}",
@@ -346,13 +392,57 @@ async def approve_proposal(proposal_id: str, user: dict = Depends(get_current_us
         raise HTTPException(status_code=500, detail="Internal error approving proposal")
 
 
+async def _reconstruct_proposal(proposal: dict, share_records: List[dict]) -> str:
+    """Authenticate and combine share rows, then undo the time-lock if any."""
+    mac_key = proposal.get("share_mac_key")
+    try:
+        share_objects = [_load_share(record) for record in share_records]
+        plaintext = await asyncio.to_thread(
+            reconstruct_secret,
+            share_objects,
+            bytes(mac_key) if mac_key else None,
+            trustflow.ciphertext_store,
+        )
+        if not plaintext:
+            raise HTTPException(
+                500, "Cryptographic reconstruction failed. Invalid shares."
+            )
+    except HTTPException:
+        raise
+    except ShareIntegrityError as e:
+        logger.error(f"Share authentication failed for proposal {proposal['id']}: {e}")
+        raise HTTPException(500, "Cryptographic reconstruction failed. Invalid shares.")
+    except Exception as e:
+        logger.error(f"Shamir reconstruction error: {e}")
+        raise HTTPException(500, "Cryptographic reconstruction failed.")
+
+    # ── Time-lock decryption (if applicable) ─────────────────────────────
+    if proposal.get("lock_id"):
+        try:
+            encrypted = EncryptedContent.from_dict(json.loads(plaintext))
+            decrypted = await trustflow.timelock_engine.decrypt(encrypted)
+            if decrypted is None:
+                raise HTTPException(
+                    403, "Content expired. The auto-destruct timer has elapsed."
+                )
+            plaintext = decrypted
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Time-lock decryption error: {e}")
+            raise HTTPException(500, "Failed to decrypt time-locked content.")
+
+    return plaintext
+
+
 @router.get("/proposals/{proposal_id}/unlock")
 async def unlock_proposal(proposal_id: str, user: dict = Depends(get_current_user)):
     """Reconstruct and read the execution document.
 
     If the proposal has a time-lock, the lock must still be active.
     The returned content is steganographically watermarked with the
-    requesting user's peer_id for leak attribution.
+    requesting user's peer_id for leak attribution. The plaintext is
+    reconstructed once and served from ``unlock_cache`` afterwards.
     """
     try:
         proposal = await db.find_one("boardroom_proposals", id=proposal_id)
@@ -369,41 +459,10 @@ async def unlock_proposal(proposal_id: str, user: dict = Depends(get_current_use
         if not membership:
             raise HTTPException(403, "Access denied")
 
-        all_shares = await db.find_many("shamir_shares", proposal_id=proposal_id)
-        submitted_shares = [s for s in all_shares if s["submitted"]]
-
-        if len(submitted_shares) < boardroom["threshold_m"]:
-            raise HTTPException(
-                403,
-                f"Threshold not met. {len(submitted_shares)}/{boardroom['threshold_m']} approvals.",
-            )
-
-        # ── Reconstruct from shares ──────────────────────────────────────
-        share_objects = []
-        for record in submitted_shares[: boardroom["threshold_m"]]:
-            raw = record["share_data"]
-            # asyncpg may return JSONB as a JSON string rather than a dict
-            if isinstance(raw, str):
-                import json as _json
-
-                raw = _json.loads(raw)
-            share_objects.append(Share.from_dict(raw))
-
-        try:
-            plaintext = reconstruct_secret(share_objects, hmac_key=None)
-            if not plaintext:
-                raise HTTPException(
-                    500, "Cryptographic reconstruction failed. Invalid shares."
-                )
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Shamir reconstruction error: {e}")
-            raise HTTPException(500, "Cryptographic reconstruction failed.")
-
-        # ── Time-lock decryption (if applicable) ─────────────────────────
-        if proposal.get("lock_id"):
-            lock_id = proposal["lock_id"]
+        # ── Time-lock status ─────────────────────────────────────────────
+        lock_id = proposal.get("lock_id")
+        if lock_id:
+            await trustflow.timelock_engine.load(lock_id)  # locks from before a restart
             status = trustflow.timelock_engine.get_status(lock_id)
 
             if status == TimeLockStatus.EXPIRED:
@@ -415,21 +474,25 @@ async def unlock_proposal(proposal_id: str, user: dict = Depends(get_current_use
                     403, "Content destroyed. The time-lock was manually revoked."
                 )
 
-            try:
-                import json
+        # ── Reconstruct (cached per proposal) ────────────────────────────
+        # A cached entry implies the threshold was met; approvals are final.
+        plaintext = unlock_cache.get(proposal_id)
+        if plaintext is None:
+            all_shares = await db.find_many("shamir_shares", proposal_id=proposal_id)
+            submitted_shares = [s for s in all_shares if s["submitted"]]
 
-                encrypted = EncryptedContent.from_dict(json.loads(plaintext))
-                decrypted = trustflow.timelock_engine.decrypt(encrypted)
-                if decrypted is None:
-                    raise HTTPException(
-                        403, "Content expired. The auto-destruct timer has elapsed."
-                    )
-                plaintext = decrypted
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Time-lock decryption error: {e}")
-                raise HTTPException(500, "Failed to decrypt time-locked content.")
+            if len(submitted_shares) < boardroom["threshold_m"]:
+                raise HTTPException(
+                    403,
+                    f"Threshold not met. {len(submitted_shares)}/{boardroom['threshold_m']} approvals.",
+                )
+
+            plaintext = await _reconstruct_proposal(
+                proposal, submitted_shares[: boardroom["threshold_m"]]
+            )
+            ttl = trustflow.timelock_engine.get_remaining_time(lock_id) if lock_id else None
+            if not lock_id or ttl is not None:
+                unlock_cache.put(proposal_id, plaintext, ttl=ttl, lock_id=lock_id)
 
         # ── Steganographic watermarking ───────────────────────────────────
         # Embed an invisible watermark unique to this reader's peer_id.
@@ -440,18 +503,20 @@ async def unlock_proposal(proposal_id: str, user: dict = Depends(get_current_use
                 peer_id=user["peer_id"],
                 depth=0,
             )
-            trustflow.audit_log.log_event(
+            await trustflow.audit_sink.log_event(
                 "PROPOSAL_UNLOCKED",
                 user["peer_id"],
                 f"Proposal {proposal_id} | Watermarked copy issued",
+                durability=Durability.COMMIT,
             )
         except Exception as e:
             logger.warning(f"Watermarking failed (returning unwatermarked): {e}")
             watermarked = plaintext
-            trustflow.audit_log.log_event(
+            await trustflow.audit_sink.log_event(
                 "PROPOSAL_UNLOCKED",
                 user["peer_id"],
                 f"Proposal {proposal_id} | Watermarking failed",
+                durability=Durability.COMMIT,
             )
 
         result = {
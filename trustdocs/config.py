@@ -47,5 +47,24 @@ class Config:
     secret_sharing_threshold: int = 2
     tombstone_grace_seconds: int = 300  # 5 minutes
 
+    # ── Time-lock key store ───────────────────────────────────────────────
+    # 64 hex chars; if unset, a key file is created under storage_dir.
+    timelock_master_key: str = field(default_factory=lambda: os.getenv("TRUSTDOCS_TIMELOCK_MASTER_KEY", ""))
+    timelock_purge_interval_seconds: float = 60.0
+
+    # ── Boardroom unlock cache ────────────────────────────────────────────
+    unlock_cache_max_bytes: int = field(
+        default_factory=lambda: int(os.getenv("TRUSTDOCS_UNLOCK_CACHE_MB", "64")) * 1024 * 1024
+    )
+    unlock_cache_ttl_seconds: float = 300.0  # proposals without a time-lock
+
+    # ── Audit sink ────────────────────────────────────────────────────────
+    audit_queue_size: int = field(default_factory=lambda: int(os.getenv("TRUSTDOCS_AUDIT_QUEUE_SIZE", "10000")))
+    audit_batch_size: int = 256
+    # "fire_and_forget" or "commit"
+    audit_durability: str = field(default_factory=lambda: os.getenv("TRUSTDOCS_AUDIT_DURABILITY", "fire_and_forget"))
+    # "block", "drop" or "raise"
+    audit_backpressure: str = field(default_factory=lambda: os.getenv("TRUSTDOCS_AUDIT_BACKPRESSURE", "block"))
+
 
 config = Config()
@@ -215,6 +215,18 @@ async def _create_tables():
     CREATE INDEX IF NOT EXISTS idx_coc_content_hash ON coc_nodes(content_hash);
     CREATE INDEX IF NOT EXISTS idx_tombstones_expiry ON tombstones(delete_after);
 
+    -- wrapped_key is NULL once expired or destroyed; the row stays as a tombstone
+    CREATE TABLE IF NOT EXISTS timelock_keys (
+        lock_id TEXT PRIMARY KEY,
+        wrapped_key BYTEA,
+        expires_at TIMESTAMPTZ NOT NULL,
+        metadata JSONB NOT NULL,
+        status TEXT NOT NULL DEFAULT 'ACTIVE'
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_timelock_keys_live_expiry
+        ON timelock_keys(expires_at) WHERE wrapped_key IS NOT NULL;
+
     CREATE TABLE IF NOT EXISTS boardrooms (
         id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
         name TEXT NOT NULL,
@@ -236,6 +248,7 @@ async def _create_tables():
         status TEXT NOT NULL DEFAULT 'pending',
         lock_id TEXT,
         expires_at TIMESTAMPTZ,
+        share_mac_key BYTEA,
         created_at TIMESTAMPTZ NOT NULL DEFAULT now()
     );
 
@@ -243,7 +256,8 @@ async def _create_tables():
         id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
         proposal_id UUID REFERENCES boardroom_proposals(id) ON DELETE CASCADE,
         user_id UUID REFERENCES users(id) ON DELETE CASCADE,
-        share_data JSONB NOT NULL,
+        share_data JSONB,
+        share_blob BYTEA,
         submitted BOOLEAN NOT NULL DEFAULT false,
         created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
         UNIQUE (proposal_id, user_id)
@@ -266,6 +280,22 @@ async def _create_tables():
             except Exception:
                 pass  # Column already exists or IF NOT EXISTS not supported
 
+        # Shares are now stored in compact binary form (share_blob); share_data
+        # is kept, nullable, for rows written before that.
+        for stmt in [
+            "ALTER TABLE boardroom_proposals ADD COLUMN IF NOT EXISTS share_mac_key BYTEA",
+            "ALTER TABLE shamir_shares ADD COLUMN IF NOT EXISTS share_blob BYTEA",
+            "ALTER TABLE shamir_shares ALTER COLUMN share_data DROP NOT NULL",
+            # Time-lock keys became tombstones instead of being deleted.
+            "ALTER TABLE timelock_keys ADD COLUMN IF NOT EXISTS status TEXT NOT NULL DEFAULT 'ACTIVE'",
+            "ALTER TABLE timelock_keys ALTER COLUMN wrapped_key DROP NOT NULL",
+            "DROP INDEX IF EXISTS idx_timelock_keys_expires_at",
+        ]:
+            try:
+                await conn.execute(stmt)
+            except Exception:
+                pass
+
     logger.info("Database schema created")
 
 
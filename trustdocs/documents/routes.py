@@ -258,7 +258,7 @@ async def download_document(doc_id: str, user: dict = Depends(get_current_user))
             raise HTTPException(403, "Access denied")
 
     # Audit trail
-    trustflow.audit_log.log_event("ACCESS", user["peer_id"], doc["coc_node_hash"])
+    await trustflow.audit_sink.log_event("ACCESS", user["peer_id"], doc["coc_node_hash"])
 
     return FileResponse(
         path=doc["storage_path"],
@@ -426,7 +426,7 @@ async def revoke_share(
         revoked_at=datetime.now(timezone.utc),
     )
 
-    trustflow.audit_log.log_event(
+    await trustflow.audit_sink.log_event(
         "REVOKE_SHARE", user["peer_id"], share["child_coc_node_hash"]
     )
 
@@ -6,6 +6,7 @@ for direct async method calls from FastAPI route handlers.
 """
 
 import logging
+import os
 from collections import deque
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Set, Tuple
@@ -13,10 +14,14 @@ from typing import Dict, List, Optional, Set, Tuple
 from coc_framework.core.coc_node import CoCNode
 from coc_framework.core.crypto_core import CryptoCore
 from coc_framework.core.audit_log import AuditLog
+from coc_framework.core.secret_sharing import CiphertextStore
 from coc_framework.core.steganography import SteganoEngine
-from coc_framework.core.timelock import TimeLockEngine
-from coc_framework.interfaces.postgres_backend import PostgresStorageBackend
+from coc_framework.core.timelock import AsyncExpiryScheduler, AsyncTimeLockEngine
+from coc_framework.interfaces.postgres_backend import PostgresStorageBackend, PostgresTimeLockKeyBackend
+from coc_framework.interfaces.timelock_store import SQLiteTimeLockKeyBackend, load_or_create_master_key
 from trustdocs import database as db
+from trustdocs.audit_sink import AuditSink, Backpressure, Durability
+from trustdocs.config import config
 
 logger = logging.getLogger(__name__)
 
@@ -27,20 +32,47 @@ class TrustFlowService:
     Wraps all TrustFlow operations that TrustDocs needs:
     - CoC operations (create root, forward, delete)
     - Steganographic watermarking
-    - Audit log access
+    - Audit log access (writes go through the async ``audit_sink``)
+    - Content-addressed ciphertext storage for streamed Shamir shares
+    - Time-lock encryption with keys persisted across restarts
     """
 
     def __init__(self):
         self.audit_log = AuditLog()
+        self.audit_sink = AuditSink(
+            self.audit_log,
+            max_queue=config.audit_queue_size,
+            batch_size=config.audit_batch_size,
+            durability=Durability(config.audit_durability),
+            backpressure=Backpressure(config.audit_backpressure),
+        )
         self.stegano_engine = SteganoEngine()
-        self.timelock_engine = TimeLockEngine(cleanup_interval=5.0)
+        # Expiry runs as one task on the app's event loop, not a daemon thread.
+        self.timelock_scheduler = AsyncExpiryScheduler()
+        self.timelock_engine = AsyncTimeLockEngine(self.timelock_scheduler)
         self.storage = PostgresStorageBackend()
+        self.ciphertext_store = CiphertextStore(os.path.join(config.storage_dir, "ciphertexts"))
 
         # System key used to sign CoC nodes since user keys are password-encrypted
         self.system_signing_key, self.system_verify_key = CryptoCore.generate_keypair()
 
         logger.info("TrustFlowService initialized (Stateless Postgres Mode)")
 
+    async def open_timelock_store(self) -> None:
+        """Persist time-lock keys: in PostgreSQL when connected, else a local SQLite file."""
+        if config.timelock_master_key:
+            master_key = bytes.fromhex(config.timelock_master_key)
+        else:
+            master_key = load_or_create_master_key(os.path.join(config.storage_dir, "timelock_master.key"))
+        if db._use_pg:
+            backend = PostgresTimeLockKeyBackend()
+        else:
+            backend = SQLiteTimeLockKeyBackend(os.path.join(config.storage_dir, "timelock_keys.db"))
+        purged = await self.timelock_engine.open(
+            backend, master_key, purge_interval=config.timelock_purge_interval_seconds
+        )
+        logger.info(f"Time-lock key store opened ({type(backend).__name__}, {purged} expired keys purged)")
+
     # ── Peer Management (Legacy shims) ───────────────────────────────────
 
     async def get_peer_status(self, peer_id: str) -> bool:
@@ -70,7 +102,7 @@ class TrustFlowService:
         )
 
         await self.storage.add_node(node)
-        self.audit_log.log_event("UPLOAD", owner_peer_id, node.node_hash)
+        await self.audit_sink.log_event("UPLOAD", owner_peer_id, node.node_hash)
         return node
 
     async def share_document(
@@ -98,20 +130,13 @@ class TrustFlowService:
             depth=parent_node.depth + 1,
         )
 
-        # Write to PostgreSQL
-        await self.storage.add_node(child_node)
-
-        # Update parent recipients in DB if necessary
-        for pid in recipient_peer_ids:
-            try:
-                await db.insert(
-                    "coc_recipients",
-                    {"node_hash": parent_node.node_hash, "recipient_peer_id": pid},
-                )
-            except Exception:
-                pass
+        # Child node, its recipients and the parent's new recipients in one transaction
+        await self.storage.add_nodes_bulk(
+            [child_node],
+            recipient_links=[(parent_node.node_hash, pid) for pid in recipient_peer_ids],
+        )
 
-        self.audit_log.log_event(
+        await self.audit_sink.log_event(
             "SHARE",
             owner_peer_id,
             child_node.node_hash,
@@ -119,6 +144,10 @@ class TrustFlowService:
         )
         return child_node, watermarked
 
+    async def add_nodes_bulk(self, nodes: List[CoCNode]) -> None:
+        """Persist many CoC nodes (e.g. an imported topology) in a single transaction."""
+        await self.storage.add_nodes_bulk(nodes)
+
     def detect_leak(self, content: str, candidate_peer_ids: Optional[List[str]] = None):
         """Run watermark extraction on suspected leaked content."""
         if candidate_peer_ids:
@@ -411,8 +440,10 @@ class TrustFlowService:
         max_depth: int = 16,
     ) -> dict:
         """Find path(s) between two nodes in a single document trace tree."""
-        nodes, edges = await self.get_trace_for_document(root_hash)
-        visible_nodes = {n["node_hash"] for n in nodes}
+        # Path finding only needs hashes, so skip the user/document augmentation.
+        nodes = await self.storage.get_subtree(root_hash)
+        edges = self._edges_for_nodes(nodes)
+        visible_nodes = {n.node_hash for n in nodes}
 
         if source not in visible_nodes or target not in visible_nodes:
             return {
@@ -437,35 +468,26 @@ class TrustFlowService:
     async def get_node(self, node_hash: str) -> Optional[CoCNode]:
         return await self.storage.get_node(node_hash)
 
-    async def get_trace_for_document(self, root_hash: str) -> tuple:
-        """Return a full tree trace for a document root hash, recursively fetching from DB."""
-        nodes = []
-        edges = []
-        nodes_seen = set()
+    @staticmethod
+    def _edges_for_nodes(nodes: List[CoCNode]) -> List[dict]:
+        return [
+            {"from": n.node_hash, "to": child_hash}
+            for n in nodes
+            for child_hash in n.children_hashes
+        ]
 
-        root = await self.storage.get_node(root_hash)
-        if not root:
+    async def get_trace_for_document(self, root_hash: str) -> tuple:
+        """Return a full tree trace for a document root hash in a single subtree query."""
+        nodes = await self.storage.get_subtree(root_hash)
+        if not nodes:
             return [], []
 
-        stack = [root]
-        while stack:
-            node = stack.pop()
-            if node.node_hash in nodes_seen:
-                continue
-            nodes_seen.add(node.node_hash)
-            nodes.append(node)
-            for child_hash in node.children_hashes:
-                edges.append({"from": node.node_hash, "to": child_hash})
-                child = await self.storage.get_node(child_hash)
-                if child:
-                    stack.append(child)
-
         augmented = await self._augment_nodes(nodes)
-        return augmented, edges
+        return augmented, self._edges_for_nodes(nodes)
 
     async def delete_document(self, owner_peer_id: str, node_hash: str):
         """Log the deletion event. Network propagation is handled natively by DB views."""
-        self.audit_log.log_event("DELETE", owner_peer_id, node_hash)
+        await self.audit_sink.log_event("DELETE", owner_peer_id, node_hash)
 
 
 # Singleton instance — shared across the app.